@@ -1,7 +1,21 @@
 from .paginator import *
+from .events import *
+from .lazy import *
+from .indexes import *
+from .memo import *
+from .async_paginator import *
+from .prefetch import *
+from .parallelize import *
+from .records import *
+from .registry import *
+from .stats import *
+from .threadsafe import *
+from .vectorize import *
 
 __version__ = "1.0.0"
-__all__ = paginator.__all__,
+__all__ = (paginator.__all__ + events.__all__ + lazy.__all__ + indexes.__all__ + memo.__all__ + async_paginator.__all__ +
+           prefetch.__all__ + parallelize.__all__ + records.__all__ + registry.__all__ + stats.__all__ + threadsafe.__all__ +
+           vectorize.__all__)
 
 
 def __getattr__(name):
@@ -0,0 +1,530 @@
+import asyncio
+from inspect import isawaitable
+
+__all__ = 'AsyncPaginator',
+
+
+async def _check(cond, value):
+    """
+    Checks the condition against the value, awaiting it if its an async condition.
+    """
+    result = cond(value)
+    if isawaitable(result):
+        result = await result
+    return result
+
+
+def _negate(cond):
+    """
+    Returns the negation of the given condition, which may be an async condition.
+    """
+    async def negated(value):
+        return not await _check(cond, value)
+
+    return negated
+
+
+class AsyncPaginator:
+    """
+    Class which is used for pagination of objects which are pulled lazily from an async source.
+
+    The source is either an async iterable, or an async fetch function which returns pages of objects.
+    Objects are only pulled as far as the index requires, and everything that has been pulled is kept.
+    Moving the index has to be awaited, after which the value can be read directly.
+    Pulling from the source and moving the index are locked, so the Paginator can be awaited from concurrent tasks,
+    although the step methods only lock each step, so the index can be moved by other tasks in between them.
+
+    Attributes
+    ----------
+    index : int
+        The current index of the Paginator.
+    objects : list
+        The objects which have been pulled from the source so far.
+    fetch_size : int
+        The number of objects requested from the fetch function at once.
+    """
+
+    def __init__(self, objects=None, starting_index=0, on_end_error=False, fetch=None, fetch_size=100):
+        """
+        Creates a new AsyncPaginator object with the given parameters.
+
+        The starting index is applied when the Paginator is started,
+        which happens on the first awaited call or by awaiting start.
+
+        Parameters
+        ----------
+        objects : AsyncIterable, optional
+            The objects on which the Paginator should iterate.
+        starting_index : int
+            The index where the pagination should start.
+        on_end_error : bool
+            If its True, then it raises error if the index exceeds the limits.
+            If its False, then if index exceeds the limit, it is set back to the limit.
+            If its None, then it wraps the index around the limits.
+        fetch : Callable, optional
+            An async function taking an offset and a limit and returning the objects from that offset,
+            the source is exhausted once it returns less objects than the limit.
+        fetch_size : int
+            The number of objects requested from the fetch function at once.
+        """
+        if (objects is None) == (fetch is None):
+            raise ValueError("Exactly one of objects or fetch must be given")
+        self._source = None if objects is None else objects.__aiter__()
+        self._fetch = fetch
+        self.fetch_size = fetch_size
+        self._exhausted = False
+        self._starting_index = starting_index
+        self._started = False
+        self._pull_lock = None
+        self._start_lock = None
+        self._move_lock = None
+        self.objects = []
+        self.on_end_error = on_end_error
+        self._index = 0
+
+    async def _pull(self, index):
+        """
+        Pulls objects from the source until the given index is available.
+
+        Parameters
+        ----------
+        index : int
+            The index which should be available.
+
+        Returns
+        -------
+        available : bool
+            Whether an object exists at the given index.
+        """
+        objects = self.objects
+        if index < len(objects) or self._exhausted:
+            return index < len(objects)
+        if self._pull_lock is None:
+            self._pull_lock = asyncio.Lock()
+        async with self._pull_lock:
+            while index >= len(objects) and not self._exhausted:
+                if self._fetch is not None:
+                    limit = max(self.fetch_size, index + 1 - len(objects))
+                    page = await self._fetch(len(objects), limit)
+                    objects.extend(page)
+                    if len(page) < limit:
+                        self._exhausted = True
+                else:
+                    try:
+                        objects.append(await self._source.__anext__())
+                    except StopAsyncIteration:
+                        self._exhausted = True
+        return index < len(objects)
+
+    async def start(self):
+        """
+        Starts the Paginator by moving to the starting index, if it has not been started yet.
+
+        Returns
+        -------
+        value : Any
+            The object at the current index.
+        """
+        if not self._started:
+            if self._start_lock is None:
+                self._start_lock = asyncio.Lock()
+            async with self._start_lock:
+                if not self._started:
+                    await self._set_index(self._starting_index)
+                    self._started = True
+        return self.value
+
+    def _moving(self):
+        """
+        Returns the lock which is held while the index is moved, creating it if needed.
+        """
+        if self._move_lock is None:
+            self._move_lock = asyncio.Lock()
+        return self._move_lock
+
+    async def _set_index(self, value):
+        """
+        Sets the index of the Paginator, pulling objects from the source as needed.
+
+        It raises IndexError if on_end_error is True and the index goes out of bounds,
+        otherwise if its False, it sets the index back to the limit if it exceeds it,
+        otherwise if its None, it wraps the index around the limits.
+        """
+        if self.on_end_error:
+            if value < 0 or not await self._pull(value):
+                if self._exhausted:
+                    message = f"There are only {len(self.objects)} objects"
+                else:
+                    message = f"There are at least {len(self.objects)} objects"
+                raise IndexError(f"{message}, but tried to set index as {value}")
+            self._index = value
+        elif self.on_end_error is None:
+            if value < 0 or not await self._pull(value):
+                value %= await self.length()
+            self._index = value
+        else:
+            await self._pull(max(0, value))
+            self._index = max(0, min(len(self.objects) - 1, value))
+
+    @property
+    def index(self):
+        """
+        Returns the current index of the Paginator.
+
+        The index is changed by awaiting set, next or prev.
+        """
+        return self._index
+
+    @property
+    def value(self):
+        """
+        Returns the object at the current index of the Paginator.
+        """
+        return self.objects[self._index]
+
+    async def set(self, value):
+        """
+        Sets the index of the Paginator, to the given value.
+
+        Parameters
+        ----------
+        value : int
+            The number, that is to be set as the new index of
+            the Paginator.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        IndexError
+            If on_end_error is set to True and the new index is
+            out of bounds of the number of objects.
+        """
+        async with self._moving():
+            await self._set_index(value)
+            self._started = True
+            return self.value
+
+    async def next(self, count=1):
+        """
+        Increments the index by the given amount.
+
+        Parameters
+        ----------
+        count : int
+            How much should the index be incremented by?
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        await self.start()
+        async with self._moving():
+            await self._set_index(self._index + count)
+            return self.value
+
+    async def prev(self, count=1):
+        """
+        Decrements the index by the given amount.
+
+        Parameters
+        ----------
+        count : int
+            How much should the index be decremented by?
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        return await self.next(-count)
+
+    async def _step(self, step):
+        """
+        Moves the index by one in the given direction, if it can be moved.
+
+        Returns
+        -------
+        moved : bool
+            Whether the index was moved, it is not moved past the limits unless on_end_error is None.
+        """
+        if self.on_end_error is not None:
+            if step < 0 and self._index == 0:
+                return False
+            if step > 0 and await self.is_at_end():
+                return False
+        await self._set_index(self._index + step)
+        return True
+
+    async def _until_cond(self, cond, step):
+        """
+        Moves the index one at a time in the given direction until the condition is met.
+        """
+        await self.start()
+        async with self._moving():
+            original_index = self._index
+            while await self._step(step):
+                if await _check(cond, self.value):
+                    return self.value
+                if self._index == original_index:
+                    break
+        raise StopAsyncIteration('End of Iteration')
+
+    async def next_until_cond(self, cond):
+        """
+        Increments the index until the specified condition is met.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition at which it will stop incrementing, it can also be an async function.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        StopAsyncIteration
+            If no object meets the condition.
+        """
+        return await self._until_cond(cond, 1)
+
+    async def next_while_cond(self, cond):
+        """
+        Increments the index while the specified condition is met.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition that is checked to continue incrementing, it can also be an async function.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        return await self._until_cond(_negate(cond), 1)
+
+    async def prev_until_cond(self, cond):
+        """
+        Decrements the index until the specified condition is met.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition at which it will stop decrementing, it can also be an async function.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        StopAsyncIteration
+            If no object meets the condition.
+        """
+        return await self._until_cond(cond, -1)
+
+    async def prev_while_cond(self, cond):
+        """
+        Decrements the index while the specified condition is met.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition that is checked to continue decrementing, it can also be an async function.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        return await self._until_cond(_negate(cond), -1)
+
+    async def step_next(self, count=1):
+        """
+        Increments the index by the 1 and yields the object
+        at the current index of the paginator,
+        until the index increments the specified count times.
+
+        Parameters
+        ----------
+        count : int
+            The number of times to increment the index.
+
+        Yields
+        -------
+        value : Any
+            The object at the each new index.
+        """
+        await self.start()
+        step = 1 if count > 0 else -1
+        original_index = self._index
+        for _ in range(abs(count)):
+            async with self._moving():
+                if not await self._step(step):
+                    return
+                value = self.value
+            yield value
+            if self._index == original_index:
+                return
+
+    def step_prev(self, count=1):
+        """
+        Decrements the index by the 1 and yields the object
+        at the current index of the paginator,
+        until the index decrements the specified count times.
+
+        Parameters
+        ----------
+        count : int
+            The number of times to decrement the index.
+
+        Yields
+        -------
+        value : Any
+            The object at the each new index.
+        """
+        return self.step_next(-count)
+
+    async def _step_until_cond(self, cond, step):
+        """
+        Moves the index one at a time in the given direction, yielding each object until the condition is met.
+        """
+        await self.start()
+        original_index = self._index
+        while True:
+            async with self._moving():
+                if not await self._step(step):
+                    return
+                value = self.value
+            yield value
+            if self._index == original_index or await _check(cond, value):
+                return
+
+    def step_next_until_cond(self, cond):
+        """
+        Increments the index by the 1 and yields the object
+        at the current index of the paginator,
+        until the given condition is met.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition at which it will stop incrementing, it can also be an async function.
+
+        Yields
+        -------
+        value : Any
+            The object at the each new index.
+        """
+        return self._step_until_cond(cond, 1)
+
+    def step_next_while_cond(self, cond):
+        """
+        Increments the index by the 1 and yields the object
+        at the current index of the paginator,
+        while the given condition is met.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition that is checked to continue incrementing, it can also be an async function.
+
+        Yields
+        -------
+        value : Any
+            The object at the each new index.
+        """
+        return self._step_until_cond(_negate(cond), 1)
+
+    def step_prev_until_cond(self, cond):
+        """
+        Decrements the index by the 1 and yields the object
+        at the current index of the paginator,
+        until the given condition is met.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition at which it will stop decrementing, it can also be an async function.
+
+        Yields
+        -------
+        value : Any
+            The object at the each new index.
+        """
+        return self._step_until_cond(cond, -1)
+
+    def step_prev_while_cond(self, cond):
+        """
+        Decrements the index by the 1 and yields the object
+        at the current index of the paginator,
+        while the given condition is met.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition that is checked to continue decrementing, it can also be an async function.
+
+        Yields
+        -------
+        value : Any
+            The object at the each new index.
+        """
+        return self._step_until_cond(_negate(cond), -1)
+
+    async def __aiter__(self):
+        """
+        Iterates over the objects starting from the current index, without changing the index.
+
+        Objects are pulled from the source as the iteration reaches them.
+        If on_end_error is None, then it wraps around the limits and
+        stops just before the current index, otherwise it stops at the end.
+        """
+        await self.start()
+        index = start = self._index
+        while await self._pull(index):
+            yield self.objects[index]
+            index += 1
+        if self.on_end_error is None:
+            for index in range(start):
+                yield self.objects[index]
+
+    async def is_at_end(self):
+        """
+        Checks if the paginator is at the end.
+        """
+        return not await self._pull(self._index + 1)
+
+    @property
+    def is_at_start(self):
+        """
+        Checks if the paginator is at the start.
+        """
+        return self._index == 0
+
+    @property
+    def is_exhausted(self):
+        """
+        Checks if every object has been pulled from the source.
+        """
+        return self._exhausted
+
+    async def length(self):
+        """
+        Returns the number of objects in the Paginator.
+
+        The length is only known once the source is exhausted,
+        so this pulls every remaining object from the source.
+        """
+        while not self._exhausted:
+            await self._pull(len(self.objects) + self.fetch_size - 1)
+        return len(self.objects)
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, List, Optional, Sequence, Tuple, Union
+
+__all__: Tuple[str]
+
+Condition = Callable[[Any], Union[bool, Awaitable[bool]]]
+
+
+async def _check(cond: Condition, value: Any) -> bool: ...
+
+
+def _negate(cond: Condition) -> Callable[[Any], Awaitable[bool]]: ...
+
+
+class AsyncPaginator:
+    _source: Optional[AsyncIterator]
+    _fetch: Optional[Callable[[int, int], Awaitable[Sequence]]]
+    _exhausted: bool
+    _starting_index: int
+    _started: bool
+    _pull_lock: Optional[asyncio.Lock]
+    _start_lock: Optional[asyncio.Lock]
+    _move_lock: Optional[asyncio.Lock]
+    _index: int
+    objects: List[Any]
+    on_end_error: bool
+    fetch_size: int
+
+    def __init__(self, objects: Optional[AsyncIterable] = ..., starting_index: int = ..., on_end_error: bool = ...,
+                 fetch: Optional[Callable[[int, int], Awaitable[Sequence]]] = ..., fetch_size: int = ...) -> None: ...
+
+    async def _pull(self, index: int) -> bool: ...
+
+    async def start(self): ...
+
+    def _moving(self) -> asyncio.Lock: ...
+
+    async def _set_index(self, value: int) -> None: ...
+
+    @property
+    def index(self) -> int: ...
+
+    @property
+    def value(self): ...
+
+    async def set(self, value: int): ...
+
+    async def next(self, count: int = ...): ...
+
+    async def prev(self, count: int = ...): ...
+
+    async def _step(self, step: int) -> bool: ...
+
+    async def _until_cond(self, cond: Condition, step: int): ...
+
+    async def next_until_cond(self, cond: Condition): ...
+
+    async def next_while_cond(self, cond: Condition): ...
+
+    async def prev_until_cond(self, cond: Condition): ...
+
+    async def prev_while_cond(self, cond: Condition): ...
+
+    def step_next(self, count: int = ...) -> AsyncIterator: ...
+
+    def step_prev(self, count: int = ...) -> AsyncIterator: ...
+
+    def _step_until_cond(self, cond: Condition, step: int) -> AsyncIterator: ...
+
+    def step_next_until_cond(self, cond: Condition) -> AsyncIterator: ...
+
+    def step_next_while_cond(self, cond: Condition) -> AsyncIterator: ...
+
+    def step_prev_until_cond(self, cond: Condition) -> AsyncIterator: ...
+
+    def step_prev_while_cond(self, cond: Condition) -> AsyncIterator: ...
+
+    def __aiter__(self) -> AsyncIterator: ...
+
+    async def is_at_end(self) -> bool: ...
+
+    @property
+    def is_at_start(self) -> bool: ...
+
+    @property
+    def is_exhausted(self) -> bool: ...
+
+    async def length(self) -> int: ...
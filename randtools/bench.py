@@ -0,0 +1,262 @@
+"""
+Benchmarks of the navigation methods of the Paginators, over different sources, sizes and end modes.
+
+Run it with python -m randtools.bench, save the results with --output and check a later run
+against them with --compare, which exits with status 1 if any benchmark got slower than the threshold.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+from .lazy import LazyPaginator
+from .paginator import Paginator
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = 'run', 'compare', 'main'
+
+SIZES = 1000, 10_000, 100_000, 1_000_000
+MODES = {'clamp': False, 'raise': True, 'wrap': None}
+CALLS = 1000
+
+
+def _sources():
+    """
+    Returns the functions which create a Paginator over each type of source holding the given numbers.
+    The range source holds them as a range when they are one, and as a list otherwise.
+    """
+    sources = {
+        'list': lambda numbers, **kwargs: Paginator(list(numbers), **kwargs),
+        'tuple': lambda numbers, **kwargs: Paginator(tuple(numbers), **kwargs),
+        'range': lambda numbers, **kwargs: Paginator(numbers if isinstance(numbers, range) else list(numbers),
+                                                     **kwargs),
+        'generator': lambda numbers, **kwargs: LazyPaginator((number for number in numbers), **kwargs),
+    }
+    if numpy is not None:
+        sources['numpy'] = lambda numbers, **kwargs: Paginator(numpy.fromiter(numbers, numpy.int64), **kwargs)
+    return sources
+
+
+def _far_match(size, end):
+    """
+    Returns zeros with a single one at the other end from where the benchmark starts,
+    so that searching for a non-empty object checks every object.
+    """
+    zeros = [0] * (size - 1)
+    return [1] + zeros if end else zeros + [1]
+
+
+def _searching(method, cond, end, numbers=None):
+    """
+    Returns a benchmark which calls the search method once, starting from one end.
+    The condition is only met at the other end, so every object is checked.
+    The objects are range(size), unless the function giving the numbers of the given size and end is given.
+    """
+    def benchmark(create, size, on_end_error):
+        objects = range(size) if numbers is None else numbers(size, end)
+        pages = create(objects, starting_index=size - 1 if end else 0, on_end_error=on_end_error)
+        search = getattr(pages, method)
+        last = size - 1
+
+        def call():
+            try:
+                result = search(lambda value: cond(value, last)) if cond is not None else search()
+                if method.startswith('step'):
+                    for _ in result:
+                        pass
+            except StopIteration:
+                pass
+        return call
+
+    return benchmark
+
+
+def _moving(method, end):
+    """
+    Returns a benchmark which calls the moving method CALLS times, starting from one end.
+    """
+    def benchmark(create, size, on_end_error):
+        pages = create(range(size), starting_index=size - 1 if end else 0, on_end_error=on_end_error)
+        move = getattr(pages, method)
+        calls = range(min(CALLS, size - 1))
+
+        if method == 'set':
+            return lambda: [move(index) for index in calls]
+        if method.startswith('step'):
+            return lambda: [None for _ in move(len(calls))]
+        return lambda: [move() for _ in calls]
+
+    return benchmark
+
+
+BENCHMARKS = {
+    'next': _moving('next', False),
+    'prev': _moving('prev', True),
+    'set': _moving('set', False),
+    'step_next': _moving('step_next', False),
+    'step_prev': _moving('step_prev', True),
+    'next_until_cond': _searching('next_until_cond', lambda value, last: value == last, False),
+    'prev_until_cond': _searching('prev_until_cond', lambda value, last: value == 0, True),
+    'next_while_cond': _searching('next_while_cond', lambda value, last: value != last, False),
+    'prev_while_cond': _searching('prev_while_cond', lambda value, last: value != 0, True),
+    'step_next_until_cond': _searching('step_next_until_cond', lambda value, last: value == last, False),
+    'step_prev_until_cond': _searching('step_prev_until_cond', lambda value, last: value == 0, True),
+    'step_next_while_cond': _searching('step_next_while_cond', lambda value, last: value != last, False),
+    'step_prev_while_cond': _searching('step_prev_while_cond', lambda value, last: value != 0, True),
+    'goto_next_empty': _searching('goto_next_empty', None, False),
+    'goto_prev_empty': _searching('goto_prev_empty', None, True),
+    'goto_next_non_empty': _searching('goto_next_non_empty', None, False, _far_match),
+    'goto_prev_non_empty': _searching('goto_prev_non_empty', None, True, _far_match),
+    'step_to_next_empty': _searching('step_to_next_empty', None, False),
+    'step_to_prev_empty': _searching('step_to_prev_empty', None, True),
+    'step_to_next_non_empty': _searching('step_to_next_non_empty', None, False, _far_match),
+    'step_to_prev_non_empty': _searching('step_to_prev_non_empty', None, True, _far_match),
+}
+
+
+def run(methods=None, sources=None, sizes=SIZES, modes=None, repeat=3, max_size=None, progress=None):
+    """
+    Runs the benchmarks of every combination of the given methods, sources, sizes and modes.
+
+    Each benchmark is timed repeat times on a new Paginator, and the fastest time is kept.
+
+    Parameters
+    ----------
+    methods : Iterable, optional
+        The names of the methods, it defaults to every method in BENCHMARKS.
+    sources : Iterable, optional
+        The types of sources, it defaults to every source which is available.
+    sizes : Iterable
+        The numbers of objects.
+    modes : Iterable, optional
+        The names of the end modes, which are clamp, raise and wrap, it defaults to all of them.
+    repeat : int
+        The number of times each benchmark is timed.
+    max_size : dict, optional
+        The largest size which each source is benchmarked with, such as {'generator': 100_000}.
+    progress : Callable, optional
+        The function which is called with the key and the time of each benchmark as it finishes.
+
+    Returns
+    -------
+    results : dict
+        The fastest time in seconds of each benchmark, keyed by method/source/size/mode.
+    """
+    all_sources = _sources()
+    results = {}
+    for method in methods or BENCHMARKS:
+        for source in sources or all_sources:
+            for size in sizes:
+                if max_size and size > max_size.get(source, size):
+                    continue
+                for mode in modes or MODES:
+                    timings = []
+                    for _ in range(repeat):
+                        call = BENCHMARKS[method](all_sources[source], size, MODES[mode])
+                        start = time.perf_counter()
+                        call()
+                        timings.append(time.perf_counter() - start)
+                    key = f'{method}/{source}/{size}/{mode}'
+                    results[key] = min(timings)
+                    if progress is not None:
+                        progress(key, results[key])
+    return results
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Compares the results with the results of a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        The results of run.
+    baseline : dict
+        The results of an earlier run.
+    threshold : float
+        How much slower a benchmark can get before its a regression, 0.1 allows 10% slower.
+
+    Returns
+    -------
+    comparisons : dict
+        The ratio of the new time to the baseline time of each benchmark which is in both.
+    regressions : list
+        The keys of the benchmarks which got slower than the threshold.
+    """
+    comparisons = {key: results[key] / baseline[key] for key in results if baseline.get(key)}
+    regressions = [key for key, ratio in comparisons.items() if ratio > 1 + threshold]
+    return comparisons, regressions
+
+
+def _parse_list(text):
+    return [item.strip() for item in text.split(',') if item.strip()]
+
+
+def main(argv=None):
+    """
+    Runs the benchmarks from the command line, see python -m randtools.bench --help.
+
+    Returns
+    -------
+    status : int
+        1 if a regression was found when comparing, otherwise 0.
+    """
+    parser = argparse.ArgumentParser(prog='python -m randtools.bench', description=__doc__.strip())
+    parser.add_argument('--methods', type=_parse_list, help='comma separated methods, default all')
+    parser.add_argument('--sources', type=_parse_list, help='comma separated sources, default all available')
+    parser.add_argument('--sizes', type=lambda text: [int(float(size)) for size in _parse_list(text)],
+                        default=list(SIZES), help='comma separated sizes such as 1e3,1e7')
+    parser.add_argument('--modes', type=_parse_list, help='comma separated end modes (clamp, raise, wrap)')
+    parser.add_argument('--repeat', type=int, default=3, help='times each benchmark is timed, the fastest is kept')
+    parser.add_argument('--max-generator-size', type=int, default=100_000,
+                        help='largest size benchmarked for generator sources, which are slow to pull')
+    parser.add_argument('--output', help='file to write the results to as JSON')
+    parser.add_argument('--compare', help='JSON file of a baseline to compare the results with')
+    parser.add_argument('--threshold', type=float, default=0.1, help='allowed slowdown before a regression')
+    parser.add_argument('--quiet', action='store_true', help='do not print each result')
+    args = parser.parse_args(argv)
+
+    unknown = set(args.methods or ()) - set(BENCHMARKS)
+    unknown |= set(args.sources or ()) - set(_sources())
+    unknown |= set(args.modes or ()) - set(MODES)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    def progress(key, seconds):
+        if not args.quiet:
+            print(f'{key:<50} {seconds * 1000:12.3f} ms')
+
+    results = run(args.methods, args.sources, args.sizes, args.modes, args.repeat,
+                  {'generator': args.max_generator_size}, progress)
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': None if numpy is None else numpy.__version__,
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        },
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(report, file, indent=2)
+
+    if not args.compare:
+        return 0
+    with open(args.compare) as file:
+        baseline = json.load(file)['results']
+    comparisons, regressions = compare(results, baseline, args.threshold)
+    for key, ratio in sorted(comparisons.items(), key=lambda item: -item[1]):
+        flag = 'REGRESSION' if key in regressions else ''
+        print(f'{key:<50} {ratio:8.2f}x {flag}')
+    print(f'{len(regressions)} regressions out of {len(comparisons)} benchmarks')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
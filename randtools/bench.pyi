@@ -0,0 +1,39 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .paginator import BasePaginator
+
+__all__: Tuple[str]
+
+SIZES: Tuple[int, ...]
+MODES: Dict[str, Optional[bool]]
+CALLS: int
+BENCHMARKS: Dict[str, Callable[[Callable[..., BasePaginator], int, Optional[bool]], Callable[[], Any]]]
+
+
+def _sources() -> Dict[str, Callable[..., BasePaginator]]: ...
+
+
+def _far_match(size: int, end: bool) -> List[int]: ...
+
+
+def _searching(method: str, cond: Optional[Callable[[Any, int], bool]], end: bool,
+               numbers: Optional[Callable[[int, bool], Iterable[int]]] = ...
+               ) -> Callable[[Callable[..., BasePaginator], int, Optional[bool]], Callable[[], Any]]: ...
+
+
+def _moving(method: str, end: bool) -> Callable[[Callable[..., BasePaginator], int, Optional[bool]], Callable[[], Any]]: ...
+
+
+def run(methods: Optional[Iterable[str]] = ..., sources: Optional[Iterable[str]] = ..., sizes: Iterable[int] = ...,
+        modes: Optional[Iterable[str]] = ..., repeat: int = ..., max_size: Optional[Dict[str, int]] = ...,
+        progress: Optional[Callable[[str, float], Any]] = ...) -> Dict[str, float]: ...
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float],
+            threshold: float = ...) -> Tuple[Dict[str, float], List[str]]: ...
+
+
+def _parse_list(text: str) -> List[str]: ...
+
+
+def main(argv: Optional[Sequence[str]] = ...) -> int: ...
@@ -0,0 +1,357 @@
+import asyncio
+from contextlib import contextmanager
+from functools import wraps
+from inspect import isawaitable
+
+__all__ = 'NavigationEvent', 'PaginatorEvents'
+
+EVENTS = 'index_changed', 'wrapped', 'hit_start', 'hit_end', 'exhausted'
+SEARCH_METHODS = {
+    'next_until_cond': True, 'prev_until_cond': False, 'goto_next_non_empty': True, 'goto_next_empty': True,
+    'goto_prev_non_empty': False, 'goto_prev_empty': False, 'find_next': True, 'find_prev': False,
+}
+
+
+class NavigationEvent:
+    """
+    Event which is sent to the listeners when a Paginator moves.
+
+    Attributes
+    ----------
+    name : str
+        The name of the event, which is either index_changed, wrapped, hit_start, hit_end or exhausted.
+    paginator : BasePaginator
+        The Paginator or Cursor which moved.
+    old_index : int
+        The index before the move, or before the first move if the events were coalesced.
+    index : int
+        The index after the move, or after the last move if the events were coalesced.
+    count : int
+        The number of events which were coalesced into this one.
+    """
+
+    __slots__ = 'name', 'paginator', 'old_index', 'index', 'count'
+
+    def __init__(self, name, paginator, old_index, index, count=1):
+        self.name = name
+        self.paginator = paginator
+        self.old_index = old_index
+        self.index = index
+        self.count = count
+
+    def __repr__(self):
+        return (f'{type(self).__name__}({self.name!r}, old_index={self.old_index}, '
+                f'index={self.index}, count={self.count})')
+
+
+class PaginatorEvents:
+    """
+    Listeners of the navigation events of a Paginator and its Cursors, which are added with subscribe.
+
+    The events are index_changed when the index moves, wrapped when it wraps around the limits,
+    hit_start and hit_end when it reaches a limit or is stopped at it, and exhausted when a search finds nothing.
+    A search sends a single index_changed event for the whole search, while the step methods send one for each step,
+    unless the listener coalesces them, in which case it gets a single event once the step generator finishes.
+    """
+
+    def __init__(self):
+        """
+        Creates new PaginatorEvents without any listeners.
+        """
+        self._listeners = {}
+        self._batches = {}
+        self._muted = set()
+        self._tasks = set()
+
+    def subscribe(self, listener, *events, coalesce=False, loop=None):
+        """
+        Adds a listener of the given events.
+
+        Parameters
+        ----------
+        listener : Callable
+            The function which is called with each NavigationEvent,
+            if it returns an awaitable such as a coroutine then its scheduled as a task.
+        events : str
+            The names of the events, it defaults to every event.
+        coalesce : bool
+            If its True, then the events of each call of a step method or batch are coalesced into
+            one event of each name, with the index before the first move and the index after the last one.
+        loop : asyncio.AbstractEventLoop, optional
+            The event loop which the awaitables are scheduled on, which is needed when moving from another thread.
+            It defaults to the running event loop, and if there is none then the awaitables are run to completion.
+
+        Returns
+        -------
+        listener : Callable
+            The listener, so that this can be used as a decorator.
+        """
+        for name in events or EVENTS:
+            if name not in EVENTS:
+                raise ValueError(f"There is no event called {name}, the events are {', '.join(EVENTS)}")
+            self._listeners.setdefault(name, []).append((listener, coalesce, loop))
+        return listener
+
+    def unsubscribe(self, listener, *events):
+        """
+        Removes a listener of the given events.
+
+        Parameters
+        ----------
+        listener : Callable
+            The function which was subscribed.
+        events : str
+            The names of the events, it defaults to every event.
+        """
+        for name in events or EVENTS:
+            entries = [entry for entry in self._listeners.get(name, ()) if entry[0] != listener]
+            if entries:
+                self._listeners[name] = entries
+            else:
+                self._listeners.pop(name, None)
+
+    def __contains__(self, name):
+        """
+        Checks if the event with the given name has any listeners.
+        """
+        return name in self._listeners
+
+    def __bool__(self):
+        """
+        Checks if there are any listeners.
+        """
+        return bool(self._listeners)
+
+    def emit(self, name, paginator, old_index, index):
+        """
+        Sends the event to its listeners, or holds it back for the coalescing listeners
+        if the Paginator is in a batch.
+
+        Parameters
+        ----------
+        name : str
+            The name of the event.
+        paginator : BasePaginator
+            The Paginator or Cursor which moved.
+        old_index : int
+            The index before the move.
+        index : int
+            The index after the move.
+        """
+        listeners = self._listeners.get(name)
+        if not listeners:
+            return
+        batch = self._batches.get(id(paginator))
+        event = None
+        for listener, coalesce, loop in listeners:
+            if coalesce and batch is not None:
+                pending = batch[1].get(name)
+                if pending is None:
+                    batch[1][name] = NavigationEvent(name, paginator, old_index, index)
+                else:
+                    pending.index = index
+                    pending.count += 1
+                continue
+            if event is None:
+                event = NavigationEvent(name, paginator, old_index, index)
+            self._call(listener, loop, event)
+
+    def _call(self, listener, loop, event):
+        """
+        Calls the listener with the event, scheduling the awaitable it returns if it returns one.
+        """
+        result = listener(event)
+        if not isawaitable(result):
+            return
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(_awaited(result), loop)
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            asyncio.run(_awaited(result))
+            return
+        task = running.create_task(_awaited(result))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @contextmanager
+    def batch(self, paginator):
+        """
+        Coalesces the events of the given Paginator within the block for the coalescing listeners,
+        which get one event of each name once the outermost batch ends.
+
+        Parameters
+        ----------
+        paginator : BasePaginator
+            The Paginator or Cursor whose events are coalesced.
+        """
+        key = id(paginator)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = self._batches[key] = [0, {}]
+        batch[0] += 1
+        try:
+            yield
+        finally:
+            batch[0] -= 1
+            if not batch[0]:
+                del self._batches[key]
+                for event in batch[1].values():
+                    for listener, coalesce, loop in self._listeners.get(event.name, ()):
+                        if coalesce:
+                            self._call(listener, loop, event)
+
+    @contextmanager
+    def _muting(self, paginator):
+        """
+        Stops the index events of the given Paginator within the block, so that a search which
+        moves one object at a time sends the events of the whole search after it instead.
+        """
+        key = id(paginator)
+        self._muted.add(key)
+        try:
+            yield
+        finally:
+            self._muted.discard(key)
+
+
+async def _awaited(awaitable):
+    return await awaitable
+
+
+class _Observing:
+    """
+    Methods which send the navigation events of a Paginator, which are added to the subclasses created by observed
+    so that Paginators without listeners do not pay for checking whether they have any.
+    They call the methods of the class which was observed, which is _unobserved.
+    """
+
+    def __reduce_ex__(self, protocol):
+        return self._reduce_featured(protocol)
+
+    @property
+    def index(self):
+        return self._index
+
+    @index.setter
+    def index(self, value):
+        old_index = self._index
+        self._unobserved.index.fset(self, value)
+        events = self.events
+        if events and id(self) not in events._muted:
+            self._moved(events, old_index, value, self.on_end_error is None and self._index != value)
+
+    def _moved(self, events, old_index, requested, wrapped):
+        """
+        Sends the events of a move from the old index to the current index, which was requested to go to the given index.
+        """
+        index = self._index
+        if index != old_index:
+            events.emit('index_changed', self, old_index, index)
+        if wrapped:
+            events.emit('wrapped', self, old_index, index)
+        if 'hit_start' in events and index == 0 and (index != old_index or requested < 0):
+            events.emit('hit_start', self, old_index, index)
+        if 'hit_end' in events and (index != old_index or requested > index) and self.is_at_end:
+            events.emit('hit_end', self, old_index, index)
+
+    def _search_exhausted(self):
+        events = self.events
+        if events:
+            events.emit('exhausted', self, self._index, self._index)
+
+    def _stepped(self, steps, forward):
+        """
+        Yields the values of a step generator which sets the index directly, sending the events of each step.
+        """
+        events = self.events
+        old_index = self._index
+        for value in steps:
+            if events:
+                index = self._index
+                self._moved(events, old_index, index, index < old_index if forward else index > old_index)
+                old_index = index
+            yield value
+
+    def _step_scan(self, cond, forward):
+        return self._stepped(self._unobserved._step_scan(self, cond, forward), forward)
+
+    def step_next(self, count=1):
+        steps = self._unobserved.step_next(self, count)
+        return self._stepped(steps, count > 0) if self._scannable else steps
+
+
+def _searching(method, forward):
+    """
+    Returns the search method sending the events of the whole search once its done.
+    """
+    @wraps(method)
+    def searching(self, *args, **kwargs):
+        events = self.events
+        if not events or id(self) in events._muted:
+            return method(self, *args, **kwargs)
+        old_index = self._index
+        exhausted = False
+        try:
+            with events._muting(self):
+                return method(self, *args, **kwargs)
+        except StopIteration:
+            exhausted = True
+            raise
+        finally:
+            index = self._index
+            self._moved(events, old_index, index, index < old_index if forward else index > old_index)
+            if exhausted:
+                events.emit('exhausted', self, old_index, index)
+
+    return searching
+
+
+def _stepping(method):
+    """
+    Returns the step method coalescing the events of its steps for the coalescing listeners.
+    """
+    @wraps(method)
+    def stepping(self, *args, **kwargs):
+        events = self.events
+        if not events:
+            yield from method(self, *args, **kwargs)
+            return
+        with events.batch(self):
+            yield from method(self, *args, **kwargs)
+
+    return stepping
+
+
+_observed_classes = {}
+
+
+def observed(cls):
+    """
+    Returns the subclass of the given Paginator class which sends navigation events, creating it if needed.
+
+    Parameters
+    ----------
+    cls : type
+        The Paginator class, which is returned as it is if it already sends events.
+
+    Returns
+    -------
+    observed : type
+        The subclass of the class which sends events.
+    """
+    if '_unobserved' in vars(cls):
+        return cls
+    observed_cls = _observed_classes.get(cls)
+    if observed_cls is None:
+        namespace = {name: value for name, value in vars(_Observing).items() if not name.startswith('__')}
+        namespace.update(__slots__=(), __module__=__name__, __reduce_ex__=_Observing.__reduce_ex__, _unobserved=cls)
+        for name, forward in SEARCH_METHODS.items():
+            if hasattr(cls, name):
+                namespace[name] = _searching(getattr(cls, name), forward)
+        for name in dir(cls):
+            if name.startswith('step_'):
+                namespace[name] = _stepping(namespace.get(name, getattr(cls, name)))
+        observed_cls = _observed_classes[cls] = type(f'Observed{cls.__name__}', (cls,), namespace)
+    return observed_cls
@@ -0,0 +1,73 @@
+import asyncio
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Set, Tuple, Type
+
+from .paginator import BasePaginator
+
+__all__: Tuple[str]
+
+EVENTS: Tuple[str, ...]
+SEARCH_METHODS: Dict[str, bool]
+
+
+class NavigationEvent:
+    name: str
+    paginator: BasePaginator
+    old_index: int
+    index: int
+    count: int
+
+    def __init__(self, name: str, paginator: BasePaginator, old_index: int, index: int, count: int = ...) -> None: ...
+
+    def __repr__(self) -> str: ...
+
+
+class PaginatorEvents:
+    _listeners: Dict[str, List[Tuple[Callable[[NavigationEvent], Any], bool, Optional[asyncio.AbstractEventLoop]]]]
+    _batches: Dict[int, List]
+    _muted: Set[int]
+    _tasks: Set[asyncio.Task]
+
+    def __init__(self) -> None: ...
+
+    def subscribe(self, listener: Callable[[NavigationEvent], Any], *events: str, coalesce: bool = ...,
+                  loop: Optional[asyncio.AbstractEventLoop] = ...) -> Callable[[NavigationEvent], Any]: ...
+
+    def unsubscribe(self, listener: Callable[[NavigationEvent], Any], *events: str) -> None: ...
+
+    def __contains__(self, name: str) -> bool: ...
+
+    def __bool__(self) -> bool: ...
+
+    def emit(self, name: str, paginator: BasePaginator, old_index: int, index: int) -> None: ...
+
+    def _call(self, listener: Callable[[NavigationEvent], Any], loop: Optional[asyncio.AbstractEventLoop],
+              event: NavigationEvent) -> None: ...
+
+    def batch(self, paginator: BasePaginator) -> ContextManager[None]: ...
+
+    def _muting(self, paginator: BasePaginator) -> ContextManager[None]: ...
+
+
+async def _awaited(awaitable: Any) -> Any: ...
+
+
+class _Observing(BasePaginator):
+    _unobserved: Type[BasePaginator]
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Callable[..., BasePaginator], Tuple[type, Any]]: ...
+
+    def _moved(self, events: PaginatorEvents, old_index: int, requested: int, wrapped: bool) -> None: ...
+
+    def _stepped(self, steps: Iterator, forward: bool) -> Iterator: ...
+
+
+def _searching(method: Callable[..., Any], forward: bool) -> Callable[..., Any]: ...
+
+
+def _stepping(method: Callable[..., Iterator]) -> Callable[..., Iterator]: ...
+
+
+_observed_classes: Dict[type, type]
+
+
+def observed(cls: Type[BasePaginator]) -> Type[BasePaginator]: ...
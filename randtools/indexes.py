@@ -0,0 +1,567 @@
+import re
+from bisect import bisect_left, bisect_right, insort
+from threading import Thread
+
+__all__ = 'RunIndex', 'KeyIndex', 'TextIndex'
+
+WORD = re.compile(r'\w+')
+
+
+class RunIndex:
+    """
+    Index of the runs of objects which do and do not meet a condition,
+    which is used to find the next object that does (or does not) meet it in O(log n).
+
+    Attributes
+    ----------
+    objects : Sequence
+        The objects which are indexed.
+    cond : Callable
+        The condition which the objects are indexed by.
+    starts : list
+        The sorted indexes at which each run starts.
+    first_truth : bool
+        Whether the objects in the first run meet the condition.
+    length : int
+        The number of objects which are indexed.
+    valid : bool
+        Whether the index is up to date, it is rebuilt when its next synced if not.
+    """
+
+    def __init__(self, objects, cond=bool):
+        """
+        Creates a new RunIndex and builds it from the given objects.
+
+        Parameters
+        ----------
+        objects : Sequence
+            The objects which should be indexed.
+        cond : Callable
+            The condition which the objects should be indexed by.
+        """
+        self.objects = objects
+        self.cond = cond
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Builds the index again from all of the objects.
+        """
+        self.starts = []
+        self.first_truth = False
+        self.length = 0
+        self.valid = True
+        self._extend()
+
+    def invalidate(self):
+        """
+        Marks the index as stale, so that its rebuilt the next time its synced.
+        """
+        self.valid = False
+
+    def _extend(self):
+        """
+        Indexes the objects which were added after the last indexed object.
+        """
+        cond, starts, objects = self.cond, self.starts, self.objects
+        length = len(objects)
+        previous = self.truth(self.length - 1) if self.length else None
+        for index in range(self.length, length):
+            truth = bool(cond(objects[index]))
+            if truth is not previous:
+                if not starts:
+                    self.first_truth = truth
+                starts.append(index)
+                previous = truth
+        self.length = length
+
+    def sync(self):
+        """
+        Updates the index if its stale or the number of objects has changed,
+        objects which were appended are indexed and the index is rebuilt if any were removed.
+        """
+        length = len(self.objects)
+        if not self.valid:
+            self.rebuild()
+        elif length > self.length:
+            self._extend()
+        elif length < self.length:
+            self.rebuild()
+
+    def update(self, index):
+        """
+        Updates the index after the object at the given index has been changed.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object which was changed.
+        """
+        if not self.valid or index >= self.length:
+            return self.sync()
+        if bool(self.cond(self.objects[index])) is self.truth(index):
+            return
+        if index == 0:
+            self.first_truth = not self.first_truth
+        else:
+            self._toggle(index)
+        if index + 1 < self.length:
+            self._toggle(index + 1)
+
+    def _toggle(self, index):
+        """
+        Adds or removes the start of a run at the given index.
+        """
+        starts = self.starts
+        position = bisect_left(starts, index)
+        if position < len(starts) and starts[position] == index:
+            del starts[position]
+        else:
+            starts.insert(position, index)
+
+    def _run(self, index):
+        """
+        Returns the position of the run which contains the given index.
+        """
+        return bisect_right(self.starts, index) - 1
+
+    def _run_truth(self, run):
+        """
+        Returns whether the objects in the given run meet the condition.
+        """
+        return self.first_truth is not bool(run & 1)
+
+    def truth(self, index):
+        """
+        Returns whether the object at the given index meets the condition.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object.
+
+        Returns
+        -------
+        truth : bool
+            Whether the object meets the condition.
+        """
+        return self._run_truth(self._run(index))
+
+    def next(self, index, truth=True):
+        """
+        Returns the first index after the given index whose object matches the truth, or None.
+        """
+        index += 1
+        if index >= self.length:
+            return None
+        run = self._run(index)
+        if self._run_truth(run) is truth:
+            return index
+        if run + 1 < len(self.starts):
+            return self.starts[run + 1]
+        return None
+
+    def prev(self, index, truth=True):
+        """
+        Returns the last index before the given index whose object matches the truth, or None.
+        """
+        index -= 1
+        if index < 0:
+            return None
+        run = self._run(index)
+        if self._run_truth(run) is truth:
+            return index
+        if run > 0:
+            return self.starts[run] - 1
+        return None
+
+    def find(self, index, truth=True, forward=True, wrap=False):
+        """
+        Finds the index of the next (or previous) object after the given index, which matches the truth.
+
+        The objects are searched in the same order as the Paginator steps through them,
+        so if wrap is True then the search continues from the other limit and ends at the given index.
+
+        Parameters
+        ----------
+        index : int
+            The index after (or before) which the search starts.
+        truth : bool
+            Whether the object should meet the condition or not.
+        forward : bool
+            Whether the index is being incremented or decremented.
+        wrap : bool
+            Whether the search wraps around the limits.
+
+        Returns
+        -------
+        index : int, optional
+            The index of the object which matches the truth, or None if no object matches it.
+        """
+        if forward:
+            found = self.next(index, truth)
+            if found is None and wrap:
+                found = self.next(-1, truth)
+                if found is not None and found > index:
+                    found = None
+        else:
+            found = self.prev(index, truth)
+            if found is None and wrap:
+                found = self.prev(self.length, truth)
+                if found is not None and found < index:
+                    found = None
+        return found
+
+
+class IndexedCondition:
+    """
+    Condition which is backed by a RunIndex, so that it can be searched for without checking every object.
+
+    Attributes
+    ----------
+    index : RunIndex
+        The index of the condition.
+    truth : bool
+        Whether the object should meet the condition of the index or not.
+    """
+
+    def __init__(self, index, truth=True):
+        self.index = index
+        self.truth = truth
+
+    def __call__(self, value):
+        return bool(self.index.cond(value)) is self.truth
+
+    def __invert__(self):
+        """
+        Returns the negation of this condition, which is backed by the same index.
+        """
+        return IndexedCondition(self.index, not self.truth)
+
+
+class KeyIndex:
+    """
+    Index of the keys of objects which are sorted by them,
+    which is bisected by seek without calling the key function again.
+
+    Attributes
+    ----------
+    objects : Sequence
+        The objects which are indexed.
+    key : Callable, optional
+        The function which returns the key of an object, if its None then the objects are their own keys.
+    keys : list
+        The key of each object.
+    valid : bool
+        Whether the index is up to date, it is rebuilt when its next synced if not.
+    """
+
+    def __init__(self, objects, key=None):
+        """
+        Creates a new KeyIndex and builds it from the given objects.
+
+        Parameters
+        ----------
+        objects : Sequence
+            The objects which should be indexed, which must be sorted by their keys.
+        key : Callable, optional
+            The function which returns the key of an object.
+        """
+        self.objects = objects
+        self.key = key
+        self.rebuild()
+
+    def rebuild(self):
+        """
+        Builds the index again from all of the objects.
+        """
+        self.keys = []
+        self.valid = True
+        self._extend()
+
+    def invalidate(self):
+        """
+        Marks the index as stale, so that its rebuilt the next time its synced.
+        """
+        self.valid = False
+
+    def _extend(self):
+        """
+        Indexes the objects which were added after the last indexed object.
+        """
+        objects = self.objects[len(self.keys):len(self.objects)]
+        self.keys.extend(objects if self.key is None else map(self.key, objects))
+
+    def sync(self):
+        """
+        Updates the index if its stale or the number of objects has changed,
+        objects which were appended are indexed and the index is rebuilt if any were removed.
+        """
+        length = len(self.objects)
+        if not self.valid or length < len(self.keys):
+            self.rebuild()
+        elif length > len(self.keys):
+            self._extend()
+
+    def update(self, index):
+        """
+        Updates the index after the object at the given index has been changed.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object which was changed.
+        """
+        if not self.valid or index >= len(self.keys):
+            return self.sync()
+        value = self.objects[index]
+        self.keys[index] = value if self.key is None else self.key(value)
+
+
+def words(text):
+    """
+    Splits the text into its casefolded words, which is the default tokenizer of TextIndex.
+
+    Parameters
+    ----------
+    text : str
+        The text which is split.
+
+    Returns
+    -------
+    words : list
+        The words in the text.
+    """
+    return WORD.findall(text.casefold())
+
+
+class TextIndex:
+    """
+    Inverted index of the tokens in the text of the objects,
+    which is used to find the next object that contains every token of a query in O(log n).
+
+    Attributes
+    ----------
+    objects : Sequence
+        The objects which are indexed.
+    extract : Callable
+        The function which returns the text of an object.
+    tokenize : Callable
+        The function which splits a text into its tokens, it is used for the objects and the queries.
+    postings : dict
+        The sorted indexes of the objects which contain each token.
+    valid : bool
+        Whether the index is up to date, it is rebuilt when its next synced if not.
+    """
+
+    def __init__(self, objects, extract=str, tokenize=words, background=False):
+        """
+        Creates a new TextIndex and builds it from the given objects.
+
+        Parameters
+        ----------
+        objects : Sequence
+            The objects which should be indexed.
+        extract : Callable
+            The function which returns the text of an object.
+        tokenize : Callable
+            The function which splits a text into its tokens.
+        background : bool
+            Whether the index is built in a background thread, in which case its waited for when its first used.
+        """
+        self.objects = objects
+        self.extract = extract
+        self.tokenize = tokenize
+        self._builder = None
+        self.rebuild(background)
+
+    def rebuild(self, background=False):
+        """
+        Builds the index again from all of the objects.
+
+        Parameters
+        ----------
+        background : bool
+            Whether the index is built in a background thread.
+        """
+        self.wait()
+        self.postings = {}
+        self._tokens = []
+        self.valid = True
+        if background:
+            self._builder = Thread(target=self._extend, daemon=True)
+            self._builder.start()
+        else:
+            self._extend()
+
+    def wait(self):
+        """
+        Waits until the index which is built in the background is done.
+        """
+        if self._builder is not None:
+            self._builder.join()
+            self._builder = None
+
+    def invalidate(self):
+        """
+        Marks the index as stale, so that its rebuilt the next time its synced.
+        """
+        self.valid = False
+
+    @property
+    def length(self):
+        """
+        Returns the number of objects which are indexed.
+        """
+        return len(self._tokens)
+
+    def _extend(self):
+        """
+        Indexes the objects which were added after the last indexed object.
+        """
+        objects, postings = self.objects, self.postings
+        for index in range(len(self._tokens), len(objects)):
+            tokens = set(self.tokenize(self.extract(objects[index])))
+            self._tokens.append(tokens)
+            for token in tokens:
+                postings.setdefault(token, []).append(index)
+
+    def sync(self):
+        """
+        Updates the index if its stale or the number of objects has changed,
+        objects which were appended are indexed and the index is rebuilt if any were removed.
+        """
+        self.wait()
+        length = len(self.objects)
+        if not self.valid or length < self.length:
+            self.rebuild()
+        elif length > self.length:
+            self._extend()
+
+    def update(self, index):
+        """
+        Updates the index after the object at the given index has been changed.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object which was changed.
+        """
+        self.wait()
+        if not self.valid or index >= self.length:
+            return self.sync()
+        old, new = self._tokens[index], set(self.tokenize(self.extract(self.objects[index])))
+        for token in old - new:
+            postings = self.postings[token]
+            del postings[bisect_left(postings, index)]
+            if not postings:
+                del self.postings[token]
+        for token in new - old:
+            insort(self.postings.setdefault(token, []), index)
+        self._tokens[index] = new
+
+    def _postings(self, query):
+        """
+        Returns the postings of each token in the query, shortest first, or None if a token is in no object.
+        """
+        tokens = set(self.tokenize(query))
+        if not tokens:
+            return None
+        postings = [self.postings.get(token) for token in tokens]
+        if not all(postings):
+            return None
+        return sorted(postings, key=len)
+
+    @staticmethod
+    def _next(postings, start):
+        """
+        Returns the first index from start which is in every postings, or None.
+        """
+        candidate = start
+        while True:
+            for indexes in postings:
+                position = bisect_left(indexes, candidate)
+                if position == len(indexes):
+                    return None
+                if indexes[position] != candidate:
+                    candidate = indexes[position]
+                    break
+            else:
+                return candidate
+
+    @staticmethod
+    def _prev(postings, stop):
+        """
+        Returns the last index up to stop which is in every postings, or None.
+        """
+        candidate = stop
+        while True:
+            for indexes in postings:
+                position = bisect_right(indexes, candidate) - 1
+                if position < 0:
+                    return None
+                if indexes[position] != candidate:
+                    candidate = indexes[position]
+                    break
+            else:
+                return candidate
+
+    def find(self, query, index, forward=True, wrap=False):
+        """
+        Finds the index of the next (or previous) object after the given index, which contains every token of the query.
+
+        The objects are searched in the same order as the Paginator steps through them,
+        so if wrap is True then the search continues from the other limit and ends at the given index.
+
+        Parameters
+        ----------
+        query : str
+            The text which is searched for.
+        index : int
+            The index after (or before) which the search starts.
+        forward : bool
+            Whether the index is being incremented or decremented.
+        wrap : bool
+            Whether the search wraps around the limits.
+
+        Returns
+        -------
+        index : int, optional
+            The index of the object which contains the query, or None if no object contains it.
+        """
+        postings = self._postings(query)
+        if postings is None:
+            return None
+        if forward:
+            found = self._next(postings, index + 1)
+            if found is None and wrap:
+                found = self._next(postings, 0)
+                if found is not None and found > index:
+                    found = None
+        else:
+            found = self._prev(postings, index - 1) if index > 0 else None
+            if found is None and wrap:
+                found = self._prev(postings, self.length - 1)
+                if found is not None and found < index:
+                    found = None
+        return found
+
+
+class _Keys:
+    """
+    Sequence of the keys of the objects, which calls the key function only for the keys that are looked up,
+    so that the objects can be bisected without a KeyIndex.
+    """
+
+    __slots__ = 'objects', 'key', 'length'
+
+    def __init__(self, objects, key, length):
+        self.objects = objects
+        self.key = key
+        self.length = length
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        return self.key(self.objects[index])
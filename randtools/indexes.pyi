@@ -0,0 +1,125 @@
+import re
+from threading import Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+__all__: Tuple[str]
+
+WORD: re.Pattern
+
+
+class RunIndex:
+    objects: Sequence
+    cond: Callable[[Any], Any]
+    starts: List[int]
+    first_truth: bool
+    length: int
+    valid: bool
+
+    def __init__(self, objects: Sequence, cond: Callable[[Any], Any] = ...) -> None: ...
+
+    def rebuild(self) -> None: ...
+
+    def invalidate(self) -> None: ...
+
+    def _extend(self) -> None: ...
+
+    def sync(self) -> None: ...
+
+    def update(self, index: int) -> None: ...
+
+    def _toggle(self, index: int) -> None: ...
+
+    def _run(self, index: int) -> int: ...
+
+    def _run_truth(self, run: int) -> bool: ...
+
+    def truth(self, index: int) -> bool: ...
+
+    def next(self, index: int, truth: bool = ...) -> Optional[int]: ...
+
+    def prev(self, index: int, truth: bool = ...) -> Optional[int]: ...
+
+    def find(self, index: int, truth: bool = ..., forward: bool = ..., wrap: bool = ...) -> Optional[int]: ...
+
+
+class IndexedCondition:
+    index: RunIndex
+    truth: bool
+
+    def __init__(self, index: RunIndex, truth: bool = ...) -> None: ...
+
+    def __call__(self, value: Any) -> bool: ...
+
+    def __invert__(self) -> IndexedCondition: ...
+
+
+class KeyIndex:
+    objects: Sequence
+    key: Optional[Callable[[Any], Any]]
+    keys: List[Any]
+    valid: bool
+
+    def __init__(self, objects: Sequence, key: Optional[Callable[[Any], Any]] = ...) -> None: ...
+
+    def rebuild(self) -> None: ...
+
+    def invalidate(self) -> None: ...
+
+    def _extend(self) -> None: ...
+
+    def sync(self) -> None: ...
+
+    def update(self, index: int) -> None: ...
+
+
+def words(text: str) -> List[str]: ...
+
+
+class TextIndex:
+    objects: Sequence
+    extract: Callable[[Any], str]
+    tokenize: Callable[[str], Iterable[Any]]
+    postings: Dict[Any, List[int]]
+    valid: bool
+    _tokens: List[Set[Any]]
+    _builder: Optional[Thread]
+
+    def __init__(self, objects: Sequence, extract: Callable[[Any], str] = ...,
+                 tokenize: Callable[[str], Iterable[Any]] = ..., background: bool = ...) -> None: ...
+
+    def rebuild(self, background: bool = ...) -> None: ...
+
+    def wait(self) -> None: ...
+
+    def invalidate(self) -> None: ...
+
+    @property
+    def length(self) -> int: ...
+
+    def _extend(self) -> None: ...
+
+    def sync(self) -> None: ...
+
+    def update(self, index: int) -> None: ...
+
+    def _postings(self, query: str) -> Optional[List[List[int]]]: ...
+
+    @staticmethod
+    def _next(postings: List[List[int]], start: int) -> Optional[int]: ...
+
+    @staticmethod
+    def _prev(postings: List[List[int]], stop: int) -> Optional[int]: ...
+
+    def find(self, query: str, index: int, forward: bool = ..., wrap: bool = ...) -> Optional[int]: ...
+
+
+class _Keys:
+    objects: Sequence
+    key: Callable[[Any], Any]
+    length: int
+
+    def __init__(self, objects: Sequence, key: Callable[[Any], Any], length: int) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int) -> Any: ...
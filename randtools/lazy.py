@@ -0,0 +1,370 @@
+from collections import deque
+from itertools import islice
+from sys import getsizeof
+
+from .paginator import Paginator
+from .parallelize import parallel
+
+__all__ = 'LazyPaginator', 'StreamingPaginator', 'OutOfWindowError'
+
+
+class OutOfWindowError(IndexError):
+    """
+    Raised when an index is requested which has already been evicted from the window.
+    """
+
+
+class LazyPaginator(Paginator):
+    """
+    Paginator which lazily pulls the objects from an iterator.
+
+    Objects are only pulled from the source as far as the index requires,
+    and everything that has been pulled is kept so that it can be revisited.
+
+    Attributes
+    ----------
+    index : int
+        The current index of the Paginator.
+    objects : list
+        The objects which have been pulled from the source so far.
+    """
+
+    _buffer_type = list
+    _scannable = False
+
+    def __init__(self, objects, starting_index=0, on_end_error=False):
+        """
+        Creates a new LazyPaginator object with the given parameters.
+
+        Parameters
+        ----------
+        objects : Iterable
+            The objects on which the Paginator should iterate,
+            this can be any iterable including generators.
+        starting_index : int
+            The index where the pagination should start.
+        on_end_error : bool
+            If its True, then it raises error if the index exceeds the limits.
+            If its False, then if index exceeds the limit, it is set back to the limit.
+            If its None, then it wraps the index around the limits.
+        """
+        self._source = iter(objects)
+        self._exhausted = False
+        super().__init__(self._buffer_type(), starting_index, on_end_error)
+
+    def _pull(self, index):
+        """
+        Pulls objects from the source until the given index is available.
+
+        Parameters
+        ----------
+        index : int
+            The index which should be available.
+
+        Returns
+        -------
+        available : bool
+            Whether an object exists at the given index.
+        """
+        if index >= self._count and not self._exhausted:
+            self._extend(islice(self._source, index + 1 - self._count))
+            if index >= self._count:
+                self._exhausted = True
+        return index < self._count
+
+    def _extend(self, objects):
+        """
+        Adds the given objects pulled from the source to the buffer.
+
+        Parameters
+        ----------
+        objects : Iterable
+            The objects which were pulled from the source.
+        """
+        self.objects.extend(objects)
+
+    @property
+    def _count(self):
+        """
+        Returns the number of objects pulled from the source so far.
+        """
+        return len(self.objects)
+
+    @Paginator.index.setter
+    def index(self, value):
+        if self.on_end_error:
+            if value < 0 or not self._pull(value):
+                if self._exhausted:
+                    message = f"There are only {self._count} objects"
+                else:
+                    message = f"There are at least {self._count} objects"
+                raise IndexError(f"{message}, but tried to set index as {value}")
+            self._index = value
+        elif self.on_end_error is None:
+            if value < 0 or not self._pull(value):
+                value %= self.length
+            self._index = value
+        else:
+            self._pull(max(0, value))
+            self._index = max(0, min(self._count - 1, value))
+
+    def take_next(self, count=1):
+        """
+        Increments the index by the given amount in one go,
+        and returns the objects that step_next would have yielded.
+
+        Parameters
+        ----------
+        count : int
+            The number of times to increment the index.
+
+        Returns
+        -------
+        values : list
+            The object at each index which was passed.
+        """
+        return list(self.step_next(count))
+
+    def window(self, radius=1):
+        """
+        Returns the objects around the current index of the Paginator,
+        without changing the index, see Paginator.window.
+
+        Objects are only pulled up to index + radius, unless on_end_error is None
+        and the window wraps around the limits, in which case the length has to be found.
+        """
+        index = self.index
+        available = self._pull(index + radius)
+        if self.on_end_error is None and (index < radius or not available):
+            return super().window(radius)
+        start, stop = max(0, index - radius), min(self._count, index + radius + 1)
+        return [self._value_at(position) for position in range(start, stop)]
+
+    def _state_length(self):
+        """
+        Returns the number of objects if the source is exhausted, otherwise -1 as its not known yet.
+        """
+        return self._count if self._exhausted else -1
+
+    def _resolve_cond(self, cond):
+        """
+        Returns the condition of the index with the given name, or the condition itself if its not a name.
+        Parallel conditions are checked one object at a time, as the objects are pulled one at a time.
+        """
+        cond = super()._resolve_cond(cond)
+        return cond.func if isinstance(cond, parallel) else cond
+
+    def cursor(self):
+        """
+        Cursors are not supported, as they can not pull objects from the source.
+        """
+        raise TypeError(f"{type(self).__name__} does not support cursors")
+
+    def __iter__(self):
+        """
+        Iterates over the objects starting from the current index, without changing the index.
+
+        Objects are pulled from the source as the iteration reaches them.
+        If on_end_error is None, then it wraps around the limits and
+        stops just before the current index, otherwise it stops at the end.
+        """
+        index = start = self.index
+        while self._pull(index):
+            yield self._value_at(index)
+            index += 1
+        if self.on_end_error is None:
+            for index in range(start):
+                yield self._value_at(index)
+
+    @property
+    def is_exhausted(self):
+        """
+        Checks if every object has been pulled from the source.
+        """
+        return self._exhausted
+
+    @property
+    def is_at_end(self):
+        """
+        Checks if the paginator is either at the end.
+        """
+        return not self._pull(self.index + 1)
+
+    @property
+    def length(self):
+        """
+        Returns the number of objects in the Paginator.
+
+        The length is only known once the source is exhausted,
+        so this pulls every remaining object from the source.
+        """
+        if not self._exhausted:
+            self._extend(self._source)
+            self._exhausted = True
+        return self._count
+
+
+class StreamingPaginator(LazyPaginator):
+    """
+    Paginator which lazily pulls the objects from an iterator,
+    only keeping a bounded window of the most recently pulled objects.
+
+    Attributes
+    ----------
+    index : int
+        The current index of the Paginator.
+    objects : deque
+        The objects which are currently in the window.
+    window_size : int, optional
+        The maximum number of objects kept in the window.
+    window_bytes : int, optional
+        The maximum total size in bytes of the objects kept in the window.
+    source_factory : Callable, optional
+        The function which is used to recreate the source when going back past the window.
+    """
+
+    _buffer_type = deque
+
+    def __init__(self, objects, starting_index=0, on_end_error=False, window_size=None, window_bytes=None,
+                 source_factory=None):
+        """
+        Creates a new StreamingPaginator object with the given parameters.
+
+        Parameters
+        ----------
+        objects : Iterable
+            The objects on which the Paginator should iterate,
+            this can be any iterable including generators.
+        starting_index : int
+            The index where the pagination should start.
+        on_end_error : bool
+            If its True, then it raises error if the index exceeds the limits.
+            If its False, then if index exceeds the limit, it is set back to the limit.
+            If its None, then it wraps the index around the limits.
+        window_size : int, optional
+            The maximum number of objects kept in the window.
+        window_bytes : int, optional
+            The maximum total size in bytes of the objects kept in the window,
+            each object is measured with sys.getsizeof.
+        source_factory : Callable, optional
+            A function returning a fresh iterable over the same objects,
+            it is used to pull the objects again when going back past the window.
+            If its not given, going back past the window raises OutOfWindowError.
+        """
+        if window_size is None and window_bytes is None:
+            raise ValueError("Either window_size or window_bytes must be given")
+        if window_size is not None and window_size < 2:
+            raise ValueError(f"The window must hold atleast 2 objects, but window_size was {window_size}")
+        self.window_size = window_size
+        self.window_bytes = window_bytes
+        self.source_factory = source_factory
+        self._offset = 0
+        self._sizes = deque()
+        self._bytes = 0
+        super().__init__(objects, starting_index, on_end_error)
+
+    def _extend(self, objects):
+        """
+        Adds the given objects pulled from the source to the window,
+        evicting the oldest objects which no longer fit in it.
+
+        Parameters
+        ----------
+        objects : Iterable
+            The objects which were pulled from the source.
+        """
+        window, sizes = self.objects, self._sizes
+        window_size, window_bytes = self.window_size, self.window_bytes
+        for obj in objects:
+            window.append(obj)
+            if window_bytes is not None:
+                size = getsizeof(obj)
+                sizes.append(size)
+                self._bytes += size
+            while len(window) > 2 and (window_size is not None and len(window) > window_size or
+                                       window_bytes is not None and self._bytes > window_bytes):
+                window.popleft()
+                self._offset += 1
+                if window_bytes is not None:
+                    self._bytes -= sizes.popleft()
+
+    @property
+    def _count(self):
+        """
+        Returns the number of objects pulled from the source so far.
+        """
+        return self._offset + len(self.objects)
+
+    def _rewind(self, index):
+        """
+        Recreates the source and pulls the objects again, so that the given index is in the window.
+
+        Parameters
+        ----------
+        index : int
+            The index which should be in the window.
+
+        Raises
+        ------
+        OutOfWindowError
+            If there is no source_factory to recreate the source with.
+        """
+        if self.source_factory is None:
+            raise OutOfWindowError(f"The object at index {index} was evicted, "
+                                   f"the window only starts at index {self._offset}")
+        start = index if self.window_size is None else max(0, index - self.window_size // 2)
+        self._source = iter(self.source_factory())
+        self._exhausted = False
+        self.objects.clear()
+        self._sizes.clear()
+        self._bytes = 0
+        self._offset = start
+        deque(islice(self._source, start), maxlen=0)
+        self._pull(index)
+
+    @LazyPaginator.index.setter
+    def index(self, value):
+        original_index = self._index
+        LazyPaginator.index.fset(self, value)
+        if self._index < self._offset:
+            try:
+                self._rewind(self._index)
+            except OutOfWindowError:
+                self._index = original_index
+                raise
+
+    def _value_at(self, index):
+        """
+        Returns the object at the given index.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object.
+
+        Returns
+        -------
+        value : Any
+            The object at the given index.
+
+        Raises
+        ------
+        OutOfWindowError
+            If the object has already been evicted from the window.
+        """
+        if index < self._offset:
+            raise OutOfWindowError(f"The object at index {index} was evicted, "
+                                   f"the window only starts at index {self._offset}")
+        return self.objects[index - self._offset]
+
+    def __len__(self):
+        """
+        Returns the number of objects in the Paginator, once the source is exhausted.
+
+        Counting the objects would drain the source and evict the window, so this raises TypeError
+        while the number of objects is not known yet, and list() falls back to iterating without it.
+        Use the length property to drain the source and count them anyway.
+        """
+        if not self._exhausted:
+            raise TypeError(f"The length of a {type(self).__name__} is unknown until its source is exhausted")
+        return self._count
@@ -0,0 +1,59 @@
+from typing import Any, Callable, Deque, Iterable, Iterator, List, NoReturn, Optional, Tuple, Union
+
+from .paginator import Paginator
+
+__all__: Tuple[str]
+
+
+class LazyPaginator(Paginator):
+    _buffer_type: type
+    _source: Iterator
+    _exhausted: bool
+    objects: List[Any]
+
+    def __init__(self, objects: Iterable, starting_index: int = ..., on_end_error: bool = ...) -> None: ...
+
+    def _pull(self, index: int) -> bool: ...
+
+    def _extend(self, objects: Iterable) -> None: ...
+
+    @property
+    def _count(self) -> int: ...
+
+    def take_next(self, count: int = ...) -> List: ...
+
+    def window(self, radius: int = ...) -> List[Any]: ...
+
+    def _state_length(self) -> int: ...
+
+    def _resolve_cond(self, cond: Union[Callable[[Any], bool], str]) -> Callable[[Any], bool]: ...
+
+    def cursor(self) -> NoReturn: ...
+
+    def __iter__(self) -> Iterator: ...
+
+    @property
+    def is_exhausted(self) -> bool: ...
+
+
+class OutOfWindowError(IndexError): ...
+
+
+class StreamingPaginator(LazyPaginator):
+    _offset: int
+    _sizes: Deque[int]
+    _bytes: int
+    objects: Deque[Any]
+    window_size: Optional[int]
+    window_bytes: Optional[int]
+    source_factory: Optional[Callable[[], Iterable]]
+
+    def __init__(self, objects: Iterable, starting_index: int = ..., on_end_error: bool = ...,
+                 window_size: Optional[int] = ..., window_bytes: Optional[int] = ...,
+                 source_factory: Optional[Callable[[], Iterable]] = ...) -> None: ...
+
+    def _rewind(self, index: int) -> None: ...
+
+    def _value_at(self, index: int) -> Any: ...
+
+    def __len__(self) -> int: ...
@@ -0,0 +1,139 @@
+from collections import OrderedDict
+
+__all__ = 'PredicateCache',
+
+CACHE_SIZE = 1 << 16
+
+
+class PredicateCache:
+    """
+    Cache of the results of conditions, keyed by the condition and the index of the object it was checked against,
+    so that searching over the same objects again does not check the same objects again.
+
+    The conditions are told apart by their identity, so the same function has to be passed
+    on every search for its results to be reused, and not a new lambda each time.
+    The least recently used results are evicted once there are more than max_size of them.
+
+    Attributes
+    ----------
+    max_size : int
+        The maximum number of results which are kept.
+    hits : int
+        The number of checks which were answered from the cache.
+    misses : int
+        The number of checks which had to call the condition.
+    """
+
+    def __init__(self, max_size=CACHE_SIZE):
+        """
+        Creates a new empty PredicateCache.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum number of results which are kept.
+        """
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._conds = {}
+
+    def check(self, cond, index, value):
+        """
+        Returns the result of the condition for the object at the given index,
+        calling the condition only if its result is not cached.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition which is checked.
+        index : int
+            The index of the object.
+        value : Any
+            The object at the index.
+
+        Returns
+        -------
+        result : Any
+            The result of the condition.
+        """
+        key = cond, index
+        results = self._results
+        try:
+            result = results[key]
+        except KeyError:
+            self.misses += 1
+            result = results[key] = cond(value)
+            self._conds[cond] = self._conds.get(cond, 0) + 1
+            if len(results) > self.max_size:
+                self._forget(*results.popitem(last=False)[0])
+            return result
+        self.hits += 1
+        results.move_to_end(key)
+        return result
+
+    def bind(self, cond, paginator):
+        """
+        Returns a condition which checks the given condition through the cache,
+        using the current index of the given Paginator as the index of the object.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition which is checked.
+        paginator : BasePaginator
+            The Paginator whose index is used.
+
+        Returns
+        -------
+        cond : Callable
+            The cached condition.
+        """
+        check = self.check
+        return lambda value: check(cond, paginator.index, value)
+
+    def _forget(self, cond, index):
+        """
+        Forgets that a result of the condition is cached, after it has been removed.
+        """
+        count = self._conds[cond] - 1
+        if count:
+            self._conds[cond] = count
+        else:
+            del self._conds[cond]
+
+    def invalidate(self, index=None, cond=None):
+        """
+        Removes the cached results for the object at the given index, or of the given condition,
+        or every cached result if neither are given.
+
+        Parameters
+        ----------
+        index : int, optional
+            The index of the object which was changed.
+        cond : Callable, optional
+            The condition whose results are removed.
+        """
+        if index is None and cond is None:
+            self._results.clear()
+            self._conds.clear()
+            return
+        if index is None:
+            keys = [key for key in self._results if key[0] == cond]
+        else:
+            keys = [(cond, index)] if cond is not None else [(known, index) for known in self._conds]
+        for key in keys:
+            if key in self._results:
+                del self._results[key]
+                self._forget(*key)
+
+    def __len__(self):
+        return len(self._results)
+
+    @property
+    def stats(self):
+        """
+        Returns the number of hits and misses, and the number of results which are cached.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._results), 'max_size': self.max_size}
@@ -0,0 +1,31 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .paginator import BasePaginator
+
+__all__: Tuple[str]
+
+CACHE_SIZE: int
+
+
+class PredicateCache:
+    max_size: int
+    hits: int
+    misses: int
+    _results: OrderedDict[Tuple[Callable[[Any], Any], int], Any]
+    _conds: Dict[Callable[[Any], Any], int]
+
+    def __init__(self, max_size: int = ...) -> None: ...
+
+    def check(self, cond: Callable[[Any], Any], index: int, value: Any) -> Any: ...
+
+    def bind(self, cond: Callable[[Any], Any], paginator: BasePaginator) -> Callable[[Any], Any]: ...
+
+    def _forget(self, cond: Callable[[Any], Any], index: int) -> None: ...
+
+    def invalidate(self, index: Optional[int] = ..., cond: Optional[Callable[[Any], Any]] = ...) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    @property
+    def stats(self) -> Dict[str, int]: ...
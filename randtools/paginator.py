@@ -1,47 +1,166 @@
+import struct
+from bisect import bisect_left, bisect_right
 from collections.abc import Callable, Iterable
+from hashlib import blake2b
+from itertools import chain, islice
+
+from .events import PaginatorEvents, observed
+from .indexes import IndexedCondition, KeyIndex, RunIndex, TextIndex, _Keys, words
+from .memo import CACHE_SIZE, PredicateCache
+from .parallelize import _Negation, find_parallel, parallel, supports_parallel
+from .stats import PaginatorStats, instrumented
+from .vectorize import find_index, supports_vectorized, vectorized
 
 Callable: Callable
 
-__all__ = 'Paginator',
+__all__ = 'BasePaginator', 'Paginator', 'Cursor', 'dump_states', 'load_states'
+
+STATE_VERSION = 1
+STATE = struct.Struct('<BBIqqQ')
+STATE_MODES = {False: 0, True: 1, None: 2}
+STATE_END_ERRORS = False, True, None
 
 
-class Paginator:
+def _negate(cond):
     """
-    Class which is used for pagination of objects.
+    Returns the negation of the given condition, keeping vectorized and parallel conditions as they are.
+    """
+    if isinstance(cond, (vectorized, parallel, IndexedCondition)):
+        return ~cond
+    return _Negation(cond)
 
-    Attributes
+
+def _uncached_check(cond, index, value):
+    """
+    Checks the condition against the value, in the same way as PredicateCache.check but without a cache.
+    """
+    return cond(value)
+
+
+def _shared(name):
+    """
+    Returns a property which reads and writes the attribute of the store of a Cursor.
+    """
+    return property(lambda self: getattr(self.store, name), lambda self, value: setattr(self.store, name, value))
+
+
+def _state_token(token):
+    """
+    Converts the identity or version token of a source into an unsigned 64 bit integer,
+    str and bytes tokens are hashed so that they are the same in every process.
+    """
+    if token is None:
+        return 0
+    if isinstance(token, str):
+        token = token.encode()
+    if isinstance(token, bytes):
+        return int.from_bytes(blake2b(token, digest_size=8).digest(), 'little')
+    return token & 0xFFFFFFFFFFFFFFFF
+
+
+def _restore_featured(cls, state):
+    """
+    Recreates a pickled Paginator of the given class from its state,
+    and changes its class to the subclass which has the features that were enabled.
+    """
+    paginator = cls.__new__(cls)
+    if isinstance(state, tuple):
+        state, slots = state
+        for name, value in (slots or {}).items():
+            setattr(paginator, name, value)
+    if state:
+        paginator.__dict__.update(state)
+    paginator._refresh_class()
+    return paginator
+
+
+def _unpack_state(fields):
+    """
+    Checks the version of the unpacked fields of a state, and returns the fields without it.
+    """
+    version, mode, page_size, index, length, token = fields
+    if version != STATE_VERSION or mode >= len(STATE_END_ERRORS):
+        raise ValueError(f"The state has version {version}, but only version {STATE_VERSION} can be loaded")
+    return STATE_END_ERRORS[mode], page_size or None, index, length, token
+
+
+def dump_states(paginators, token=None):
+    """
+    Dumps the states of many Paginators into a single byte string, see BasePaginator.dump_state.
+
+    Parameters
     ----------
-    index : int
-        The current index of the Paginator.
-    objects : Iterable
-        The objects on which the Paginator is iterating.
+    paginators : Iterable
+        The Paginators whose states are dumped.
+    token : int or str or bytes, optional
+        The identity or version token of the source of the Paginators.
+
+    Returns
+    -------
+    states : bytes
+        The states of the Paginators, one after another.
     """
+    token = _state_token(token)
+    states = bytearray()
+    for paginator in paginators:
+        states += paginator._pack_state(token)
+    return bytes(states)
 
-    # TODO -> Add generator support
-    def __init__(self, objects, starting_index=0, on_end_error=False, convert_to_list=False):
-        """
-        Creates a new Paginator object with the given parameters.
 
-        Parameters
-        ----------
-        objects : Iterable
-            The objects on which the Paginator should iterate.
-        starting_index : int
-            The index where the pagination should start.
-        on_end_error : bool
-            If its True, then it raises error if the index exceeds the limits.
-            If its False, then if index exceeds the limit, it is set back to the limit.
-            If its None, then it wraps the index around the limits.
-        convert_to_list: bool
-            Whether objects should be converted to a list (needed for generators).
-        """
-        if convert_to_list:
-            objects = list(objects)
-        self.objects = objects
-        self.on_end_error = on_end_error
-        self._index = 0
+def load_states(states, store, token=None):
+    """
+    Loads the states dumped by dump_states into new Cursors over the given Paginator,
+    see BasePaginator.load_state.
 
-        self.index = starting_index
+    Parameters
+    ----------
+    states : bytes
+        The states of the Paginators, one after another.
+    store : BasePaginator
+        The Paginator whose objects, indexes and settings are shared by the Cursors.
+    token : int or str or bytes, optional
+        The identity or version token of the source, which is compared with the dumped one.
+
+    Returns
+    -------
+    cursors : list
+        The Cursors at the dumped indexes.
+
+    Raises
+    ------
+    ValueError
+        If the states are not whole, or were dumped by an unknown version.
+    IndexError
+        If a Cursor had on_end_error set to True and its index is out of bounds of the objects.
+    """
+    if len(states) % STATE.size:
+        raise ValueError(f"The states must be a multiple of {STATE.size} bytes, but were {len(states)} bytes")
+    store = store.store
+    token = _state_token(token)
+    length = store._state_length()
+    cursors = []
+    for fields in STATE.iter_unpack(states):
+        cursor = Cursor.__new__(store._feature_class(Cursor))
+        cursor.store = store
+        cursor._index = 0
+        cursor._restore_state(_unpack_state(fields), length, token)
+        cursors.append(cursor)
+    return cursors
+
+
+class BasePaginator:
+    """
+    Base class of the Paginators, which implements the navigation over the objects.
+
+    It has no attributes of its own, so that its subclasses can keep their state in
+    their own attributes or __slots__, or share it with another Paginator.
+    Searches loop over the indexes directly, subclasses whose objects can not be
+    indexed up to their length set _scannable to False to step through them one at a time instead.
+    """
+
+    __slots__ = ()
+
+    _scannable = True
 
     @property
     def index(self):
@@ -52,12 +171,23 @@ class Paginator:
         it raises IndexError if on_end_error is True and the index goes out of bounds,
         otherwise if its False, it sets the index back to the limit if it exceeds it,
         otherwise if its None, it wraps the index around the limits.
+        If the objects can not be counted, then an index at which an object exists is set
+        without finding the number of objects, which is only found when the index goes past the end.
         """
         return self._index
 
     @index.setter
     def index(self, value):
-        length = self.length
+        length = self._length
+        if length is None:
+            length = self._count_objects()
+            if length is None:
+                if self.page_size is None and value >= 0 and self._probe(value):
+                    self._index = value
+                    return
+                length = self._length = self._probe_length()
+        if self.page_size is not None:
+            length = -(-length // self.page_size)
         if self.on_end_error and not 0 <= value < length:
             raise IndexError(f"There are only {length} objects, but tried to set index as {value}")
         if self.on_end_error is None:
@@ -69,8 +199,56 @@ class Paginator:
     def value(self):
         """
         Returns the object at the current index of the Paginator.
+
+        If the Paginator is iterating over pages, then it returns the objects in the current page.
+        """
+        return self._value_at(self.index)
+
+    def _value_at(self, index):
+        """
+        Returns the object or page at the given index.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object or page.
+
+        Returns
+        -------
+        value : Any
+            The object or page at the given index.
+        """
+        if self.page_size is None:
+            return self.objects[index]
+        start = index * self.page_size
+        return self.objects[start:start + self.page_size]
+
+    def window(self, radius=1):
+        """
+        Returns the objects around the current index of the Paginator,
+        without changing the index.
+
+        The window is cut off at the limits, unless on_end_error is None,
+        in which case it wraps around the limits.
+
+        Parameters
+        ----------
+        radius : int
+            The number of objects to include on either side of the current index.
+
+        Returns
+        -------
+        values : list
+            The objects (or pages) from index - radius to index + radius.
         """
-        return self.objects[self.index]
+        index, length = self.index, self.length
+        if self.on_end_error is None:
+            count = min(2 * radius + 1, length)
+            return [self._value_at((index - radius + offset) % length) for offset in range(count)]
+        start, stop = max(0, index - radius), min(length, index + radius + 1)
+        if self.page_size is None:
+            return list(self.objects[start:stop])
+        return [self._value_at(page) for page in range(start, stop)]
 
     def next(self, count=1):
         """
@@ -95,8 +273,12 @@ class Paginator:
 
         Parameters
         ----------
-        cond : Callable
-            The condition at which it will stop incrementing.
+        cond : Callable or str
+            The condition at which it will stop incrementing,
+            or the name of an index added with add_index.
+            If its a vectorized condition and the objects are a NumPy array,
+            then the objects are checked in whole chunks at once.
+            If its a parallel or lookahead condition, then the objects are checked in a pool.
         stepper : Callable, optional
             The function which is used to increment the index.
 
@@ -105,14 +287,146 @@ class Paginator:
         value : Any
             The object at this new index.
         """
-        original_index = self.index
+        cond = self._resolve_cond(cond)
         if stepper is None:
-            def stepper(obj):
-                if obj.on_end_error is not None and obj.is_at_end:
-                    raise StopIteration('End of Iteration')
+            return self._search(cond, True)
+        return self._until(cond, stepper)
+
+    def _search(self, cond, forward):
+        """
+        Moves the index one object at a time in the given direction until the condition is met,
+        using the fastest search which the condition and the objects support.
+
+        Parameters
+        ----------
+        cond : Callable
+            The condition at which it will stop.
+        forward : bool
+            Whether the index is incremented or decremented.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        StopIteration
+            If no object meets the condition.
+        """
+        if self.page_size is None:
+            if isinstance(cond, IndexedCondition):
+                return self._jump_to(self._find_in_index(cond.index, cond.truth, forward), forward)
+            if supports_vectorized(self.objects, cond):
+                found = find_index(self.objects, cond, self.index, forward, self.on_end_error is None)
+                return self._jump_to(found, forward)
+            if supports_parallel(self.objects, cond):
+                found = find_parallel(self.objects, cond, self.index, forward, self.on_end_error is None)
+                return self._jump_to(found, forward)
+        if self._scannable:
+            return self._jump_to(self._scan(cond, forward), forward)
+        return self._until(cond, self._stepper(forward))
+
+    def _candidates(self, forward):
+        """
+        Returns the indexes which the index passes through when moved one at a time in the given direction,
+        in order, so the loops over them do not have to check the limits on every step.
+
+        If on_end_error is None, then they wrap around the limits and end at the current index,
+        otherwise they end at the limit.
+        """
+        index, length = self._index, self.length
+        if self.on_end_error is not None:
+            return range(index + 1, length) if forward else range(index - 1, -1, -1)
+        if not length:
+            return range(0)
+        if forward:
+            return chain(range(index + 1, length), range(index + 1))
+        return chain(range(index - 1, -1, -1), range(length - 1, index - 1, -1))
+
+    def _value_getter(self):
+        """
+        Returns the function which gets the object or page at an index.
+        """
+        return self.objects.__getitem__ if self.page_size is None else self._value_at
+
+    def _scan(self, cond, forward):
+        """
+        Finds the index of the first object in the given direction which meets the condition.
+
+        Returns
+        -------
+        index : int, optional
+            The index of the object which met the condition, or None if no object met it.
+        """
+        value_at = self._value_getter()
+        if self.predicate_cache is None:
+            for index in self._candidates(forward):
+                if cond(value_at(index)):
+                    return index
+        else:
+            check = self.predicate_cache.check
+            for index in self._candidates(forward):
+                if check(cond, index, value_at(index)):
+                    return index
+        return None
+
+    def _step_scan(self, cond, forward):
+        """
+        Moves the index one object at a time in the given direction,
+        yielding the object at each new index until the condition is met.
+        """
+        if self.page_size is None and self.predicate_cache is None:
+            objects = self.objects
+            for index in self._candidates(forward):
+                value = objects[index]
+                met = cond(value)
+                self._index = index
+                yield value
+                if met:
+                    return
+        else:
+            value_at = self._value_getter()
+            check = _uncached_check if self.predicate_cache is None else self.predicate_cache.check
+            for index in self._candidates(forward):
+                value = value_at(index)
+                met = check(cond, index, value)
+                self._index = index
+                yield value
+                if met:
+                    return
+        self._search_exhausted()
+
+    def _search_exhausted(self):
+        """
+        Called when a step search ends without any object meeting the condition.
+        """
+
+    def _stepper(self, forward):
+        """
+        Returns the function which moves the index by one in the given direction,
+        which raises StopIteration at the limits and GeneratorExit when it comes back to the current index.
+        """
+        original_index = self.index
+
+        def stepper(obj):
+            if obj.on_end_error is not None and (obj.is_at_end if forward else obj.index == 0):
+                raise StopIteration('End of Iteration')
+            if forward:
                 obj.next()
-                if obj.index == original_index:
-                    raise GeneratorExit('Last value of Iteration')
+            else:
+                obj.prev()
+            if obj.index == original_index:
+                raise GeneratorExit('Last value of Iteration')
+
+        return stepper
+
+    def _until(self, cond, stepper):
+        """
+        Moves the index with the given stepper until the condition is met.
+        """
+        if self.predicate_cache is not None:
+            cond = self.predicate_cache.bind(cond, self)
         while True:
             try:
                 stepper(self)
@@ -124,14 +438,75 @@ class Paginator:
                 break
         return self.value
 
+    def _jump_to(self, found, forward):
+        """
+        Moves the index straight to an index which was found by searching ahead,
+        behaving as if the index was incremented (or decremented) one at a time.
+
+        Parameters
+        ----------
+        found : int, optional
+            The index of the object which met the condition, or None if no object met it.
+        forward : bool
+            Whether the index is incremented or decremented.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        StopIteration
+            If no object met the condition.
+        """
+        if found is None:
+            if self.on_end_error is not None:
+                self.index = self.length - 1 if forward else 0
+            raise StopIteration('End of Iteration')
+        self.index = found
+        return self.value
+
+    def _step_to(self, found, forward):
+        """
+        Moves the index one at a time to an index which was found by searching ahead,
+        yielding the object at each new index.
+
+        Parameters
+        ----------
+        found : int, optional
+            The index of the object which met the condition, or None if no object met it.
+        forward : bool
+            Whether the index is incremented or decremented.
+
+        Yields
+        -------
+        value : Any
+            The object at the each new index.
+        """
+        index, length = self.index, self.length
+        step = 1 if forward else -1
+        if found is not None:
+            count = (found - index) * step % length or length
+        elif self.on_end_error is None:
+            count = length
+        else:
+            count = length - 1 - index if forward else index
+        for _ in range(count):
+            self.index += step
+            yield self.value
+        if found is None:
+            self._search_exhausted()
+
     def next_while_cond(self, cond, stepper=None):
         """
         Increments the index while the specified condition is met.
 
         Parameters
         ----------
-        cond : Callable
-            The condition that is checked to continue incrementing.
+        cond : Callable or str
+            The condition that is checked to continue incrementing,
+            or the name of an index added with add_index.
         stepper : Callable, optional
             The function which is used to increment the index.
 
@@ -140,7 +515,7 @@ class Paginator:
         value : Any
             The object at this new index.
         """
-        return self.next_until_cond(lambda value: not cond(value), stepper)
+        return self.next_until_cond(_negate(self._resolve_cond(cond)), stepper)
 
     def prev(self, count=1):
         """
@@ -164,8 +539,12 @@ class Paginator:
 
         Parameters
         ----------
-        cond : Callable
-            The condition at which it will stop decrementing.
+        cond : Callable or str
+            The condition at which it will stop decrementing,
+            or the name of an index added with add_index.
+            If its a vectorized condition and the objects are a NumPy array,
+            then the objects are checked in whole chunks at once.
+            If its a parallel or lookahead condition, then the objects are checked in a pool.
         stepper : Callable, optional
             The function which is used to decrement the index.
 
@@ -174,15 +553,10 @@ class Paginator:
         value : Any
             The object at this new index.
         """
-        original_index = self.index
+        cond = self._resolve_cond(cond)
         if stepper is None:
-            def stepper(obj):
-                if obj.on_end_error is not None and obj.index == 0:
-                    raise StopIteration('End of Iteration')
-                obj.prev()
-                if obj.index == original_index:
-                    raise GeneratorExit('Last value of Iteration')
-        return self.next_until_cond(cond, stepper)
+            return self._search(cond, False)
+        return self._until(cond, stepper)
 
     def prev_while_cond(self, cond, stepper=None):
         """
@@ -190,8 +564,9 @@ class Paginator:
 
         Parameters
         ----------
-        cond : Callable
-            The condition that is checked to continue decrementing.
+        cond : Callable or str
+            The condition that is checked to continue decrementing,
+            or the name of an index added with add_index.
         stepper : Callable, optional
             The function which is used to decrement the index.
 
@@ -200,7 +575,7 @@ class Paginator:
         value : Any
             The object at this new index.
         """
-        return self.prev_until_cond(lambda value: not cond(value), stepper)
+        return self.prev_until_cond(_negate(self._resolve_cond(cond)), stepper)
 
     def step_next(self, count=1):
         """
@@ -219,13 +594,19 @@ class Paginator:
             The object at the each new index.
         """
         step = 1 if count > 0 else -1
+        if self._scannable:
+            value_at = self._value_getter()
+            for index in islice(self._candidates(step > 0), abs(count)):
+                self._index = index
+                yield value_at(index)
+            return
         original_index = self.index
 
         for _ in range(abs(count)):
             if self.on_end_error is not None:
-                if self.is_at_start and step < 0:
+                if step < 0 and self.is_at_start:
                     return
-                if self.is_at_end and step > 0:
+                if step > 0 and self.is_at_end:
                     return
             yield self.next(step)
             if self.index == original_index:
@@ -249,6 +630,75 @@ class Paginator:
         """
         return self.step_next(-count)
 
+    def take_next(self, count=1):
+        """
+        Increments the index by the given amount in one go,
+        and returns the objects that step_next would have yielded.
+
+        Parameters
+        ----------
+        count : int
+            The number of times to increment the index.
+
+        Returns
+        -------
+        values : list
+            The object at each index which was passed.
+        """
+        index, length = self.index, self.length
+        if self.on_end_error is None:
+            steps = min(abs(count), length)
+        elif count >= 0:
+            steps = min(count, length - 1 - index)
+        else:
+            steps = min(-count, index)
+        if steps <= 0:
+            return []
+
+        step = 1 if count > 0 else -1
+        if self.page_size is None:
+            values = self._slice(index + step, index + step * (steps + 1), step)
+        else:
+            values = [self._value_at(page % length) for page in range(index + step, index + step * (steps + 1), step)]
+        self.index = index + step * steps
+        return values
+
+    def take_prev(self, count=1):
+        """
+        Decrements the index by the given amount in one go,
+        and returns the objects that step_prev would have yielded.
+
+        Parameters
+        ----------
+        count : int
+            The number of times to decrement the index.
+
+        Returns
+        -------
+        values : list
+            The object at each index which was passed.
+        """
+        return self.take_next(-count)
+
+    def _slice(self, start, stop, step):
+        """
+        Returns the objects from start up to stop (or down to stop if step is negative),
+        wrapping around the limits at most once.
+        """
+        objects, length = self.objects, self._object_count()
+        if step > 0:
+            if start >= length:
+                start, stop = start - length, stop - length
+            if stop <= length:
+                return list(objects[start:stop])
+            return list(objects[start:]) + list(objects[:stop - length])
+        low, high = stop + 1, start + 1
+        if high <= 0:
+            low, high = low + length, high + length
+        if low >= 0:
+            return list(objects[low:high][::-1])
+        return list(objects[:high][::-1]) + list(objects[low + length:][::-1])
+
     def step_next_until_cond(self, cond, stepper=None):
         """
         Increments the index by the 1 and yields the object
@@ -257,8 +707,9 @@ class Paginator:
 
         Parameters
         ----------
-        cond : Callable
-            The condition at which it will stop incrementing.
+        cond : Callable or str
+            The condition at which it will stop incrementing,
+            or the name of an index added with add_index.
         stepper : Callable, optional
             The function which is used to increment the index.
 
@@ -267,19 +718,38 @@ class Paginator:
         value : Any
             The object at the each new index.
         """
-        original_index = self.index
+        cond = self._resolve_cond(cond)
         if stepper is None:
-            def stepper(obj):
-                if obj.on_end_error is not None and obj.is_at_end:
-                    raise StopIteration('End of Iteration')
-                obj.next()
-                if obj.index == original_index:
-                    raise GeneratorExit('Last value of Iteration')
+            yield from self._step_search(cond, True)
+        else:
+            yield from self._step_until(cond, stepper)
 
+    def _step_search(self, cond, forward):
+        """
+        Moves the index one object at a time in the given direction, yielding the object at each new index
+        until the condition is met, using the fastest search which the condition and the objects support.
+        """
+        if self.page_size is None:
+            if isinstance(cond, IndexedCondition):
+                return self._step_to(self._find_in_index(cond.index, cond.truth, forward), forward)
+            if supports_parallel(self.objects, cond):
+                found = find_parallel(self.objects, cond, self.index, forward, self.on_end_error is None)
+                return self._step_to(found, forward)
+        if self._scannable:
+            return self._step_scan(cond, forward)
+        return self._step_until(cond, self._stepper(forward))
+
+    def _step_until(self, cond, stepper):
+        """
+        Moves the index with the given stepper, yielding the object at each new index until the condition is met.
+        """
+        if self.predicate_cache is not None:
+            cond = self.predicate_cache.bind(cond, self)
         while True:
             try:
                 stepper(self)
             except StopIteration:
+                self._search_exhausted()
                 return
             except GeneratorExit:
                 break
@@ -299,8 +769,9 @@ class Paginator:
 
         Parameters
         ----------
-        cond : Callable
-            The condition that is checked to continue incrementing.
+        cond : Callable or str
+            The condition that is checked to continue incrementing,
+            or the name of an index added with add_index.
         stepper : Callable, optional
             The function which is used to increment the index.
 
@@ -309,7 +780,7 @@ class Paginator:
         value : Any
             The object at the each new index.
         """
-        return self.step_next_until_cond(lambda value: not cond(value), stepper)
+        return self.step_next_until_cond(_negate(self._resolve_cond(cond)), stepper)
 
     def step_prev_until_cond(self, cond, stepper=None):
         """
@@ -319,8 +790,9 @@ class Paginator:
 
         Parameters
         ----------
-        cond : Callable
-            The condition at which it will stop decrementing.
+        cond : Callable or str
+            The condition at which it will stop decrementing,
+            or the name of an index added with add_index.
         stepper : Callable, optional
             The function which is used to decrement the index.
 
@@ -329,15 +801,10 @@ class Paginator:
         value : Any
             The object at the each new index.
         """
-        original_index = self.index
+        cond = self._resolve_cond(cond)
         if stepper is None:
-            def stepper(obj):
-                if obj.on_end_error is not None and obj.index == 0:
-                    raise StopIteration('End of Iteration')
-                obj.prev()
-                if obj.index == original_index:
-                    raise GeneratorExit('Last value of Iteration')
-        return self.step_next_until_cond(cond, stepper)
+            return self._step_search(cond, False)
+        return self._step_until(cond, stepper)
 
     def step_prev_while_cond(self, cond, stepper=None):
         """
@@ -347,8 +814,9 @@ class Paginator:
 
         Parameters
         ----------
-        cond : Callable
-            The condition that is checked to continue decrementing.
+        cond : Callable or str
+            The condition that is checked to continue decrementing,
+            or the name of an index added with add_index.
         stepper : Callable, optional
             The function which is used to decrement the index.
 
@@ -357,74 +825,345 @@ class Paginator:
         value : Any
             The object at the each new index.
         """
-        return self.step_prev_until_cond(lambda value: not cond(value), stepper)
+        return self.step_prev_until_cond(_negate(self._resolve_cond(cond)), stepper)
 
-    def goto_next_non_empty(self):
+    def build_empty_index(self):
         """
-        Increments the index until the object at the
-        current index of the Paginator, is a truthful value.
+        Builds an index of the runs of empty and non-empty objects,
+        which is then used by the goto_* and step_to_* methods to jump in O(log n).
+
+        Objects appended to the Paginator are indexed automatically,
+        but update_empty_index must be called when an object is changed.
 
         Returns
         -------
-        value : Any
-            The object at this new index.
+        empty_index : RunIndex
+            The index that was built.
         """
-        return self.next_until_cond(lambda value: value)
+        self._require_scannable('the empty index')
+        if self.page_size is not None:
+            raise ValueError("The empty index can not be built when iterating over pages")
+        self.empty_index = RunIndex(self.objects)
+        return self.empty_index
 
-    def goto_next_empty(self):
+    def _require_scannable(self, feature):
         """
-        Increments the index until the object at the
-        current index of the Paginator, is a falsy value.
-
-        Returns
-        -------
-        value : Any
-            The object at this new index.
+        Raises TypeError if the objects can not be indexed up to their length, which the given feature needs.
         """
-        return self.next_while_cond(lambda value: value)
+        if not self._scannable:
+            raise TypeError(f"{type(self).__name__} does not support {feature}, as its objects can not be indexed")
 
-    def goto_prev_non_empty(self):
+    def update_empty_index(self, index=None):
         """
-        Decrements the index until the object at the
-        current index of the Paginator, is a truthful value.
+        Updates the index of empty and non-empty objects.
 
-        Returns
-        -------
-        value : Any
-            The object at this new index.
+        Parameters
+        ----------
+        index : int, optional
+            The index of the object which was changed,
+            if its not given then the whole index is rebuilt.
         """
-        return self.prev_until_cond(lambda value: value)
+        if index is None:
+            self.empty_index.rebuild()
+        else:
+            self.empty_index.update(index)
 
-    def goto_prev_empty(self):
+    def build_text_index(self, extract=str, tokenize=words, background=False):
         """
-        Decrements the index until the object at the
-        current index of the Paginator, is a falsy value.
+        Builds an inverted index of the tokens in the text of the objects,
+        which is then used by find_next and find_prev to find the objects containing a query in O(log n).
+
+        Objects appended to the Paginator are indexed automatically,
+        but update_text_index must be called when an object is changed.
+
+        Parameters
+        ----------
+        extract : Callable
+            The function which returns the text of an object, such as lambda message: message.text.
+        tokenize : Callable
+            The function which splits a text into its tokens, by default its casefolded words.
+        background : bool
+            Whether the index is built in a background thread, the first search waits for it to be done.
 
         Returns
         -------
-        value : Any
-            The object at this new index.
+        text_index : TextIndex
+            The index that was built.
         """
-        return self.prev_while_cond(lambda value: value)
+        self._require_scannable('the text index')
+        if self.page_size is not None:
+            raise ValueError("The text index can not be built when iterating over pages")
+        self.text_index = TextIndex(self.objects, extract, tokenize, background)
+        return self.text_index
 
-    def step_to_next_non_empty(self):
+    def update_text_index(self, index=None):
         """
-        Increments the index by the 1 and yields the object
-        at the current index of the paginator,
-        until the object at the current index
-        of the Paginator, is a truthful value.
+        Updates the inverted index of the tokens in the text of the objects.
 
-        Yields
-        -------
-        value : Any
-            The object at the each new index.
+        Parameters
+        ----------
+        index : int, optional
+            The index of the object which was changed,
+            if its not given then the whole index is rebuilt.
         """
-        return self.step_next_until_cond(lambda value: value)
+        if index is None:
+            self.text_index.rebuild()
+        else:
+            self.text_index.update(index)
 
-    def step_to_next_empty(self):
+    def add_index(self, name, cond):
         """
-        Increments the index by the 1 and yields the object
-        at the current index of the paginator,
+        Adds a named index of the objects which do and do not meet the given condition.
+
+        The name can then be given as the condition to the *_until_cond and *_while_cond methods,
+        which use the index to jump in O(log n) instead of checking every object.
+        Objects appended to the Paginator are indexed automatically,
+        but update_indexes or invalidate_indexes must be called when objects are changed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the index.
+        cond : Callable
+            The condition which the objects are indexed by.
+
+        Returns
+        -------
+        index : RunIndex
+            The index that was built.
+        """
+        self._require_scannable('indexes')
+        if self.page_size is not None:
+            raise ValueError("Indexes can not be built when iterating over pages")
+        self.indexes[name] = RunIndex(self.objects, cond)
+        return self.indexes[name]
+
+    def remove_index(self, name):
+        """
+        Removes the index with the given name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the index.
+        """
+        del self.indexes[name]
+
+    def add_key_index(self, name, key=None):
+        """
+        Adds a named index of the keys of the objects, which must be sorted by them.
+
+        The name can then be given as the key to seek and seek_prev,
+        which bisect the cached keys instead of calling the key function on every seek.
+        Objects appended to the Paginator are indexed automatically,
+        but update_indexes or invalidate_indexes must be called when objects are changed.
+
+        Parameters
+        ----------
+        name : str
+            The name of the index.
+        key : Callable, optional
+            The function which returns the key of an object, if its None then the objects are their own keys.
+
+        Returns
+        -------
+        index : KeyIndex
+            The index that was built.
+        """
+        self._require_scannable('seeking')
+        self.key_indexes[name] = KeyIndex(self.objects, key)
+        return self.key_indexes[name]
+
+    def remove_key_index(self, name):
+        """
+        Removes the key index with the given name.
+
+        Parameters
+        ----------
+        name : str
+            The name of the index.
+        """
+        del self.key_indexes[name]
+
+    def _named_index(self, name):
+        """
+        Returns the index or key index with the given name.
+        """
+        return self.indexes[name] if name in self.indexes else self.key_indexes[name]
+
+    def update_indexes(self, index):
+        """
+        Updates every named index after the object at the given index has been changed,
+        and forgets the cached results of the conditions for it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the object which was changed.
+        """
+        for run_index in chain(self.indexes.values(), self.key_indexes.values()):
+            run_index.update(index)
+        if self.predicate_cache is not None:
+            self.predicate_cache.invalidate(index)
+
+    def invalidate_indexes(self, *names):
+        """
+        Marks the named indexes as stale, so that they are rebuilt the next time they are used.
+
+        Parameters
+        ----------
+        names : str
+            The names of the indexes, if none are given then every index is invalidated
+            and every cached result of the conditions is forgotten.
+        """
+        for name in names or chain(self.indexes, self.key_indexes):
+            self._named_index(name).invalidate()
+        if not names and self.predicate_cache is not None:
+            self.predicate_cache.invalidate()
+
+    def rebuild_indexes(self, *names):
+        """
+        Rebuilds the named indexes from all of the objects.
+
+        Parameters
+        ----------
+        names : str
+            The names of the indexes, if none are given then every index is rebuilt.
+        """
+        for name in names or chain(self.indexes, self.key_indexes):
+            self._named_index(name).rebuild()
+
+    def cache_predicates(self, max_size=CACHE_SIZE):
+        """
+        Caches the results of the conditions checked by the *_until_cond, *_while_cond and goto_* methods,
+        keyed by the condition and the index, so that searching again does not check the same objects again.
+
+        The same function has to be passed on every search for its results to be reused.
+        update_indexes or invalidate_indexes must be called when objects are changed,
+        or predicate_cache.invalidate can be called directly.
+
+        Parameters
+        ----------
+        max_size : int
+            The maximum number of results which are kept.
+
+        Returns
+        -------
+        predicate_cache : PredicateCache
+            The cache, which counts its hits and misses.
+        """
+        self.predicate_cache = PredicateCache(max_size)
+        return self.predicate_cache
+
+    def _resolve_cond(self, cond):
+        """
+        Returns the condition of the index with the given name,
+        or the condition itself if its not a name.
+        """
+        if isinstance(cond, str):
+            try:
+                return IndexedCondition(self.indexes[cond])
+            except KeyError:
+                raise KeyError(f"There is no index called {cond!r}, it must be added with add_index") from None
+        return cond
+
+    def _find_in_index(self, run_index, truth, forward):
+        """
+        Finds the index of the next (or previous) object which does or does not meet the condition of an index.
+
+        Parameters
+        ----------
+        run_index : RunIndex
+            The index which is searched.
+        truth : bool
+            Whether the object should meet the condition or not.
+        forward : bool
+            Whether the index is being incremented or decremented.
+
+        Returns
+        -------
+        index : int, optional
+            The index of the object which was found, or None if there is no such object.
+        """
+        run_index.sync()
+        return run_index.find(self.index, truth, forward, self.on_end_error is None)
+
+    def goto_next_non_empty(self):
+        """
+        Increments the index until the object at the
+        current index of the Paginator, is a truthful value.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        if self.empty_index is not None:
+            return self._jump_to(self._find_in_index(self.empty_index, True, True), True)
+        return self.next_until_cond(bool)
+
+    def goto_next_empty(self):
+        """
+        Increments the index until the object at the
+        current index of the Paginator, is a falsy value.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        if self.empty_index is not None:
+            return self._jump_to(self._find_in_index(self.empty_index, False, True), True)
+        return self.next_while_cond(bool)
+
+    def goto_prev_non_empty(self):
+        """
+        Decrements the index until the object at the
+        current index of the Paginator, is a truthful value.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        if self.empty_index is not None:
+            return self._jump_to(self._find_in_index(self.empty_index, True, False), False)
+        return self.prev_until_cond(bool)
+
+    def goto_prev_empty(self):
+        """
+        Decrements the index until the object at the
+        current index of the Paginator, is a falsy value.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        if self.empty_index is not None:
+            return self._jump_to(self._find_in_index(self.empty_index, False, False), False)
+        return self.prev_while_cond(bool)
+
+    def step_to_next_non_empty(self):
+        """
+        Increments the index by the 1 and yields the object
+        at the current index of the paginator,
+        until the object at the current index
+        of the Paginator, is a truthful value.
+
+        Yields
+        -------
+        value : Any
+            The object at the each new index.
+        """
+        if self.empty_index is not None:
+            return self._step_to(self._find_in_index(self.empty_index, True, True), True)
+        return self.step_next_until_cond(bool)
+
+    def step_to_next_empty(self):
+        """
+        Increments the index by the 1 and yields the object
+        at the current index of the paginator,
         until the object at the current index
         of the Paginator, is a falsy value.
 
@@ -433,7 +1172,9 @@ class Paginator:
         value : Any
             The object at the each new index.
         """
-        return self.step_next_while_cond(lambda value: value)
+        if self.empty_index is not None:
+            return self._step_to(self._find_in_index(self.empty_index, False, True), True)
+        return self.step_next_while_cond(bool)
 
     def step_to_prev_non_empty(self):
         """
@@ -447,7 +1188,9 @@ class Paginator:
         value : Any
             The object at the each new index.
         """
-        return self.step_prev_until_cond(lambda value: value)
+        if self.empty_index is not None:
+            return self._step_to(self._find_in_index(self.empty_index, True, False), False)
+        return self.step_prev_until_cond(bool)
 
     def step_to_prev_empty(self):
         """
@@ -461,7 +1204,9 @@ class Paginator:
         value : Any
             The object at the each new index.
         """
-        return self.step_prev_while_cond(lambda value: value)
+        if self.empty_index is not None:
+            return self._step_to(self._find_in_index(self.empty_index, False, False), False)
+        return self.step_prev_while_cond(bool)
 
     def set(self, value):
         """
@@ -487,6 +1232,146 @@ class Paginator:
         self.index = value
         return self.value
 
+    def seek(self, key_value, key=None):
+        """
+        Sets the index to the first object whose key is at or after the given key,
+        by bisecting the objects in O(log n), so they must be sorted by the key.
+
+        If no key is at or after it, then the index is set past the end,
+        which raises IndexError, stops at the end or wraps to the start depending on on_end_error.
+        If the Paginator is iterating over pages, then the index is set to the page of the object.
+
+        Parameters
+        ----------
+        key_value : Any
+            The key which is seeked.
+        key : Callable or str, optional
+            The function which returns the key of an object, which is only called for the objects that are bisected,
+            or the name of a key index added with add_key_index, whose cached keys are bisected instead.
+            If its None, then the objects are their own keys.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        IndexError
+            If on_end_error is set to True and no key is at or after the given key.
+        """
+        keys, length = self._seek_keys(key)
+        return self._seek_to(bisect_left(keys, key_value, 0, length), length)
+
+    def seek_prev(self, key_value, key=None):
+        """
+        Sets the index to the last object whose key is at or before the given key,
+        by bisecting the objects in O(log n), so they must be sorted by the key.
+
+        If no key is at or before it, then the index is set before the start,
+        which raises IndexError, stops at the start or wraps to the end depending on on_end_error.
+
+        Parameters
+        ----------
+        key_value : Any
+            The key which is seeked.
+        key : Callable or str, optional
+            The function which returns the key of an object,
+            or the name of a key index added with add_key_index, see seek.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        IndexError
+            If on_end_error is set to True and no key is at or before the given key.
+        """
+        keys, length = self._seek_keys(key)
+        return self._seek_to(bisect_right(keys, key_value, 0, length) - 1, length)
+
+    def _seek_keys(self, key):
+        """
+        Returns the sorted keys of the objects which are bisected by seek, and the number of objects.
+        """
+        self._require_scannable('seeking')
+        if isinstance(key, str):
+            try:
+                key_index = self.key_indexes[key]
+            except KeyError:
+                raise KeyError(f"There is no key index called {key!r}, it must be added with add_key_index") from None
+            key_index.sync()
+            return key_index.keys, len(key_index.keys)
+        length = self._object_count()
+        return (self.objects if key is None else _Keys(self.objects, key, length)), length
+
+    def find_next(self, query):
+        """
+        Increments the index to the nearest object which contains every token of the query,
+        using the text index to find it in O(log n) instead of checking every object.
+
+        Parameters
+        ----------
+        query : str
+            The text which is searched for, its split with the tokenizer of the text index.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        StopIteration
+            If no object contains the query.
+        """
+        return self._find_text(query, True)
+
+    def find_prev(self, query):
+        """
+        Decrements the index to the nearest object which contains every token of the query,
+        using the text index to find it in O(log n) instead of checking every object.
+
+        Parameters
+        ----------
+        query : str
+            The text which is searched for, its split with the tokenizer of the text index.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        StopIteration
+            If no object contains the query.
+        """
+        return self._find_text(query, False)
+
+    def _find_text(self, query, forward):
+        """
+        Moves the index to the nearest object in the given direction which contains the query.
+        """
+        if self.text_index is None:
+            raise ValueError("The text index must be built with build_text_index before searching it")
+        self.text_index.sync()
+        return self._jump_to(self.text_index.find(query, self.index, forward, self.on_end_error is None), forward)
+
+    def _seek_to(self, found, length):
+        """
+        Sets the index to the object which was found by seek, converting it to its page when iterating over pages.
+        """
+        if self.page_size is not None:
+            if found >= length:
+                found = self.length
+            elif found >= 0:
+                found //= self.page_size
+        self.index = found
+        return self.value
+
     @property
     def is_at_end(self):
         """
@@ -512,11 +1397,476 @@ class Paginator:
     def length(self):
         """
         Returns the number of objects in the Paginator.
+
+        If the Paginator is iterating over pages, then it returns the number of pages.
         """
-        return len(self.objects)
+        length = self._object_count()
+        if self.page_size is None:
+            return length
+        return -(-length // self.page_size)
+
+    @property
+    def length_hint(self):
+        """
+        Returns an estimate of the number of objects in the Paginator, without counting them.
+
+        If the number of objects is not known yet, then this is at least
+        the number of objects which are known to exist, or the __length_hint__ of the objects if they have one,
+        but their __len__ is not called since it might be what counts them.
+        """
+        if self._length is not None:
+            return self._length
+        hint = getattr(type(self.objects), '__length_hint__', None)
+        if hint is not None:
+            estimate = hint(self.objects)
+            if estimate is not NotImplemented:
+                return max(estimate, self._min_length)
+        return self._min_length
+
+    def refresh_length(self):
+        """
+        Forgets the cached number of objects, and counts them again.
+
+        Returns
+        -------
+        length : int
+            The number of objects in the Paginator.
+        """
+        self._length = None
+        self._min_length = 0
+        return self.length
+
+    def _count_objects(self):
+        """
+        Counts the objects with the count function or len, caching it if cache_length is True.
+
+        Returns
+        -------
+        length : int, optional
+            The number of objects, or None if it can not be counted.
+        """
+        if self.count is not None:
+            length = self.count(self.objects)
+        else:
+            try:
+                length = len(self.objects)
+            except TypeError:
+                return None
+        if self.cache_length and length is not None:
+            self._length = length
+        return length
+
+    def _object_count(self):
+        """
+        Returns the number of objects, finding it by probing if they can not be counted.
+        """
+        if self._length is not None:
+            return self._length
+        length = self._count_objects()
+        if length is None:
+            length = self._length = self._probe_length()
+        return length
+
+    def _probe(self, index):
+        """
+        Checks if an object exists at the given index, by trying to get it.
+
+        Parameters
+        ----------
+        index : int
+            The index which is checked.
+
+        Returns
+        -------
+        exists : bool
+            Whether an object exists at the given index.
+        """
+        try:
+            self.objects[index]
+        except IndexError:
+            return False
+        self._min_length = max(self._min_length, index + 1)
+        return True
+
+    def _probe_length(self):
+        """
+        Finds the number of objects by probing for the last object,
+        first doubling the index until it does not exist and then bisecting.
+        """
+        low = self._min_length
+        if not low and not self._probe(0):
+            return 0
+        high = max(low, 1) * 2
+        while self._probe(high - 1):
+            low, high = high, high * 2
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self._probe(middle - 1):
+                low = middle
+            else:
+                high = middle
+        return low
 
     def __len__(self):
         """
         Returns the number of objects in the Paginator.
         """
         return self.length
+
+    @property
+    def store(self):
+        """
+        Returns the Paginator which holds the objects, indexes and settings.
+        """
+        return self
+
+    def cursor(self):
+        """
+        Creates a lightweight Cursor at the current index, which shares the objects,
+        indexes and settings of this Paginator but moves independently of it.
+
+        Returns
+        -------
+        cursor : Cursor
+            The new cursor.
+        """
+        cursor = Cursor.__new__(self._feature_class(Cursor))
+        cursor.store = self.store
+        cursor._index = self._index
+        cursor.on_end_error = self.on_end_error
+        return cursor
+
+    def collect_stats(self, enabled=True):
+        """
+        Starts (or stops) counting the moves, steps, searches and condition calls of the Paginator,
+        and timing its methods, which costs nothing until its enabled.
+
+        The stats are shared with the Cursors of the Paginator which are created after its enabled.
+
+        Parameters
+        ----------
+        enabled : bool
+            Whether the stats are collected.
+
+        Returns
+        -------
+        stats : PaginatorStats, optional
+            The stats, which can be exported with as_dict.
+        """
+        if enabled:
+            if self.stats is None:
+                self.stats = PaginatorStats()
+        else:
+            self.stats = None
+        self._refresh_class()
+        return self.stats
+
+    def subscribe(self, listener, *events, coalesce=False, loop=None):
+        """
+        Adds a listener of the navigation events of the Paginator,
+        which are index_changed, wrapped, hit_start, hit_end and exhausted, see PaginatorEvents.
+        Sending the events costs nothing until a listener is added.
+
+        The listeners are shared with the Cursors of the Paginator which are created after its added.
+
+        Parameters
+        ----------
+        listener : Callable
+            The function which is called with each NavigationEvent, it can also be a coroutine function.
+        events : str
+            The names of the events, it defaults to every event.
+        coalesce : bool
+            If its True, then the listener gets one event of each name for each call of a step method,
+            instead of one for every step.
+        loop : asyncio.AbstractEventLoop, optional
+            The event loop which the coroutines are scheduled on, it defaults to the running event loop.
+
+        Returns
+        -------
+        listener : Callable
+            The listener, so that this can be used as a decorator.
+        """
+        if self.events is None:
+            self.events = PaginatorEvents()
+        self.events.subscribe(listener, *events, coalesce=coalesce, loop=loop)
+        self._refresh_class()
+        return listener
+
+    def unsubscribe(self, listener, *events):
+        """
+        Removes a listener of the navigation events of the Paginator.
+
+        Parameters
+        ----------
+        listener : Callable
+            The function which was subscribed.
+        events : str
+            The names of the events, it defaults to every event.
+        """
+        if self.events is not None:
+            self.events.unsubscribe(listener, *events)
+            self._refresh_class()
+
+    def _feature_class(self, cls):
+        """
+        Returns the subclass of the given class which sends events and collects stats, if they are enabled.
+        """
+        if self.events:
+            cls = observed(cls)
+        if self.stats is not None:
+            cls = instrumented(cls)
+        return cls
+
+    def _plain_class(self):
+        """
+        Returns the class of the Paginator without the subclasses which add the features.
+        """
+        cls = type(self)
+        while '_uninstrumented' in vars(cls) or '_unobserved' in vars(cls):
+            cls = vars(cls).get('_uninstrumented') or vars(cls)['_unobserved']
+        return cls
+
+    def _refresh_class(self):
+        """
+        Changes the class of the Paginator to the subclass which has the features that are enabled.
+        """
+        self.__class__ = self._feature_class(self._plain_class())
+
+    def _reduce_featured(self, protocol):
+        """
+        Pickles the Paginator as an instance of its plain class, since the subclasses which add the features
+        are created at runtime and may not exist in the process which loads it, which adds the features again.
+        """
+        state = object.__reduce_ex__(self, max(protocol, 2))[2]
+        return _restore_featured, (self._plain_class(), state)
+
+    def dump_state(self, token=None):
+        """
+        Dumps the index, on_end_error and page size of the Paginator into a small byte string,
+        along with the number of objects and a token identifying their source, but not the objects themselves.
+
+        Parameters
+        ----------
+        token : int or str or bytes, optional
+            The identity or version token of the source, such as its path or the version of its data.
+
+        Returns
+        -------
+        state : bytes
+            The state of the Paginator, which can be loaded with load_state.
+        """
+        return self._pack_state(_state_token(token))
+
+    def load_state(self, state, token=None):
+        """
+        Loads the state dumped by dump_state, moving the Paginator to the dumped index.
+
+        If the Paginator is iterating over pages of a different size than the dumped one,
+        then the index is converted to the page which holds the first object of the dumped page.
+        The source is stale if the token or the number of objects is different from the dumped one,
+        in which case the index may be out of bounds and is handled like any other index.
+
+        Parameters
+        ----------
+        state : bytes
+            The state dumped by dump_state.
+        token : int or str or bytes, optional
+            The identity or version token of the source, which is compared with the dumped one.
+
+        Returns
+        -------
+        fresh : bool
+            Whether the source is the same as the one the state was dumped from.
+
+        Raises
+        ------
+        ValueError
+            If the state is not a valid state, or was dumped by an unknown version.
+        IndexError
+            If the dumped on_end_error is True and the index is out of bounds of the objects.
+        """
+        if len(state) != STATE.size:
+            raise ValueError(f"The state must be {STATE.size} bytes, but was {len(state)} bytes")
+        fields = _unpack_state(STATE.unpack(state))
+        return self._restore_state(fields, self._state_length(), _state_token(token))
+
+    def _state_length(self):
+        """
+        Returns the number of objects if it can be found without probing, otherwise -1.
+        """
+        length = self._length
+        if length is None:
+            length = self._count_objects()
+        return -1 if length is None else length
+
+    def _pack_state(self, token):
+        """
+        Packs the state of the Paginator with the given converted token.
+        """
+        return STATE.pack(STATE_VERSION, STATE_MODES[self.on_end_error], self.page_size or 0, self._index,
+                          self._state_length(), token)
+
+    def _restore_state(self, fields, length, token):
+        """
+        Restores the unpacked fields of a state, given the current number of objects and the converted token.
+        """
+        on_end_error, page_size, index, dumped_length, dumped_token = fields
+        if page_size != self.page_size:
+            index = index * (page_size or 1) // (self.page_size or 1)
+        self.on_end_error = on_end_error
+        self.index = index
+        return dumped_token == token and (-1 in (length, dumped_length) or length == dumped_length)
+
+    def __iter__(self):
+        """
+        Iterates over the objects starting from the current index, without changing the index.
+
+        If on_end_error is None, then it wraps around the limits and
+        stops just before the current index, otherwise it stops at the end.
+        """
+        index, length = self.index, self.length
+        value_at = self.objects.__getitem__ if self.page_size is None else self._value_at
+        if self.on_end_error is None:
+            return chain(map(value_at, range(index, length)), map(value_at, range(index)))
+        return map(value_at, range(index, length))
+
+
+class Paginator(BasePaginator):
+    """
+    Class which is used for pagination of objects.
+
+    Attributes
+    ----------
+    index : int
+        The current index of the Paginator.
+    objects : Iterable
+        The objects on which the Paginator is iterating.
+    page_size : int, optional
+        The number of objects in each page, if the Paginator is iterating over pages.
+    empty_index : RunIndex, optional
+        The index of empty and non-empty objects, if it has been built.
+    indexes : dict
+        The named indexes of the objects, which were added with add_index.
+    key_indexes : dict
+        The named indexes of the keys of the objects, which were added with add_key_index.
+    text_index : TextIndex, optional
+        The inverted index of the text of the objects, if it has been built.
+    predicate_cache : PredicateCache, optional
+        The cache of the results of the conditions, if its enabled with cache_predicates.
+    stats : PaginatorStats, optional
+        The counters and timers of the Paginator, if they are enabled with collect_stats.
+    events : PaginatorEvents, optional
+        The listeners of the navigation events, if any were added with subscribe.
+    count : Callable, optional
+        The function which is used to count the objects instead of len.
+    cache_length : bool
+        Whether the number of objects is cached instead of being counted on every move.
+    """
+
+    def __init__(self, objects, starting_index=0, on_end_error=False, convert_to_list=False, page_size=None,
+                 count=None, cache_length=False):
+        """
+        Creates a new Paginator object with the given parameters.
+
+        Parameters
+        ----------
+        objects : Iterable
+            The objects on which the Paginator should iterate.
+        starting_index : int
+            The index where the pagination should start.
+        on_end_error : bool
+            If its True, then it raises error if the index exceeds the limits.
+            If its False, then if index exceeds the limit, it is set back to the limit.
+            If its None, then it wraps the index around the limits.
+        convert_to_list: bool
+            Whether objects should be converted to a list (needed for generators).
+            Use LazyPaginator to page generators without draining them first.
+        page_size : int, optional
+            If its given, then the Paginator iterates over pages of this many objects,
+            the index is the page number and the value is a slice of the objects.
+        count : Callable, optional
+            The function which is used to count the objects instead of len, such as lambda query: query.count().
+            It can return None if the number of objects is not known, in which case its found by probing.
+        cache_length : bool
+            Whether the number of objects is cached instead of being counted on every move,
+            if its True then refresh_length must be called when the number of objects changes.
+            The number of objects is always cached when it had to be found by probing.
+        """
+        if page_size is not None and page_size < 1:
+            raise ValueError(f"The page size must be atleast 1, but was given as {page_size}")
+        if convert_to_list:
+            objects = list(objects)
+        self.objects = objects
+        self.page_size = page_size
+        self.count = count
+        self.cache_length = cache_length
+        self._length = None
+        self._min_length = 0
+        self.on_end_error = on_end_error
+        self.empty_index = None
+        self.indexes = {}
+        self.key_indexes = {}
+        self.text_index = None
+        self.predicate_cache = None
+        self.stats = None
+        self.events = None
+        self._index = 0
+
+        self.index = starting_index
+
+
+class Cursor(BasePaginator):
+    """
+    Lightweight Paginator which only holds its own index and on_end_error,
+    and shares everything else with the Paginator it was created from.
+
+    Attributes
+    ----------
+    index : int
+        The current index of the Cursor.
+    store : Paginator
+        The Paginator which holds the objects, indexes and settings.
+    """
+
+    __slots__ = 'store', '_index', 'on_end_error'
+
+    objects = _shared('objects')
+    page_size = _shared('page_size')
+    count = _shared('count')
+    cache_length = _shared('cache_length')
+    empty_index = _shared('empty_index')
+    indexes = _shared('indexes')
+    key_indexes = _shared('key_indexes')
+    text_index = _shared('text_index')
+    predicate_cache = _shared('predicate_cache')
+    stats = _shared('stats')
+    events = _shared('events')
+    _length = _shared('_length')
+    _min_length = _shared('_min_length')
+
+    def __init__(self, store, starting_index=0, on_end_error=False):
+        """
+        Creates a new Cursor over the objects of the given Paginator.
+
+        Parameters
+        ----------
+        store : Paginator
+            The Paginator whose objects, indexes and settings are shared.
+        starting_index : int
+            The index where the pagination should start.
+        on_end_error : bool
+            If its True, then it raises error if the index exceeds the limits.
+            If its False, then if index exceeds the limit, it is set back to the limit.
+            If its None, then it wraps the index around the limits.
+        """
+        self.store = store.store
+        self.on_end_error = on_end_error
+        self._index = 0
+
+        self.index = starting_index
+
+    def __copy__(self):
+        """
+        Returns a new Cursor at the same index, which shares the store of this Cursor.
+        """
+        return self.cursor()
@@ -1,16 +1,62 @@
+import struct
 from collections import Callable
-from typing import Any, Iterable, Optional, Sequence, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .events import NavigationEvent, PaginatorEvents
+from .indexes import IndexedCondition, KeyIndex, RunIndex, TextIndex, _Keys
+from .memo import PredicateCache
+from .stats import PaginatorStats
+from .vectorize import vectorized
 
 __all__: Tuple[str]
 
+STATE_VERSION: int
+STATE: struct.Struct
+STATE_MODES: Dict[Optional[bool], int]
+STATE_END_ERRORS: Tuple[Optional[bool], ...]
+
+
+def _uncached_check(cond: Callable[[Any], Any], index: int, value: Any) -> Any: ...
+
+
+def _shared(name: str) -> property: ...
+
+
+def _negate(cond: Callable[[Any], bool]) -> Callable[[Any], bool]: ...
+
+
+def _state_token(token: Union[int, str, bytes, None]) -> int: ...
+
+
+def _restore_featured(cls: type, state: Any) -> BasePaginator: ...
+
 
-class Paginator:
+def _unpack_state(fields: Tuple[int, int, int, int, int, int]) -> Tuple[Optional[bool], Optional[int], int, int, int]: ...
+
+
+def dump_states(paginators: Iterable[BasePaginator], token: Union[int, str, bytes, None] = ...) -> bytes: ...
+
+
+def load_states(states: bytes, store: BasePaginator, token: Union[int, str, bytes, None] = ...) -> List[Cursor]: ...
+
+
+class BasePaginator:
+    _scannable: bool
     _index: int
     objects: Union[Iterable, Sequence]
     on_end_error: bool
-
-    def __init__(self, objects: Iterable, starting_index: int = ..., on_end_error: bool = ...,
-                 convert_to_list: bool = ...) -> None: ...
+    page_size: Optional[int]
+    empty_index: Optional[RunIndex]
+    indexes: Dict[str, RunIndex]
+    key_indexes: Dict[str, KeyIndex]
+    text_index: Optional[TextIndex]
+    predicate_cache: Optional[PredicateCache]
+    stats: Optional[PaginatorStats]
+    events: Optional[PaginatorEvents]
+    count: Optional[Callable[[Any], Optional[int]]]
+    cache_length: bool
+    _length: Optional[int]
+    _min_length: int
 
     @property
     def index(self) -> int: ...
@@ -21,29 +67,96 @@ class Paginator:
     @property
     def value(self): ...
 
+    def _value_at(self, index: int): ...
+
+    def window(self, radius: int = ...) -> List: ...
+
     def next(self, count: int = ...): ...
 
-    def next_until_cond(self, cond: Callable[[Any], bool], stepper: Optional[Callable[[Paginator]]] = ...): ...
+    def next_until_cond(self, cond: Union[Callable[[Any], bool], str], stepper: Optional[Callable[[Paginator]]] = ...): ...
+
+    def _jump_to(self, found: Optional[int], forward: bool): ...
 
-    def next_while_cond(self, cond: Callable[[Any], bool], stepper: Optional[Callable[[Paginator]]] = ...): ...
+    def _step_to(self, found: Optional[int], forward: bool) -> Iterator: ...
+
+    def _search(self, cond: Callable[[Any], bool], forward: bool) -> Any: ...
+
+    def _candidates(self, forward: bool) -> Iterable[int]: ...
+
+    def _value_getter(self) -> Callable[[int], Any]: ...
+
+    def _scan(self, cond: Callable[[Any], bool], forward: bool) -> Optional[int]: ...
+
+    def _step_scan(self, cond: Callable[[Any], bool], forward: bool) -> Iterator[Any]: ...
+
+    def _search_exhausted(self) -> None: ...
+
+    def _stepper(self, forward: bool) -> Callable[[BasePaginator], None]: ...
+
+    def _until(self, cond: Callable[[Any], bool], stepper: Callable[[BasePaginator], None]) -> Any: ...
+
+    def next_while_cond(self, cond: Union[Callable[[Any], bool], str], stepper: Optional[Callable[[Paginator]]] = ...): ...
 
     def prev(self, count: int = ...): ...
 
-    def prev_until_cond(self, cond: Callable[[Any], bool], stepper: Optional[Callable[[Paginator]]] = ...): ...
+    def prev_until_cond(self, cond: Union[Callable[[Any], bool], str], stepper: Optional[Callable[[Paginator]]] = ...): ...
 
-    def prev_while_cond(self, cond: Callable[[Any], bool], stepper: Optional[Callable[[Paginator]]] = ...): ...
+    def prev_while_cond(self, cond: Union[Callable[[Any], bool], str], stepper: Optional[Callable[[Paginator]]] = ...): ...
 
     def step_next(self, count: int = ...): ...
 
     def step_prev(self, count: int = ...): ...
 
-    def step_next_until_cond(self, cond: Callable[[Any], bool], stepper: Optional[Callable[[Paginator]]] = ...): ...
+    def take_next(self, count: int = ...) -> List: ...
+
+    def take_prev(self, count: int = ...) -> List: ...
+
+    def _slice(self, start: int, stop: int, step: int) -> List: ...
+
+    def step_next_until_cond(self, cond: Union[Callable[[Any], bool], str], stepper: Optional[Callable[[Paginator]]] = ...): ...
+
+    def _step_search(self, cond: Callable[[Any], bool], forward: bool) -> Iterator[Any]: ...
+
+    def _step_until(self, cond: Callable[[Any], bool], stepper: Callable[[BasePaginator], None]) -> Iterator[Any]: ...
+
+    def step_next_while_cond(self, cond: Union[Callable[[Any], bool], str], stepper: Optional[Callable[[Paginator]]] = ...): ...
+
+    def step_prev_until_cond(self, cond: Union[Callable[[Any], bool], str], stepper: Optional[Callable[[Paginator]]] = ...): ...
+
+    def step_prev_while_cond(self, cond: Union[Callable[[Any], bool], str], stepper: Optional[Callable[[Paginator]]] = ...): ...
+
+    def build_empty_index(self) -> RunIndex: ...
+
+    def _require_scannable(self, feature: str) -> None: ...
+
+    def update_empty_index(self, index: Optional[int] = ...) -> None: ...
+
+    def build_text_index(self, extract: Callable[[Any], str] = ..., tokenize: Callable[[str], Iterable[Any]] = ...,
+                         background: bool = ...) -> TextIndex: ...
+
+    def update_text_index(self, index: Optional[int] = ...) -> None: ...
 
-    def step_next_while_cond(self, cond: Callable[[Any], bool], stepper: Optional[Callable[[Paginator]]] = ...): ...
+    def add_index(self, name: str, cond: Callable[[Any], bool]) -> RunIndex: ...
 
-    def step_prev_until_cond(self, cond: Callable[[Any], bool], stepper: Optional[Callable[[Paginator]]] = ...): ...
+    def remove_index(self, name: str) -> None: ...
 
-    def step_prev_while_cond(self, cond: Callable[[Any], bool], stepper: Optional[Callable[[Paginator]]] = ...): ...
+    def add_key_index(self, name: str, key: Optional[Callable[[Any], Any]] = ...) -> KeyIndex: ...
+
+    def remove_key_index(self, name: str) -> None: ...
+
+    def _named_index(self, name: str) -> Union[RunIndex, KeyIndex]: ...
+
+    def update_indexes(self, index: int) -> None: ...
+
+    def invalidate_indexes(self, *names: str) -> None: ...
+
+    def rebuild_indexes(self, *names: str) -> None: ...
+
+    def cache_predicates(self, max_size: int = ...) -> PredicateCache: ...
+
+    def _resolve_cond(self, cond: Union[Callable[[Any], bool], str]) -> Callable[[Any], bool]: ...
+
+    def _find_in_index(self, run_index: RunIndex, truth: bool, forward: bool) -> Optional[int]: ...
 
     def goto_next_non_empty(self): ...
 
@@ -63,6 +176,20 @@ class Paginator:
 
     def set(self, value: int) -> None: ...
 
+    def seek(self, key_value: Any, key: Union[Callable[[Any], Any], str, None] = ...): ...
+
+    def seek_prev(self, key_value: Any, key: Union[Callable[[Any], Any], str, None] = ...): ...
+
+    def _seek_keys(self, key: Union[Callable[[Any], Any], str, None]) -> Tuple[Union[Sequence, List, _Keys], int]: ...
+
+    def find_next(self, query: str): ...
+
+    def find_prev(self, query: str): ...
+
+    def _find_text(self, query: str, forward: bool): ...
+
+    def _seek_to(self, found: int, length: int): ...
+
     @property
     def is_at_end(self) -> bool: ...
 
@@ -75,4 +202,64 @@ class Paginator:
     @property
     def length(self) -> int: ...
 
+    @property
+    def length_hint(self) -> int: ...
+
+    def refresh_length(self) -> int: ...
+
+    def _count_objects(self) -> Optional[int]: ...
+
+    def _object_count(self) -> int: ...
+
+    def _probe(self, index: int) -> bool: ...
+
+    def _probe_length(self) -> int: ...
+
     def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator: ...
+
+    @property
+    def store(self) -> Paginator: ...
+
+    def cursor(self) -> Cursor: ...
+
+    def dump_state(self, token: Union[int, str, bytes, None] = ...) -> bytes: ...
+
+    def load_state(self, state: bytes, token: Union[int, str, bytes, None] = ...) -> bool: ...
+
+    def _state_length(self) -> int: ...
+
+    def _pack_state(self, token: int) -> bytes: ...
+
+    def _restore_state(self, fields: Tuple[Optional[bool], Optional[int], int, int, int], length: int,
+                       token: int) -> bool: ...
+
+    def collect_stats(self, enabled: bool = ...) -> Optional[PaginatorStats]: ...
+
+    def subscribe(self, listener: Callable[[NavigationEvent], Any], *events: str, coalesce: bool = ...,
+                  loop: Optional[Any] = ...) -> Callable[[NavigationEvent], Any]: ...
+
+    def unsubscribe(self, listener: Callable[[NavigationEvent], Any], *events: str) -> None: ...
+
+    def _feature_class(self, cls: type) -> type: ...
+
+    def _plain_class(self) -> type: ...
+
+    def _refresh_class(self) -> None: ...
+
+    def _reduce_featured(self, protocol: int) -> Tuple[Callable[..., BasePaginator], Tuple[type, Any]]: ...
+
+
+class Paginator(BasePaginator):
+    def __init__(self, objects: Iterable, starting_index: int = ..., on_end_error: bool = ...,
+                 convert_to_list: bool = ..., page_size: Optional[int] = ...,
+                 count: Optional[Callable[[Any], Optional[int]]] = ..., cache_length: bool = ...) -> None: ...
+
+
+class Cursor(BasePaginator):
+    store: Paginator
+
+    def __init__(self, store: BasePaginator, starting_index: int = ..., on_end_error: bool = ...) -> None: ...
+
+    def __copy__(self) -> Cursor: ...
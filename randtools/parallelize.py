@@ -0,0 +1,256 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from copy import copy
+from os import cpu_count
+
+__all__ = 'parallel', 'lookahead'
+
+CHUNK_SIZE = 256
+
+
+class _Negation:
+    """
+    Negation of a condition, which can be pickled if the condition can be,
+    and is equal to the other negations of the same condition.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, value):
+        return not self.func(value)
+
+    def __eq__(self, other):
+        return isinstance(other, _Negation) and self.func == other.func
+
+    def __hash__(self):
+        return hash((_Negation, self.func))
+
+
+def _check_chunk(func, values, forward):
+    """
+    Returns the offset of the first (or last if not forward) value in the chunk which meets the condition.
+    """
+    offsets = range(len(values)) if forward else range(len(values) - 1, -1, -1)
+    for offset in offsets:
+        if func(values[offset]):
+            return offset
+    return None
+
+
+class parallel:
+    """
+    Marks a condition as parallel, so that it is checked in worker processes when searching a sequence,
+    which is useful when the condition is expensive such as a regex over large documents.
+
+    The objects are split into chunks in the order they would be searched in, which are checked
+    by a ProcessPoolExecutor a few at a time, and the chunks after the first match are cancelled.
+    The condition and the objects must be picklable, so the condition can not be a lambda.
+    When the objects are not a sequence, it is called with each object like any other condition.
+
+    Attributes
+    ----------
+    func : Callable
+        The condition.
+    chunk_size : int
+        The number of objects which are sent to a worker process at once.
+    max_workers : int
+        The number of worker processes.
+    max_in_flight : int
+        The maximum number of chunks which are being checked at once.
+    """
+
+    _executor_type = ProcessPoolExecutor
+
+    def __init__(self, func, chunk_size=CHUNK_SIZE, max_workers=None, max_in_flight=None, executor=None):
+        """
+        Creates a new parallel condition.
+
+        Parameters
+        ----------
+        func : Callable
+            The condition, which must be picklable.
+        chunk_size : int
+            The number of objects which are sent to a worker process at once.
+        max_workers : int, optional
+            The number of worker processes, it defaults to the number of CPUs.
+        max_in_flight : int, optional
+            The maximum number of chunks which are being checked at once, it defaults to twice max_workers.
+        executor : Executor, optional
+            The executor which checks the chunks, if its not given then a ProcessPoolExecutor
+            is created when the condition is first searched for, and is shut down by close.
+        """
+        self.func = func
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers or cpu_count() or 1
+        self.max_in_flight = 2 * self.max_workers if max_in_flight is None else max_in_flight
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    def __call__(self, value):
+        return self.func(value)
+
+    def __invert__(self):
+        """
+        Returns the negation of this condition, which is checked the same way and shares its executor.
+        """
+        negation = copy(self)
+        negation.func = _Negation(self.func)
+        negation._executor = self.executor
+        negation._owns_executor = False
+        return negation
+
+    @property
+    def executor(self):
+        """
+        Returns the executor which checks the chunks, creating it if needed.
+        """
+        if self._executor is None:
+            self._executor = self._executor_type(self.max_workers)
+        return self._executor
+
+    def close(self):
+        """
+        Shuts down the executor, if it was created by this condition.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class lookahead(parallel):
+    """
+    Marks a condition as I/O-bound, so that the next few objects are checked at once on a thread pool
+    instead of waiting for each check in turn, such as when the condition queries a database.
+
+    The objects are still matched in order, so the index found is always the one a serial search would find,
+    and the checks after the first match are cancelled if they have not started yet.
+    Unlike parallel, the condition does not have to be picklable.
+
+    Attributes
+    ----------
+    func : Callable
+        The condition.
+    ahead : int
+        The maximum number of objects which are being checked at once.
+    """
+
+    _executor_type = ThreadPoolExecutor
+
+    def __init__(self, func, ahead=8, max_workers=None, executor=None):
+        """
+        Creates a new lookahead condition.
+
+        Parameters
+        ----------
+        func : Callable
+            The condition.
+        ahead : int
+            The maximum number of objects which are being checked at once,
+            which limits the load on the service the condition queries.
+        max_workers : int, optional
+            The number of threads, it defaults to ahead.
+        executor : Executor, optional
+            The executor which checks the objects, if its not given then a ThreadPoolExecutor
+            is created when the condition is first searched for, and is shut down by close.
+        """
+        super().__init__(func, 1, max_workers or ahead, ahead, executor)
+
+    @property
+    def ahead(self):
+        """
+        Returns the maximum number of objects which are being checked at once.
+        """
+        return self.max_in_flight
+
+
+def supports_parallel(objects, cond):
+    """
+    Checks if the condition can be checked against the objects in worker processes.
+
+    Parameters
+    ----------
+    objects : Iterable
+        The objects on which the Paginator is iterating.
+    cond : Callable
+        The condition which is being searched for.
+
+    Returns
+    -------
+    supported : bool
+        Whether find_parallel can be used.
+    """
+    return isinstance(cond, parallel) and hasattr(objects, '__len__') and hasattr(objects, '__getitem__')
+
+
+def _chunks(ranges, chunk_size, forward):
+    """
+    Yields the start and stop of each chunk of the given ranges, in the order they are searched in.
+    """
+    for start, stop in ranges:
+        if forward:
+            for chunk_start in range(start, stop, chunk_size):
+                yield chunk_start, min(stop, chunk_start + chunk_size)
+        else:
+            for chunk_stop in range(stop, start, -chunk_size):
+                yield max(start, chunk_stop - chunk_size), chunk_stop
+
+
+def find_parallel(objects, cond, index, forward=True, wrap=False):
+    """
+    Finds the index of the next (or previous) object after the given index which meets the condition,
+    checking the objects in worker processes.
+
+    The objects are searched in the same order as the Paginator steps through them,
+    so if wrap is True then the search continues from the other limit and ends at the given index,
+    and the index found is always the one the Paginator would have stopped at.
+
+    Parameters
+    ----------
+    objects : Sequence
+        The objects which are searched.
+    cond : parallel
+        The condition which is being searched for.
+    index : int
+        The index after (or before) which the search starts.
+    forward : bool
+        Whether the index is being incremented or decremented.
+    wrap : bool
+        Whether the search wraps around the limits.
+
+    Returns
+    -------
+    index : int, optional
+        The index of the object which meets the condition, or None if no object meets it.
+    """
+    length = len(objects)
+    if forward:
+        ranges = [(index + 1, length)] + ([(0, index + 1)] if wrap else [])
+    else:
+        ranges = [(0, index)] + ([(index, length)] if wrap else [])
+    chunks = _chunks(ranges, cond.chunk_size, forward)
+    executor, func = cond.executor, cond.func
+    pending = deque()
+    try:
+        while True:
+            while len(pending) < cond.max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                start, stop = chunk
+                pending.append((start, executor.submit(_check_chunk, func, objects[start:stop], forward)))
+            if not pending:
+                return None
+            start, future = pending.popleft()
+            offset = future.result()
+            if offset is not None:
+                return start + offset
+    finally:
+        for _, future in pending:
+            future.cancel()
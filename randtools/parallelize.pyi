@@ -0,0 +1,65 @@
+from concurrent.futures import Executor
+from typing import Any, Type, Callable, Iterable, Iterator, Optional, Sequence, Tuple
+
+__all__: Tuple[str]
+
+CHUNK_SIZE: int
+
+
+class _Negation:
+    func: Callable[[Any], Any]
+
+    def __init__(self, func: Callable[[Any], Any]) -> None: ...
+
+    def __call__(self, value: Any) -> bool: ...
+
+    def __eq__(self, other: Any) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+
+def _check_chunk(func: Callable[[Any], Any], values: Sequence, forward: bool) -> Optional[int]: ...
+
+
+class parallel:
+    func: Callable[[Any], Any]
+    chunk_size: int
+    max_workers: int
+    max_in_flight: int
+    _executor: Optional[Executor]
+    _owns_executor: bool
+    _executor_type: Type[Executor]
+
+    def __init__(self, func: Callable[[Any], Any], chunk_size: int = ..., max_workers: Optional[int] = ...,
+                 max_in_flight: Optional[int] = ..., executor: Optional[Executor] = ...) -> None: ...
+
+    def __call__(self, value: Any) -> Any: ...
+
+    def __invert__(self) -> parallel: ...
+
+    @property
+    def executor(self) -> Executor: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> parallel: ...
+
+    def __exit__(self, *exc_info: Any) -> None: ...
+
+
+class lookahead(parallel):
+    def __init__(self, func: Callable[[Any], Any], ahead: int = ..., max_workers: Optional[int] = ...,
+                 executor: Optional[Executor] = ...) -> None: ...
+
+    @property
+    def ahead(self) -> int: ...
+
+
+def supports_parallel(objects: Any, cond: Callable[[Any], Any]) -> bool: ...
+
+
+def _chunks(ranges: Iterable[Tuple[int, int]], chunk_size: int, forward: bool) -> Iterator[Tuple[int, int]]: ...
+
+
+def find_parallel(objects: Sequence, cond: parallel, index: int, forward: bool = ...,
+                  wrap: bool = ...) -> Optional[int]: ...
@@ -0,0 +1,200 @@
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Protocol, runtime_checkable
+
+__all__ = 'PageSource', 'PrefetchingSource'
+
+
+@runtime_checkable
+class PageSource(Protocol):
+    """
+    Protocol of the sources which can be prefetched from,
+    any sequence whose objects can be fetched by their index is a PageSource.
+    """
+
+    def __len__(self):
+        """
+        Returns the number of pages in the source.
+        """
+
+    def __getitem__(self, index):
+        """
+        Fetches the page at the given index, this may block for a while.
+        """
+
+
+class PrefetchingSource:
+    """
+    Sequence which wraps a slow PageSource, and fetches the pages around
+    the last requested index in the background, so that they are ready when requested.
+
+    Pages are prefetched in the direction the index has been moving in recently,
+    so after a few calls to next, the next pages are prefetched and after a few calls to prev,
+    the previous pages are prefetched instead.
+
+    Attributes
+    ----------
+    source : PageSource
+        The source which the pages are fetched from.
+    ahead : int
+        The number of pages to prefetch in the direction the index is moving in.
+    behind : int
+        The number of pages to prefetch in the opposite direction.
+    max_in_flight : int
+        The maximum number of pages which are fetched in the background at once.
+    cache_size : int
+        The maximum number of fetched pages which are kept.
+    hits : int
+        The number of pages which were ready when requested.
+    misses : int
+        The number of pages which had to be waited for.
+    """
+
+    def __init__(self, source, ahead=2, behind=1, max_workers=4, max_in_flight=None, cache_size=None, history=4):
+        """
+        Creates a new PrefetchingSource with the given parameters.
+
+        Parameters
+        ----------
+        source : PageSource
+            The source which the pages are fetched from.
+        ahead : int
+            The number of pages to prefetch in the direction the index is moving in.
+        behind : int
+            The number of pages to prefetch in the opposite direction.
+        max_workers : int
+            The number of threads which fetch the pages.
+        max_in_flight : int, optional
+            The maximum number of pages which are fetched in the background at once,
+            it defaults to max_workers.
+        cache_size : int, optional
+            The maximum number of fetched pages which are kept,
+            it defaults to twice the number of pages around the index which are prefetched.
+        history : int
+            The number of recent moves which decide the direction to prefetch in.
+        """
+        self.source = source
+        self.ahead = ahead
+        self.behind = behind
+        self.max_in_flight = max_workers if max_in_flight is None else max_in_flight
+        self.cache_size = 2 * (ahead + behind + 1) if cache_size is None else cache_size
+        self.hits = 0
+        self.misses = 0
+        self._executor = ThreadPoolExecutor(max_workers, thread_name_prefix='randtools-prefetch')
+        self._cache = OrderedDict()
+        self._moves = deque(maxlen=history)
+        self._last_index = None
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self.source)
+
+    def __getitem__(self, index):
+        """
+        Returns the page at the given index, waiting for it if its not ready yet,
+        and starts prefetching the pages around it.
+
+        Parameters
+        ----------
+        index : int or slice
+            The index of the page, or a slice of indexes.
+
+        Returns
+        -------
+        page : Any
+            The page at the given index, or a list of the pages if a slice was given.
+        """
+        if isinstance(index, slice):
+            return [self[page] for page in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+
+        with self._lock:
+            future = self._cache.get(index)
+            if future is not None:
+                self._cache.move_to_end(index)
+        if future is not None and future.done():
+            self.hits += 1
+        else:
+            self.misses += 1
+
+        if future is None:
+            page = self.source[index]
+            future = Future()
+            future.set_result(page)
+            self._store(index, future)
+        else:
+            try:
+                page = future.result()
+            except BaseException:
+                with self._lock:
+                    self._cache.pop(index, None)
+                raise
+
+        self._record(index)
+        self._prefetch(index)
+        return page
+
+    @property
+    def direction(self):
+        """
+        Returns the direction the index has been moving in recently, 1 for forwards and -1 for backwards.
+        """
+        return -1 if sum(self._moves) < 0 else 1
+
+    @property
+    def in_flight(self):
+        """
+        Returns the number of pages which are being fetched in the background.
+        """
+        with self._lock:
+            return sum(not future.done() for future in self._cache.values())
+
+    def _record(self, index):
+        """
+        Records the move to the given index, which decides the direction to prefetch in.
+        """
+        if self._last_index is not None and index != self._last_index:
+            self._moves.append(1 if index > self._last_index else -1)
+        self._last_index = index
+
+    def _prefetch(self, index):
+        """
+        Starts fetching the pages around the given index which are not fetched yet.
+        """
+        direction, length = self.direction, len(self)
+        targets = [index + direction * offset for offset in range(1, self.ahead + 1)]
+        targets += [index - direction * offset for offset in range(1, self.behind + 1)]
+        in_flight = self.in_flight
+        for target in targets:
+            if in_flight >= self.max_in_flight:
+                break
+            if not 0 <= target < length:
+                continue
+            with self._lock:
+                if target in self._cache:
+                    continue
+            self._store(target, self._executor.submit(self.source.__getitem__, target))
+            in_flight += 1
+
+    def _store(self, index, future):
+        """
+        Stores the future of the page at the given index, evicting the least recently used pages.
+        """
+        with self._lock:
+            self._cache[index] = future
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)[1].cancel()
+
+    def close(self):
+        """
+        Stops the background threads, cancelling the pages which have not started being fetched.
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
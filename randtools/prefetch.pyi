@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Deque, List, Optional, Protocol, Tuple, Union, runtime_checkable
+
+__all__: Tuple[str]
+
+
+@runtime_checkable
+class PageSource(Protocol):
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: int) -> Any: ...
+
+
+class PrefetchingSource:
+    source: PageSource
+    ahead: int
+    behind: int
+    max_in_flight: int
+    cache_size: int
+    hits: int
+    misses: int
+    _executor: ThreadPoolExecutor
+    _cache: OrderedDict[int, Future]
+    _moves: Deque[int]
+    _last_index: Optional[int]
+    _lock: Lock
+
+    def __init__(self, source: PageSource, ahead: int = ..., behind: int = ..., max_workers: int = ...,
+                 max_in_flight: Optional[int] = ..., cache_size: Optional[int] = ..., history: int = ...) -> None: ...
+
+    def __len__(self) -> int: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, List]: ...
+
+    @property
+    def direction(self) -> int: ...
+
+    @property
+    def in_flight(self) -> int: ...
+
+    def _record(self, index: int) -> None: ...
+
+    def _prefetch(self, index: int) -> None: ...
+
+    def _store(self, index: int, future: Future) -> None: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> PrefetchingSource: ...
+
+    def __exit__(self, *exc_info: Any) -> None: ...
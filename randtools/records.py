@@ -0,0 +1,333 @@
+import csv
+import json
+import mmap
+import os
+import struct
+from array import array
+from zlib import crc32
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = 'RecordFile', 'JSONLFile', 'CSVFile'
+
+SCAN_CHUNK_SIZE = 1 << 26
+
+INDEX_MAGIC = b'RTIX'
+INDEX_VERSION = 1
+INDEX_HEADER = struct.Struct('<4sHHQqIQ16s')
+INDEX_HEADER_SIZE = 64
+INDEX_SAMPLE_SIZE = 1 << 12
+
+
+class RecordFile:
+    """
+    Sequence of the records in a file, which is memory-mapped instead of being read into memory.
+
+    The offset of every record is found in a single pass when the file is opened,
+    and a record is only decoded and parsed when its accessed, so it can be paginated directly.
+
+    Attributes
+    ----------
+    path : str
+        The path of the file.
+    delimiter : bytes
+        The bytes which separate the records.
+    encoding : str, optional
+        The encoding which the records are decoded with, if its None then the records are bytes.
+    parser : Callable, optional
+        The function which each decoded record is parsed with.
+    offsets : array or memoryview
+        The offset at which each record starts, followed by the offset just past the last record.
+    index_path : str, optional
+        The path of the sidecar file which the offsets are saved to and loaded from.
+    """
+
+    _first = 0
+
+    def __init__(self, path, parser=None, encoding='utf-8', delimiter=b'\n', index_path=None):
+        """
+        Opens the file and finds the offset of every record in it.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The path of the file.
+        parser : Callable, optional
+            The function which each decoded record is parsed with.
+        encoding : str, optional
+            The encoding which the records are decoded with, if its None then the records are bytes.
+        delimiter : bytes
+            The bytes which separate the records.
+        index_path : str or PathLike or bool, optional
+            The path of a sidecar file to save the offsets to, so that the file does not have to be
+            scanned again the next time its opened. If its True, then the path of the file with .idx
+            appended is used. The sidecar is only reused if the file has not changed since,
+            and if records were only appended to the file, then only the new records are scanned.
+        """
+        self.path = os.fspath(path)
+        self.parser = parser
+        self.encoding = encoding
+        self.delimiter = delimiter
+        if index_path is True:
+            index_path = self.path + '.idx'
+        self.index_path = None if index_path in (None, False) else os.fspath(index_path)
+        self._file = open(self.path, 'rb')
+        self._map = self._open_map()
+        self._index_map = None
+        if self.index_path is None or not self._load_index():
+            self.offsets = array('Q', [0])
+            self._scan(0)
+            self._save_index()
+
+    def _open_map(self):
+        """
+        Memory-maps the file, empty files can not be mapped so they are treated as empty bytes.
+        """
+        if os.fstat(self._file.fileno()).st_size == 0:
+            return b''
+        return mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _scan(self, start):
+        """
+        Finds the offsets of the records from the given offset to the end of the file.
+
+        Parameters
+        ----------
+        start : int
+            The offset at which a record starts, from which the file is scanned.
+        """
+        data, offsets, delimiter = self._map, self.offsets, self.delimiter
+        size, step = len(data), len(delimiter)
+        if numpy is not None and step == 1:
+            for chunk_start in range(start, size, SCAN_CHUNK_SIZE):
+                chunk = numpy.frombuffer(data, numpy.uint8, min(SCAN_CHUNK_SIZE, size - chunk_start), chunk_start)
+                found = numpy.flatnonzero(chunk == delimiter[0]).astype(numpy.uint64)
+                offsets.frombytes((found + (chunk_start + 1)).tobytes())
+        else:
+            position = data.find(delimiter, start)
+            while position != -1:
+                offsets.append(position + step)
+                position = data.find(delimiter, position + step)
+        if offsets[-1] != size:
+            offsets.append(size + step)
+
+    def _checksum(self, size):
+        """
+        Returns the checksum of the start and the end of the first size bytes of the file,
+        which is used to check that the file was not replaced.
+        """
+        data = self._map
+        return crc32(data[max(0, size - INDEX_SAMPLE_SIZE):size], crc32(data[:min(size, INDEX_SAMPLE_SIZE)]))
+
+    def _load_index(self):
+        """
+        Loads the offsets from the sidecar file, if its still valid for the file.
+        If the file has only grown since, then the offsets of the new records are scanned and saved.
+
+        Returns
+        -------
+        loaded : bool
+            Whether the offsets were loaded.
+        """
+        try:
+            with open(self.index_path, 'rb') as index_file:
+                index_map = mmap.mmap(index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False
+
+        stat = os.fstat(self._file.fileno())
+        try:
+            magic, version, delimiter_length, size, mtime, checksum, count, delimiter = \
+                INDEX_HEADER.unpack_from(index_map)
+        except struct.error:
+            index_map.close()
+            return False
+        valid = (magic == INDEX_MAGIC and version == INDEX_VERSION and
+                 delimiter[:delimiter_length] == self.delimiter and
+                 len(index_map) == INDEX_HEADER_SIZE + 8 * count and
+                 (size < stat.st_size or mtime == stat.st_mtime_ns) and self._checksum(size) == checksum)
+        if not valid:
+            index_map.close()
+            return False
+
+        offsets = memoryview(index_map)[INDEX_HEADER_SIZE:].cast('Q')
+        if size == stat.st_size:
+            self._index_map = index_map
+            self.offsets = offsets
+            return True
+
+        terminated = offsets[-1] == size
+        self.offsets = array('Q')
+        self.offsets.frombytes((offsets if terminated else offsets[:-1]).cast('B'))
+        offsets.release()
+        index_map.close()
+        if terminated:
+            self._scan(size)
+        else:
+            self._scan(max(self.offsets[-1], size - len(self.delimiter) + 1))
+        self._save_index()
+        return True
+
+    def _save_index(self):
+        """
+        Saves the offsets to the sidecar file, if there is one and the delimiter fits in its header.
+        """
+        if self.index_path is None or len(self.delimiter) > 16:
+            return
+        stat = os.fstat(self._file.fileno())
+        size = len(self._map)
+        header = INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, len(self.delimiter), size, stat.st_mtime_ns,
+                                   self._checksum(size), len(self.offsets), self.delimiter)
+        temporary_path = f'{self.index_path}.{os.getpid()}.tmp'
+        try:
+            with open(temporary_path, 'wb') as index_file:
+                index_file.write(header.ljust(INDEX_HEADER_SIZE, b'\0'))
+                index_file.write(memoryview(self.offsets).cast('B'))
+            os.replace(temporary_path, self.index_path)
+        except OSError:
+            if os.path.exists(temporary_path):
+                os.remove(temporary_path)
+
+    def record(self, index):
+        """
+        Returns the raw bytes of the record at the given index, without the delimiter.
+
+        Parameters
+        ----------
+        index : int
+            The index of the record.
+
+        Returns
+        -------
+        record : bytes
+            The bytes of the record.
+        """
+        length = len(self)
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError(f"There are only {length} records, but tried to get the record at {index}")
+        index += self._first
+        record = self._map[self.offsets[index]:self.offsets[index + 1] - len(self.delimiter)]
+        if self.delimiter == b'\n' and record.endswith(b'\r'):
+            record = record[:-1]
+        return record
+
+    def _parse(self, record):
+        """
+        Decodes and parses the raw bytes of a record.
+        """
+        if self.encoding is not None:
+            record = record.decode(self.encoding)
+        if self.parser is not None:
+            record = self.parser(record)
+        return record
+
+    def __getitem__(self, index):
+        """
+        Returns the parsed record at the given index.
+
+        Parameters
+        ----------
+        index : int or slice
+            The index of the record, or a slice of indexes.
+
+        Returns
+        -------
+        record : Any
+            The parsed record, or a list of the parsed records if a slice was given.
+        """
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        return self._parse(self.record(index))
+
+    def __len__(self):
+        return len(self.offsets) - 1 - self._first
+
+    def close(self):
+        """
+        Closes the memory-maps and the file.
+        """
+        if isinstance(self.offsets, memoryview):
+            self.offsets.release()
+        if self._index_map is not None:
+            self._index_map.close()
+        if isinstance(self._map, mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JSONLFile(RecordFile):
+    """
+    Sequence of the records in a JSON Lines file, each record is parsed as JSON when its accessed.
+    """
+
+    def __init__(self, path, encoding='utf-8', **kwargs):
+        """
+        Opens the file and finds the offset of every record in it.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The path of the file.
+        encoding : str
+            The encoding of the file.
+        kwargs
+            The other parameters of RecordFile.
+        """
+        super().__init__(path, json.loads, encoding, **kwargs)
+
+
+class CSVFile(RecordFile):
+    """
+    Sequence of the rows in a CSV file, each row is parsed when its accessed.
+
+    Each row must be on a single line, as the rows are found by their line breaks.
+
+    Attributes
+    ----------
+    header : list, optional
+        The names of the columns, if the file has a header.
+    """
+
+    def __init__(self, path, header=True, encoding='utf-8', index_path=None, **kwargs):
+        """
+        Opens the file and finds the offset of every row in it.
+
+        Parameters
+        ----------
+        path : str or PathLike
+            The path of the file.
+        header : bool
+            Whether the first row is a header, if it is then each row is parsed as a dict.
+        encoding : str
+            The encoding of the file.
+        index_path : str or PathLike or bool, optional
+            The path of a sidecar file to save the offsets to, see RecordFile.
+        kwargs
+            The dialect and format parameters for csv.reader.
+        """
+        self._format = kwargs
+        super().__init__(path, self._parse_row, encoding, index_path=index_path)
+        self.header = None
+        if header and len(self):
+            self.header = self._parse_row(self.record(0).decode(encoding))
+            self._first = 1
+
+    def _parse_row(self, line):
+        """
+        Parses a single line of the file into a row.
+        """
+        row = next(csv.reader([line], **self._format), [])
+        if self.header is None:
+            return row
+        return dict(zip(self.header, row))
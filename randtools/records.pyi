@@ -0,0 +1,70 @@
+from array import array
+from mmap import mmap
+from os import PathLike
+from struct import Struct
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+__all__: Tuple[str]
+
+SCAN_CHUNK_SIZE: int
+
+INDEX_MAGIC: bytes
+INDEX_VERSION: int
+INDEX_HEADER: Struct
+INDEX_HEADER_SIZE: int
+INDEX_SAMPLE_SIZE: int
+
+
+class RecordFile:
+    _first: int
+    _file: BinaryIO
+    _map: Union[mmap, bytes]
+    path: str
+    parser: Optional[Callable[[Any], Any]]
+    encoding: Optional[str]
+    delimiter: bytes
+    _index_map: Optional[mmap]
+    offsets: Union[array, memoryview]
+    index_path: Optional[str]
+
+    def __init__(self, path: Union[str, PathLike], parser: Optional[Callable[[Any], Any]] = ...,
+                 encoding: Optional[str] = ..., delimiter: bytes = ...,
+                 index_path: Optional[Union[str, PathLike, bool]] = ...) -> None: ...
+
+    def _open_map(self) -> Union[mmap, bytes]: ...
+
+    def _scan(self, start: int) -> None: ...
+
+    def _checksum(self, size: int) -> int: ...
+
+    def _load_index(self) -> bool: ...
+
+    def _save_index(self) -> None: ...
+
+    def record(self, index: int) -> bytes: ...
+
+    def _parse(self, record: bytes) -> Any: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any: ...
+
+    def __len__(self) -> int: ...
+
+    def close(self) -> None: ...
+
+    def __enter__(self) -> RecordFile: ...
+
+    def __exit__(self, *exc_info: Any) -> None: ...
+
+
+class JSONLFile(RecordFile):
+    def __init__(self, path: Union[str, PathLike], encoding: str = ..., **kwargs: Any) -> None: ...
+
+
+class CSVFile(RecordFile):
+    _format: Dict[str, Any]
+    header: Optional[List[str]]
+
+    def __init__(self, path: Union[str, PathLike], header: bool = ..., encoding: str = ...,
+                 index_path: Optional[Union[str, PathLike, bool]] = ..., **kwargs: Any) -> None: ...
+
+    def _parse_row(self, line: str) -> Union[List[str], Dict[str, str]]: ...
@@ -0,0 +1,240 @@
+from collections import OrderedDict
+from sys import getsizeof
+from time import monotonic
+
+__all__ = 'PaginatorRegistry',
+
+
+def estimate_size(paginator):
+    """
+    Estimates the memory used by a Paginator itself, without the objects it iterates over.
+
+    Parameters
+    ----------
+    paginator : BasePaginator
+        The Paginator whose memory is estimated.
+
+    Returns
+    -------
+    size : int
+        The estimated size in bytes.
+    """
+    size = getsizeof(paginator)
+    if hasattr(paginator, '__dict__'):
+        size += getsizeof(paginator.__dict__)
+    return size
+
+
+class PaginatorRegistry:
+    """
+    Registry of the Paginators of many sessions, keyed by their session id.
+
+    The least recently used Paginators are evicted once there are too many of them or they use
+    too much memory, and Paginators which have not been used for a while are expired.
+    As the Paginators are kept in the order they were last used in, expired Paginators are always
+    at the front, so they are evicted a few at a time as the registry is used instead of in a full sweep.
+
+    Attributes
+    ----------
+    max_entries : int, optional
+        The maximum number of Paginators which are kept.
+    max_memory : int, optional
+        The maximum estimated memory in bytes of the Paginators which are kept.
+    ttl : float, optional
+        The number of seconds after which an unused Paginator is expired.
+    on_evict : Callable, optional
+        The function which is called with the session id, the Paginator and the reason when its evicted.
+    memory : int
+        The estimated memory in bytes of the Paginators which are kept.
+    """
+
+    def __init__(self, max_entries=None, max_memory=None, ttl=None, on_evict=None, sizeof=estimate_size,
+                 clock=monotonic):
+        """
+        Creates a new PaginatorRegistry with the given limits.
+
+        Parameters
+        ----------
+        max_entries : int, optional
+            The maximum number of Paginators which are kept.
+        max_memory : int, optional
+            The maximum estimated memory in bytes of the Paginators which are kept.
+        ttl : float, optional
+            The number of seconds after which an unused Paginator is expired.
+        on_evict : Callable, optional
+            The function which is called with the session id, the Paginator and the reason when its evicted,
+            the reason is either 'expired', 'entries' or 'memory'.
+        sizeof : Callable
+            The function which estimates the memory in bytes used by a Paginator.
+        clock : Callable
+            The function which returns the current time in seconds.
+        """
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.ttl = ttl
+        self.on_evict = on_evict
+        self.memory = 0
+        self._sizeof = sizeof
+        self._clock = clock
+        self._entries = OrderedDict()
+
+    def __setitem__(self, key, paginator):
+        """
+        Adds the Paginator of the given session, replacing the previous one.
+        """
+        self._discard(key)
+        size = self._sizeof(paginator) if self.max_memory is not None else 0
+        self._entries[key] = [paginator, self._clock(), size]
+        self.memory += size
+        self._evict()
+
+    def __getitem__(self, key):
+        """
+        Returns the Paginator of the given session, and marks it as recently used.
+
+        Raises
+        ------
+        KeyError
+            If there is no Paginator for the session, or it has expired.
+        """
+        self.expire()
+        entry = self._entries[key]
+        entry[1] = self._clock()
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def get(self, key, default=None):
+        """
+        Returns the Paginator of the given session, or the default if there is none.
+
+        Parameters
+        ----------
+        key : Hashable
+            The session id.
+        default : Any
+            The value which is returned if there is no Paginator for the session.
+
+        Returns
+        -------
+        paginator : BasePaginator
+            The Paginator of the session.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def get_or_create(self, key, factory):
+        """
+        Returns the Paginator of the given session, creating it with the factory if there is none.
+
+        Parameters
+        ----------
+        key : Hashable
+            The session id.
+        factory : Callable
+            The function which creates the Paginator.
+
+        Returns
+        -------
+        paginator : BasePaginator
+            The Paginator of the session.
+        """
+        try:
+            return self[key]
+        except KeyError:
+            paginator = self[key] = factory()
+            return paginator
+
+    def __delitem__(self, key):
+        """
+        Removes the Paginator of the given session, without calling on_evict.
+        """
+        self.expire()
+        if not self._discard(key):
+            raise KeyError(key)
+
+    def pop(self, key, default=None):
+        """
+        Removes and returns the Paginator of the given session, without calling on_evict.
+
+        Parameters
+        ----------
+        key : Hashable
+            The session id.
+        default : Any
+            The value which is returned if there is no Paginator for the session.
+
+        Returns
+        -------
+        paginator : BasePaginator
+            The Paginator of the session.
+        """
+        self.expire()
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        self._discard(key)
+        return entry[0]
+
+    def __contains__(self, key):
+        self.expire()
+        return key in self._entries
+
+    def __len__(self):
+        self.expire()
+        return len(self._entries)
+
+    def __iter__(self):
+        self.expire()
+        return iter(list(self._entries))
+
+    def _discard(self, key):
+        """
+        Removes the entry of the given session if there is one.
+
+        Returns
+        -------
+        removed : bool
+            Whether there was an entry to remove.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        self.memory -= entry[2]
+        return True
+
+    def _evict_first(self, reason):
+        """
+        Evicts the least recently used entry, calling on_evict with the given reason.
+        """
+        key, (paginator, _, size) = self._entries.popitem(last=False)
+        self.memory -= size
+        if self.on_evict is not None:
+            self.on_evict(key, paginator, reason)
+
+    def expire(self):
+        """
+        Evicts the Paginators which have not been used for longer than the ttl.
+
+        Only the entries at the front are checked, as they were used least recently,
+        so this stops at the first entry which has not expired.
+        """
+        if self.ttl is None:
+            return
+        deadline = self._clock() - self.ttl
+        entries = self._entries
+        while entries and next(iter(entries.values()))[1] <= deadline:
+            self._evict_first('expired')
+
+    def _evict(self):
+        """
+        Evicts the least recently used Paginators until the registry is within its limits.
+        """
+        self.expire()
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._evict_first('entries')
+        if self.max_memory is not None:
+            while self.memory > self.max_memory and len(self._entries) > 1:
+                self._evict_first('memory')
@@ -0,0 +1,50 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Iterator, List, Optional, Tuple
+
+from .paginator import BasePaginator
+
+__all__: Tuple[str]
+
+
+def estimate_size(paginator: BasePaginator) -> int: ...
+
+
+class PaginatorRegistry:
+    max_entries: Optional[int]
+    max_memory: Optional[int]
+    ttl: Optional[float]
+    on_evict: Optional[Callable[[Hashable, BasePaginator, str], Any]]
+    memory: int
+    _sizeof: Callable[[BasePaginator], int]
+    _clock: Callable[[], float]
+    _entries: OrderedDict[Hashable, List]
+
+    def __init__(self, max_entries: Optional[int] = ..., max_memory: Optional[int] = ..., ttl: Optional[float] = ...,
+                 on_evict: Optional[Callable[[Hashable, BasePaginator, str], Any]] = ...,
+                 sizeof: Callable[[BasePaginator], int] = ..., clock: Callable[[], float] = ...) -> None: ...
+
+    def __setitem__(self, key: Hashable, paginator: BasePaginator) -> None: ...
+
+    def __getitem__(self, key: Hashable) -> BasePaginator: ...
+
+    def get(self, key: Hashable, default: Any = ...) -> Any: ...
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], BasePaginator]) -> BasePaginator: ...
+
+    def __delitem__(self, key: Hashable) -> None: ...
+
+    def pop(self, key: Hashable, default: Any = ...) -> Any: ...
+
+    def __contains__(self, key: Hashable) -> bool: ...
+
+    def __len__(self) -> int: ...
+
+    def __iter__(self) -> Iterator[Hashable]: ...
+
+    def _discard(self, key: Hashable) -> bool: ...
+
+    def _evict_first(self, reason: str) -> None: ...
+
+    def expire(self) -> None: ...
+
+    def _evict(self) -> None: ...
@@ -0,0 +1,291 @@
+from functools import wraps
+from inspect import isgenerator
+from time import perf_counter
+
+from .indexes import IndexedCondition
+from .parallelize import _Negation, parallel
+from .vectorize import vectorized
+
+__all__ = 'PaginatorStats',
+
+TIMED_METHODS = (
+    'next', 'prev', 'set', 'next_until_cond', 'prev_until_cond', 'next_while_cond', 'prev_while_cond',
+    'step_next', 'step_prev', 'step_next_until_cond', 'step_prev_until_cond', 'step_next_while_cond',
+    'step_prev_while_cond', 'take_next', 'take_prev', 'goto_next_non_empty', 'goto_next_empty',
+    'goto_prev_non_empty', 'goto_prev_empty', 'step_to_next_non_empty', 'step_to_next_empty',
+    'step_to_prev_non_empty', 'step_to_prev_empty', 'claim_next', 'window', 'seek', 'seek_prev',
+    'find_next', 'find_prev',
+)
+
+
+class PaginatorStats:
+    """
+    Counters and timers of the work done by a Paginator and its Cursors, which are enabled with collect_stats.
+
+    Attributes
+    ----------
+    moves : int
+        The number of times the index was set.
+    steps : int
+        The number of indexes which were passed through one at a time, by the searches and the step methods.
+    searches : int
+        The number of searches with the *_until_cond and *_while_cond methods.
+    search_steps : int
+        The number of indexes which were passed through by the searches.
+    predicate_calls : int
+        The number of times a condition was called by the searches.
+    wraps : int
+        The number of times the index wrapped around the limits.
+    exhausted : int
+        The number of searches which raised StopIteration as no object met the condition.
+    times : dict
+        The number of calls and the total seconds spent in each method, including the methods it calls.
+        The time of the step methods is the time spent producing their values.
+    """
+
+    def __init__(self):
+        """
+        Creates new PaginatorStats with every counter at zero.
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Sets every counter and timer back to zero.
+        """
+        self.moves = 0
+        self.steps = 0
+        self.searches = 0
+        self.search_steps = 0
+        self.predicate_calls = 0
+        self.wraps = 0
+        self.exhausted = 0
+        self.times = {}
+
+    def _time(self, name, seconds, calls=1):
+        """
+        Adds the given time to the timer of the method with the given name.
+        """
+        timer = self.times.get(name)
+        if timer is None:
+            timer = self.times[name] = [0, 0.0]
+        timer[0] += calls
+        timer[1] += seconds
+
+    def _counted(self, cond):
+        """
+        Returns the condition counting its calls, unless its already counted
+        or is checked in whole chunks, in which case it is returned as it is.
+        """
+        inner = cond.func if isinstance(cond, _Negation) else cond
+        if isinstance(inner, (_Counted, vectorized, parallel, IndexedCondition)):
+            return cond
+        return _Counted(cond, self)
+
+    def as_dict(self):
+        """
+        Returns the counters and timers as a plain dict, which can be exported as JSON.
+
+        Returns
+        -------
+        stats : dict
+            The counters, the average number of steps per search and the timers of each method.
+        """
+        return {
+            'moves': self.moves,
+            'steps': self.steps,
+            'searches': self.searches,
+            'search_steps': self.search_steps,
+            'steps_per_search': self.search_steps / self.searches if self.searches else 0.0,
+            'predicate_calls': self.predicate_calls,
+            'wraps': self.wraps,
+            'exhausted': self.exhausted,
+            'times': {name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in self.times.items()},
+        }
+
+
+class _Counted:
+    """
+    Condition which counts its calls, and is equal to the condition it counts,
+    so that the results cached for the condition are still found.
+    """
+
+    __slots__ = 'func', 'stats'
+
+    def __init__(self, func, stats):
+        self.func = func
+        self.stats = stats
+
+    def __call__(self, value):
+        self.stats.predicate_calls += 1
+        return self.func(value)
+
+    def __eq__(self, other):
+        return self.func == (other.func if isinstance(other, _Counted) else other)
+
+    def __hash__(self):
+        return hash(self.func)
+
+
+class _Counting:
+    """
+    Methods which count the work done by a Paginator, which are added to the subclasses created by instrumented
+    so that Paginators which do not collect stats do not pay for checking whether they do.
+    They call the methods of the class which was instrumented, which is _uninstrumented.
+    """
+
+    def __reduce_ex__(self, protocol):
+        return self._reduce_featured(protocol)
+
+    @property
+    def index(self):
+        return self._index
+
+    @index.setter
+    def index(self, value):
+        stats = self.stats
+        stats.moves += 1
+        self._uninstrumented.index.fset(self, value)
+        if self.on_end_error is None and self._index != value:
+            stats.wraps += 1
+
+    @property
+    def value(self):
+        start = perf_counter()
+        value = self._value_at(self.index)
+        self.stats._time('value', perf_counter() - start)
+        return value
+
+    def _search_with_stats(self, search, cond, stepper):
+        stats = self.stats
+        stats.searches += 1
+        steps = stats.steps
+        try:
+            return search(self, cond, stepper)
+        except StopIteration:
+            stats.exhausted += 1
+            raise
+        finally:
+            stats.search_steps += stats.steps - steps
+
+    def _step_search_with_stats(self, search, cond, stepper):
+        stats = self.stats
+        stats.searches += 1
+        steps = stats.steps
+        try:
+            yield from search(self, cond, stepper)
+        finally:
+            stats.search_steps += stats.steps - steps
+
+    def next_until_cond(self, cond, stepper=None):
+        return self._search_with_stats(self._uninstrumented.next_until_cond, cond, stepper)
+
+    def prev_until_cond(self, cond, stepper=None):
+        return self._search_with_stats(self._uninstrumented.prev_until_cond, cond, stepper)
+
+    def step_next_until_cond(self, cond, stepper=None):
+        return self._step_search_with_stats(self._uninstrumented.step_next_until_cond, cond, stepper)
+
+    def step_prev_until_cond(self, cond, stepper=None):
+        return self._step_search_with_stats(self._uninstrumented.step_prev_until_cond, cond, stepper)
+
+    def _counted_stepper(self, stepper):
+        stats = self.stats
+
+        def counted(obj):
+            stepper(obj)
+            stats.steps += 1
+
+        return counted
+
+    def _search(self, cond, forward):
+        return self._uninstrumented._search(self, self.stats._counted(cond), forward)
+
+    def _step_search(self, cond, forward):
+        return self._uninstrumented._step_search(self, self.stats._counted(cond), forward)
+
+    def _until(self, cond, stepper):
+        return self._uninstrumented._until(self, self.stats._counted(cond), self._counted_stepper(stepper))
+
+    def _step_until(self, cond, stepper):
+        return self._uninstrumented._step_until(self, self.stats._counted(cond), self._counted_stepper(stepper))
+
+    def _candidates(self, forward):
+        stats = self.stats
+        previous = None
+        for index in self._uninstrumented._candidates(self, forward):
+            if previous is not None and (index < previous if forward else index > previous):
+                stats.wraps += 1
+            stats.steps += 1
+            previous = index
+            yield index
+
+
+def _timed_generator(generator, name, stats):
+    """
+    Yields the values of the generator, adding the time spent producing them to the timer of the method.
+    """
+    seconds = 0.0
+    try:
+        while True:
+            start = perf_counter()
+            try:
+                value = next(generator)
+            except StopIteration:
+                return
+            finally:
+                seconds += perf_counter() - start
+            yield value
+    finally:
+        generator.close()
+        stats._time(name, seconds)
+
+
+def _timed(method, name):
+    """
+    Returns the method adding the time spent in it to the timer with the given name.
+    """
+    @wraps(method)
+    def timed(self, *args, **kwargs):
+        stats = self.stats
+        start = perf_counter()
+        try:
+            result = method(self, *args, **kwargs)
+        finally:
+            seconds = perf_counter() - start
+        if isgenerator(result):
+            return _timed_generator(result, name, stats)
+        stats._time(name, seconds)
+        return result
+
+    return timed
+
+
+_instrumented_classes = {}
+
+
+def instrumented(cls):
+    """
+    Returns the subclass of the given Paginator class which collects stats, creating it if needed.
+
+    Parameters
+    ----------
+    cls : type
+        The Paginator class, which is returned as it is if it already collects stats.
+
+    Returns
+    -------
+    instrumented : type
+        The subclass of the class which collects stats.
+    """
+    if '_uninstrumented' in vars(cls):
+        return cls
+    instrumented_cls = _instrumented_classes.get(cls)
+    if instrumented_cls is None:
+        namespace = {name: value for name, value in vars(_Counting).items() if not name.startswith('__')}
+        namespace.update(__slots__=(), __module__=__name__, __reduce_ex__=_Counting.__reduce_ex__, _uninstrumented=cls)
+        for name in TIMED_METHODS:
+            if hasattr(cls, name):
+                namespace[name] = _timed(namespace.get(name, getattr(cls, name)), name)
+        instrumented_cls = _instrumented_classes[cls] = type(f'Instrumented{cls.__name__}', (cls,), namespace)
+    return instrumented_cls
@@ -0,0 +1,67 @@
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Tuple, Type
+
+from .paginator import BasePaginator
+
+__all__: Tuple[str]
+
+TIMED_METHODS: Tuple[str, ...]
+
+
+class PaginatorStats:
+    moves: int
+    steps: int
+    searches: int
+    search_steps: int
+    predicate_calls: int
+    wraps: int
+    exhausted: int
+    times: Dict[str, List]
+
+    def __init__(self) -> None: ...
+
+    def reset(self) -> None: ...
+
+    def _time(self, name: str, seconds: float, calls: int = ...) -> None: ...
+
+    def _counted(self, cond: Callable[[Any], Any]) -> Callable[[Any], Any]: ...
+
+    def as_dict(self) -> Dict[str, Any]: ...
+
+
+class _Counted:
+    func: Callable[[Any], Any]
+    stats: PaginatorStats
+
+    def __init__(self, func: Callable[[Any], Any], stats: PaginatorStats) -> None: ...
+
+    def __call__(self, value: Any) -> Any: ...
+
+    def __eq__(self, other: Any) -> bool: ...
+
+    def __hash__(self) -> int: ...
+
+
+class _Counting(BasePaginator):
+    _uninstrumented: Type[BasePaginator]
+
+    def __reduce_ex__(self, protocol: int) -> Tuple[Callable[..., BasePaginator], Tuple[type, Any]]: ...
+
+    def _search_with_stats(self, search: Callable[..., Any], cond: Callable[[Any], Any],
+                           stepper: Optional[Callable[[BasePaginator], None]]) -> Any: ...
+
+    def _step_search_with_stats(self, search: Callable[..., Iterator], cond: Callable[[Any], Any],
+                                stepper: Optional[Callable[[BasePaginator], None]]) -> Iterator: ...
+
+    def _counted_stepper(self, stepper: Callable[[BasePaginator], None]) -> Callable[[BasePaginator], None]: ...
+
+
+def _timed_generator(generator: Generator, name: str, stats: PaginatorStats) -> Iterator: ...
+
+
+def _timed(method: Callable[..., Any], name: str) -> Callable[..., Any]: ...
+
+
+_instrumented_classes: Dict[type, type]
+
+
+def instrumented(cls: Type[BasePaginator]) -> Type[BasePaginator]: ...
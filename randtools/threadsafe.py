@@ -0,0 +1,169 @@
+from threading import RLock
+
+from .paginator import Paginator
+
+__all__ = 'ThreadSafePaginator',
+
+
+class ThreadSafePaginator(Paginator):
+    """
+    Paginator which can be shared between threads.
+
+    Moving the index with next, prev, set, take_next, take_prev, claim_next
+    and the until and while conditions happens atomically, so each move sees the index left by the one before it.
+    The lock is only held while the index is moved, and the object at the new index is read after its released.
+    The step generators and setting the index directly are not atomic, use cursor to give each thread its own index.
+
+    Attributes
+    ----------
+    index : int
+        The current index of the Paginator.
+    objects : Iterable
+        The objects on which the Paginator is iterating.
+    """
+
+    def __init__(self, objects, starting_index=0, on_end_error=False, convert_to_list=False, page_size=None,
+                 count=None, cache_length=False):
+        """
+        Creates a new ThreadSafePaginator object with the given parameters, see Paginator.
+        """
+        self._lock = RLock()
+        super().__init__(objects, starting_index, on_end_error, convert_to_list, page_size, count, cache_length)
+
+    def next(self, count=1):
+        """
+        Increments the index by the given amount.
+
+        Parameters
+        ----------
+        count : int
+            How much should the index be incremented by?
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        with self._lock:
+            self.index += count
+            index = self._index
+        return self._value_at(index)
+
+    def set(self, value):
+        """
+        Sets the index of the Paginator, to the given value.
+
+        Parameters
+        ----------
+        value : int
+            The number, that is to be set as the new index of
+            the Paginator.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        IndexError
+            If on_end_error is set to True and the new index is
+            out of bounds of the number of objects.
+        """
+        with self._lock:
+            self.index = value
+            index = self._index
+        return self._value_at(index)
+
+    def claim_next(self, count=1):
+        """
+        Increments the index by the given amount and returns the new index along with its object,
+        so that threads consuming the objects like a queue never claim the same index twice.
+
+        Parameters
+        ----------
+        count : int
+            How much should the index be incremented by?
+
+        Returns
+        -------
+        index : int
+            The new index of the Paginator.
+        value : Any
+            The object at this new index.
+
+        Raises
+        ------
+        StopIteration
+            If on_end_error is False and the index could not be moved as its at the limit.
+        IndexError
+            If on_end_error is set to True and the new index is
+            out of bounds of the number of objects.
+        """
+        with self._lock:
+            previous = self._index
+            self.index = previous + count
+            index = self._index
+        if index == previous and count and self.on_end_error is False:
+            raise StopIteration('End of Iteration')
+        return index, self._value_at(index)
+
+    def next_until_cond(self, cond, stepper=None):
+        """
+        Increments the index until the specified condition is met,
+        the condition is checked while holding the lock.
+
+        Parameters
+        ----------
+        cond : Callable or str
+            The condition at which it will stop incrementing,
+            or the name of an index added with add_index.
+        stepper : Callable, optional
+            The function which is used to increment the index.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        with self._lock:
+            return super().next_until_cond(cond, stepper)
+
+    def prev_until_cond(self, cond, stepper=None):
+        """
+        Decrements the index until the specified condition is met,
+        the condition is checked while holding the lock.
+
+        Parameters
+        ----------
+        cond : Callable or str
+            The condition at which it will stop decrementing,
+            or the name of an index added with add_index.
+        stepper : Callable, optional
+            The function which is used to decrement the index.
+
+        Returns
+        -------
+        value : Any
+            The object at this new index.
+        """
+        with self._lock:
+            return super().prev_until_cond(cond, stepper)
+
+    def take_next(self, count=1):
+        """
+        Increments the index by the given amount in one go,
+        and returns the objects that step_next would have yielded.
+
+        Parameters
+        ----------
+        count : int
+            The number of times to increment the index.
+
+        Returns
+        -------
+        values : list
+            The object at each index which was passed.
+        """
+        with self._lock:
+            return super().take_next(count)
@@ -0,0 +1,28 @@
+from threading import RLock
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from .paginator import Paginator
+
+__all__: Tuple[str]
+
+
+class ThreadSafePaginator(Paginator):
+    _lock: RLock
+
+    def __init__(self, objects: Iterable, starting_index: int = ..., on_end_error: bool = ...,
+                 convert_to_list: bool = ..., page_size: Optional[int] = ...,
+                 count: Optional[Callable[[Any], Optional[int]]] = ..., cache_length: bool = ...) -> None: ...
+
+    def next(self, count: int = ...) -> Any: ...
+
+    def set(self, value: int) -> Any: ...
+
+    def claim_next(self, count: int = ...) -> Tuple[int, Any]: ...
+
+    def next_until_cond(self, cond: Union[Callable[[Any], bool], str],
+                        stepper: Optional[Callable[[Paginator], None]] = ...) -> Any: ...
+
+    def prev_until_cond(self, cond: Union[Callable[[Any], bool], str],
+                        stepper: Optional[Callable[[Paginator], None]] = ...) -> Any: ...
+
+    def take_next(self, count: int = ...) -> List: ...
@@ -0,0 +1,126 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = 'vectorized',
+
+CHUNK_SIZE = 1 << 16
+
+
+class vectorized:
+    """
+    Marks a condition as vectorized, so that it can be checked against
+    whole arrays at once when the Paginator is iterating over a NumPy array.
+
+    The condition must take an array and return an array of booleans of the same length.
+    When the objects are not a NumPy array, it is called with each object like any other condition.
+
+    Attributes
+    ----------
+    func : Callable
+        The vectorized condition.
+    chunk_size : int
+        The number of objects which are checked at once.
+    """
+
+    def __init__(self, func, chunk_size=CHUNK_SIZE):
+        """
+        Creates a new vectorized condition.
+
+        Parameters
+        ----------
+        func : Callable
+            The condition, which takes an array and returns an array of booleans.
+        chunk_size : int
+            The number of objects which are checked at once.
+        """
+        self.func = func
+        self.chunk_size = chunk_size
+
+    def __call__(self, value):
+        return self.func(value)
+
+    def __invert__(self):
+        """
+        Returns the negation of this condition, which is also vectorized.
+        """
+        func = self.func
+        if numpy is None:
+            return vectorized(lambda value: not func(value), self.chunk_size)
+        return vectorized(lambda values: numpy.logical_not(func(values)), self.chunk_size)
+
+
+def supports_vectorized(objects, cond):
+    """
+    Checks if the condition can be checked against the objects in whole arrays.
+
+    Parameters
+    ----------
+    objects : Iterable
+        The objects on which the Paginator is iterating.
+    cond : Callable
+        The condition which is being searched for.
+
+    Returns
+    -------
+    supported : bool
+        Whether find_index can be used.
+    """
+    return numpy is not None and isinstance(cond, vectorized) and isinstance(objects, numpy.ndarray)
+
+
+def _search(objects, cond, start, stop, forward):
+    """
+    Returns the first (or last if not forward) index between start and stop which meets the condition.
+    """
+    chunk_size = cond.chunk_size
+    func = cond.func
+    while start < stop:
+        if forward:
+            chunk_start, chunk_stop = start, min(stop, start + chunk_size)
+            start = chunk_stop
+        else:
+            chunk_start, chunk_stop = max(start, stop - chunk_size), stop
+            stop = chunk_start
+        matches = numpy.flatnonzero(func(objects[chunk_start:chunk_stop]))
+        if matches.size:
+            return chunk_start + int(matches[0] if forward else matches[-1])
+    return None
+
+
+def find_index(objects, cond, index, forward=True, wrap=False):
+    """
+    Finds the index of the next (or previous) object after the given index, which meets the condition.
+
+    The objects are searched in the same order as the Paginator steps through them,
+    so if wrap is True then the search continues from the other limit and ends at the given index.
+
+    Parameters
+    ----------
+    objects : numpy.ndarray
+        The objects which are searched.
+    cond : vectorized
+        The condition which is being searched for.
+    index : int
+        The index after (or before) which the search starts.
+    forward : bool
+        Whether the index is being incremented or decremented.
+    wrap : bool
+        Whether the search wraps around the limits.
+
+    Returns
+    -------
+    index : int, optional
+        The index of the object which meets the condition, or None if no object meets it.
+    """
+    length = len(objects)
+    if forward:
+        ranges = [(index + 1, length)] + ([(0, index + 1)] if wrap else [])
+    else:
+        ranges = [(0, index)] + ([(index, length)] if wrap else [])
+    for start, stop in ranges:
+        found = _search(objects, cond, start, stop, forward)
+        if found is not None:
+            return found
+    return None
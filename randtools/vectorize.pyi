@@ -0,0 +1,25 @@
+from typing import Any, Callable, Optional, Tuple
+
+__all__: Tuple[str]
+
+CHUNK_SIZE: int
+
+
+class vectorized:
+    func: Callable[[Any], Any]
+    chunk_size: int
+
+    def __init__(self, func: Callable[[Any], Any], chunk_size: int = ...) -> None: ...
+
+    def __call__(self, value: Any) -> Any: ...
+
+    def __invert__(self) -> vectorized: ...
+
+
+def supports_vectorized(objects: Any, cond: Callable[[Any], Any]) -> bool: ...
+
+
+def _search(objects: Any, cond: vectorized, start: int, stop: int, forward: bool) -> Optional[int]: ...
+
+
+def find_index(objects: Any, cond: vectorized, index: int, forward: bool = ..., wrap: bool = ...) -> Optional[int]: ...
@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+
+from randtools import AsyncPaginator, Paginator
+from .test_paginator import all_data, check, outcome
+
+starts_proper = check(all_data['starts_proper'])
+
+
+async def aiterate(objects):
+    for obj in objects:
+        await asyncio.sleep(0)
+        yield obj
+
+
+def fetcher(objects, calls=None):
+    async def fetch(offset, limit):
+        if calls is not None:
+            calls.append((offset, limit))
+        await asyncio.sleep(0)
+        return objects[offset:offset + limit]
+
+    return fetch
+
+
+async def async_outcome(pages, name, *args):
+    await pages.start()
+    try:
+        if name.startswith('step'):
+            result = [value async for value in getattr(pages, name)(*args)]
+        else:
+            result = await getattr(pages, name)(*args)
+    except StopAsyncIteration:
+        return StopIteration, pages.index
+    except IndexError:
+        return IndexError, pages.index
+    return result, pages.index
+
+
+def cond(value):
+    return not int(value) % 4 and int(value)
+
+
+async def async_cond(value):
+    return cond(value)
+
+
+calls = [
+    ('next',), ('prev',), ('next', 10), ('prev', 10), ('set', 5),
+    ('next_until_cond', cond), ('prev_until_cond', cond), ('next_while_cond', cond), ('prev_while_cond', cond),
+    ('step_next', 10), ('step_prev', 10), ('step_next_until_cond', cond), ('step_prev_until_cond', cond),
+    ('step_next_while_cond', cond), ('step_prev_while_cond', async_cond), ('next_until_cond', async_cond),
+]
+
+
+@starts_proper
+@pytest.mark.parametrize('call', calls, ids=[' '.join(map(str, call)) for call in calls])
+@pytest.mark.parametrize('source', ['iterable', 'fetch'])
+def test_matches_paginator(sequence, call, source):
+    test_data = dict(sequence['data'])
+    test_data.pop('convert_to_list')
+    objects = list(test_data.pop('objects'))
+    name, *args = call
+
+    if source == 'iterable':
+        pages = AsyncPaginator(aiterate(objects), **test_data)
+    else:
+        pages = AsyncPaginator(fetch=fetcher(objects), fetch_size=3, **test_data)
+    sync_args = [cond if arg is async_cond else arg for arg in args]
+
+    expected = outcome(Paginator(objects, **test_data), name, *sync_args)
+    assert asyncio.run(async_outcome(pages, name, *args)) == expected
+
+
+def test_fetches_lazily():
+    fetch_calls = []
+
+    async def run():
+        pages = AsyncPaginator(fetch=fetcher(list(range(1000)), fetch_calls), fetch_size=10)
+        assert await pages.start() == 0
+        assert await pages.next(15) == 15
+        assert [value async for value in pages.step_prev(3)] == [14, 13, 12]
+        assert [value async for value in pages][:3] == [12, 13, 14]
+
+    asyncio.run(run())
+    assert fetch_calls[:2] == [(0, 10), (10, 10)]
+
+
+def test_many_sessions_share_a_loop():
+    async def session(number):
+        pages = AsyncPaginator(aiterate(range(100)), on_end_error=None)
+        await pages.next(number)
+        return await pages.next_until_cond(lambda value: value % 7 == 0)
+
+    async def run():
+        return await asyncio.gather(*(session(number) for number in range(1000)))
+
+    results = asyncio.run(run())
+    assert results[:8] == [7, 7, 7, 7, 7, 7, 7, 14]
+
+
+def test_needs_one_source():
+    with pytest.raises(ValueError):
+        AsyncPaginator()
+
+
+def test_concurrent_awaits():
+    fetch_calls = []
+
+    async def run():
+        pages = AsyncPaginator(fetch=fetcher(list(range(1000)), fetch_calls), fetch_size=100)
+        await pages.start()
+        assert await asyncio.gather(pages.set(120), pages.set(130)) == [120, 130]
+        assert await pages.set(210) == 210
+        assert len(pages.objects) == 300
+
+        fresh = AsyncPaginator(fetch=fetcher(list(range(1000))), fetch_size=100)
+        await asyncio.gather(fresh.next(), fresh.next())
+        assert fresh.index == 2
+        assert sorted(await asyncio.gather(*(fresh.next() for _ in range(50)))) == list(range(3, 53))
+        assert fresh.index == 52
+
+        searched = AsyncPaginator(aiterate(range(100)))
+        values = await asyncio.gather(*(searched.next_until_cond(lambda value: not value % 10) for _ in range(5)))
+        assert sorted(values) == [10, 20, 30, 40, 50]
+
+        stream = AsyncPaginator(aiterate(range(100)))
+        assert await asyncio.gather(stream.set(50), stream.set(60)) == [50, 60]
+        assert stream.objects == list(range(61))
+
+    asyncio.run(run())
+    assert fetch_calls == [(0, 100), (100, 100), (200, 100)]
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+import randtools.bench as bench
+from randtools import Paginator
+
+
+def test_run_covers_every_combination():
+    results = bench.run(sizes=[50], repeat=1)
+    sources = 5 if bench.numpy is not None else 4
+    assert len(results) == len(bench.BENCHMARKS) * sources * len(bench.MODES)
+    assert all(seconds >= 0 for seconds in results.values())
+
+
+def test_compare_flags_regressions():
+    comparisons, regressions = bench.compare({'a': 1.0, 'b': 2.5, 'c': 1.0}, {'a': 1.0, 'b': 2.0})
+    assert comparisons == {'a': 1.0, 'b': 1.25}
+    assert regressions == ['b']
+
+
+def test_main_writes_and_compares(tmp_path, capsys):
+    baseline = tmp_path / 'baseline.json'
+    args = ['--methods', 'next,next_until_cond', '--sources', 'list', '--sizes', '1e2', '--repeat', '1', '--quiet']
+    assert bench.main(args + ['--output', str(baseline)]) == 0
+    report = json.loads(baseline.read_text())
+    assert set(report['results']) == {f'{method}/list/100/{mode}' for method in ['next', 'next_until_cond']
+                                      for mode in ['clamp', 'raise', 'wrap']}
+
+    report['results'] = {key: seconds / 100 for key, seconds in report['results'].items()}
+    baseline.write_text(json.dumps(report))
+    assert bench.main(args + ['--compare', str(baseline)]) == 1
+    assert '6 regressions out of 6 benchmarks' in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        bench.main(['--methods', 'missing'])
+
+
+def test_covers_every_goto_and_step_to_method():
+    methods = {name for name in dir(Paginator) if name.startswith(('goto_', 'step_to_'))}
+    assert methods <= set(bench.BENCHMARKS)
+    assert bench._far_match(4, False) == [0, 0, 0, 1] and bench._far_match(4, True) == [1, 0, 0, 0]
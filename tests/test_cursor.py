@@ -0,0 +1,69 @@
+import copy
+import tracemalloc
+
+import pytest
+
+from randtools import Cursor, LazyPaginator, Paginator
+from .test_paginator import actions, outcome, starts_proper
+
+
+@starts_proper
+@pytest.mark.parametrize('action', actions.values(), ids=actions.keys())
+def test_matches_paginator(sequence, action):
+    pages = Paginator(**sequence['data'])
+    cursor = pages.cursor()
+    assert isinstance(cursor, Cursor)
+    assert outcome(cursor, action) == outcome(pages, action)
+
+
+def test_cursors_move_independently():
+    pages = Paginator(list(range(100)), on_end_error=None)
+    first, second = pages.cursor(), pages.cursor()
+    first.next(10)
+    second.prev(10)
+    assert (pages.index, first.index, second.index) == (0, 10, 90)
+
+    forked = copy.copy(first)
+    forked.next()
+    assert (first.value, forked.value) == (10, 11)
+    assert forked.store is pages
+    assert forked.on_end_error is None
+
+    copied = copy.copy(pages)
+    assert type(copied) is Paginator
+    copied.page_size = 10
+    assert pages.page_size is None
+
+    clamped = Cursor(forked, 200)
+    assert clamped.index == 99
+    assert clamped.store is pages
+
+
+def test_cursors_share_indexes_and_objects():
+    objects = [0] * 20
+    pages = Paginator(objects, cache_length=True)
+    cursor = pages.cursor()
+    cursor.build_empty_index()
+    assert pages.empty_index is cursor.empty_index
+
+    objects[15] = 'x'
+    pages.update_empty_index(15)
+    assert cursor.goto_next_non_empty() == 'x'
+    assert pages.index == 0
+
+
+def test_cursors_are_small():
+    pages = Paginator(list(range(100)))
+    cursors = [pages.cursor()]
+    tracemalloc.start()
+    cursors.extend(pages.cursor() for _ in range(10000))
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert size / 10000 < 100
+    with pytest.raises(AttributeError):
+        cursors[0].anything = 1
+
+
+def test_lazy_paginators_have_no_cursors():
+    with pytest.raises(TypeError):
+        LazyPaginator(range(10)).cursor()
@@ -0,0 +1,169 @@
+import asyncio
+
+import pytest
+
+from randtools import LazyPaginator, NavigationEvent, Paginator, PaginatorEvents, ThreadSafePaginator
+from .test_paginator import outcome, starts_proper
+from .test_stats import calls, loaded_elsewhere
+
+
+def names(events):
+    return [(event.name, event.old_index, event.index) for event in events]
+
+
+@starts_proper
+@pytest.mark.parametrize('call', calls, ids=[call[0] for call in calls])
+def test_matches_unobserved(sequence, call):
+    expected = outcome(Paginator(**sequence['data']), *call)
+    pages = Paginator(**sequence['data'])
+    pages.subscribe(lambda event: None)
+    cursor = pages.cursor()
+    assert outcome(pages, *call) == expected
+    assert outcome(cursor, *call) == expected
+
+
+def test_moves():
+    events = []
+    pages = Paginator(list(range(10)))
+    pages.subscribe(events.append)
+    pages.next()
+    pages.next(20)
+    pages.next()
+    pages.set(0)
+    pages.prev()
+    assert names(events) == [
+        ('index_changed', 0, 1), ('index_changed', 1, 9), ('hit_end', 1, 9), ('hit_end', 9, 9),
+        ('index_changed', 9, 0), ('hit_start', 9, 0), ('hit_start', 0, 0),
+    ]
+
+
+def test_wrapped():
+    events = []
+    pages = Paginator(list(range(5)), starting_index=4, on_end_error=None)
+    pages.subscribe(events.append, 'wrapped')
+    pages.next()
+    pages.next_until_cond(lambda value: value == 3)
+    pages.prev_until_cond(lambda value: value == 4)
+    assert names(events) == [('wrapped', 4, 0), ('wrapped', 3, 4)]
+
+
+def test_search_sends_one_move():
+    events = []
+    pages = Paginator(list(range(10)))
+    pages.subscribe(events.append)
+    pages.next_until_cond(lambda value: value == 7)
+    with pytest.raises(StopIteration):
+        pages.next_until_cond(lambda value: value == 1)
+    assert names(events) == [('index_changed', 0, 7), ('index_changed', 7, 9), ('hit_end', 7, 9),
+                             ('exhausted', 7, 9)]
+
+
+@pytest.mark.parametrize('cls', [Paginator, LazyPaginator])
+def test_step_search_exhausted(cls):
+    events = []
+    pages = cls(iter(range(5)) if cls is LazyPaginator else range(5))
+    pages.subscribe(events.append, 'index_changed', 'exhausted')
+    assert list(pages.step_next_until_cond(lambda value: False)) == [1, 2, 3, 4]
+    assert names(events) == [('index_changed', index, index + 1) for index in range(4)] + [('exhausted', 4, 4)]
+
+
+@pytest.mark.parametrize('cls', [Paginator, LazyPaginator])
+def test_lazy_search_sends_one_move(cls):
+    events = []
+    pages = cls(iter(range(10)) if cls is LazyPaginator else range(10))
+    pages.subscribe(events.append, 'index_changed')
+    pages.next_while_cond(lambda value: value < 5)
+    assert names(events) == [('index_changed', 0, 5)]
+
+
+def test_coalesce():
+    every, batched = [], []
+    pages = Paginator(list(range(1000)))
+    pages.subscribe(every.append, 'index_changed')
+    pages.subscribe(batched.append, 'index_changed', 'hit_end', coalesce=True)
+    assert len(list(pages.step_next(1000))) == 999
+    assert len(every) == 999
+    assert names(batched) == [('index_changed', 0, 999), ('hit_end', 998, 999)]
+    assert batched[0].count == 999
+
+    batched.clear()
+    with pages.events.batch(pages):
+        pages.prev()
+        pages.prev()
+        assert not batched
+    assert names(batched) == [('index_changed', 999, 997)]
+
+
+def test_cursors_are_separate():
+    events = []
+    pages = Paginator(list(range(10)))
+    pages.subscribe(events.append, coalesce=True)
+    cursor = pages.cursor()
+    steps = pages.step_next(3)
+    next(steps)
+    cursor.next()
+    assert [event.paginator for event in events] == [cursor]
+    list(steps)
+    assert names(events[1:]) == [('index_changed', 0, 3)]
+
+
+def test_async_listener():
+    events = []
+
+    async def listener(event):
+        await asyncio.sleep(0)
+        events.append(event)
+
+    async def main():
+        pages = Paginator(list(range(10)))
+        pages.subscribe(listener)
+        pages.next()
+        assert not events
+        await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+    assert names(events) == [('index_changed', 0, 1)]
+
+    pages = Paginator(list(range(10)))
+    pages.subscribe(listener)
+    pages.next()
+    assert len(events) == 2
+
+
+def test_unsubscribe():
+    events = []
+    pages = ThreadSafePaginator(list(range(10)))
+    assert pages.subscribe(events.append) == events.append
+    assert type(pages) is not ThreadSafePaginator
+    pages.collect_stats()
+    pages.next()
+    pages.unsubscribe(events.append, 'hit_start')
+    assert 'hit_start' not in pages.events
+    pages.unsubscribe(events.append)
+    assert type(pages).__name__ == 'InstrumentedThreadSafePaginator'
+    pages.collect_stats(False)
+    assert type(pages) is ThreadSafePaginator
+    pages.next()
+    assert names(events) == [('index_changed', 0, 1)]
+    assert pages.stats is None and not pages.events
+
+
+def test_pickles_in_a_new_process():
+    pages = Paginator(range(10))
+    pages.subscribe(repr, 'index_changed')
+    pages.collect_stats()
+    pages.next()
+    expression = '(type(pages).__name__, pages.index, "index_changed" in pages.events, pages.next(), pages.stats.moves)'
+    assert loaded_elsewhere(pages, expression) == "('InstrumentedObservedPaginator', 1, True, 2, 2)"
+
+
+def test_unknown_event():
+    with pytest.raises(ValueError):
+        PaginatorEvents().subscribe(print, 'moved')
+
+
+def test_no_listeners_adds_nothing():
+    pages = Paginator(list(range(10)))
+    assert type(pages) is Paginator and pages.events is None
+    assert type(pages.cursor()).__name__ == 'Cursor'
+    assert repr(NavigationEvent('wrapped', pages, 9, 0)) == "NavigationEvent('wrapped', old_index=9, index=0, count=1)"
@@ -0,0 +1,243 @@
+import random
+
+import pytest
+
+from randtools import KeyIndex, LazyPaginator, Paginator, RunIndex, StreamingPaginator
+from .test_paginator import outcome
+
+methods = ['goto_next_non_empty', 'goto_next_empty', 'goto_prev_non_empty', 'goto_prev_empty',
+           'step_to_next_non_empty', 'step_to_next_empty', 'step_to_prev_non_empty', 'step_to_prev_empty']
+
+random.seed(0)
+sequences = [
+    [0, 0, 0, 0],
+    [1, 1, 1],
+    [0, 1],
+    [5],
+    [random.choice([0, 0, 0, 0, 1]) for _ in range(30)],
+    [random.choice([0, 1]) for _ in range(30)],
+]
+
+
+@pytest.mark.parametrize('on_end_error', [False, True, None])
+@pytest.mark.parametrize('method', methods)
+@pytest.mark.parametrize('objects', sequences)
+def test_matches_linear_scan(on_end_error, method, objects):
+    for starting_index in range(len(objects)):
+        pages = Paginator(objects, starting_index, on_end_error)
+        indexed = Paginator(objects, starting_index, on_end_error)
+        indexed.build_empty_index()
+        assert outcome(indexed, method) == outcome(pages, method)
+
+
+def test_updates_and_appends():
+    objects = [0] * 10
+    pages = Paginator(objects)
+    pages.build_empty_index()
+
+    objects[7] = 'x'
+    pages.update_empty_index(7)
+    assert pages.goto_next_non_empty() == 'x'
+    assert pages.index == 7
+
+    objects.extend([0, 0, 'y'])
+    assert pages.goto_next_non_empty() == 'y'
+    assert pages.index == 12
+
+    objects[7] = 0
+    pages.update_empty_index()
+    with pytest.raises(StopIteration):
+        pages.goto_prev_non_empty()
+    assert pages.index == 0
+
+
+def test_run_index_matches_objects():
+    objects = [random.choice([0, 1]) for _ in range(200)]
+    index = RunIndex(objects)
+    for _ in range(200):
+        position = random.randrange(len(objects))
+        objects[position] = 1 - objects[position]
+        index.update(position)
+    assert [index.truth(position) for position in range(len(objects))] == [bool(obj) for obj in objects]
+    assert len(index.starts) == 1 + sum(objects[i] != objects[i - 1] for i in range(1, len(objects)))
+
+
+named_methods = ['next_until_cond', 'next_while_cond', 'prev_until_cond', 'prev_while_cond',
+                 'step_next_until_cond', 'step_next_while_cond', 'step_prev_until_cond', 'step_prev_while_cond']
+
+
+@pytest.mark.parametrize('on_end_error', [False, True, None])
+@pytest.mark.parametrize('method', named_methods)
+def test_named_index_matches_linear_scan(on_end_error, method):
+    objects = [random.randrange(20) for _ in range(40)]
+
+    def unread(value):
+        return value % 7 == 3
+
+    for starting_index in range(len(objects)):
+        pages = Paginator(objects, starting_index, on_end_error)
+        indexed = Paginator(objects, starting_index, on_end_error)
+        indexed.add_index('unread', unread)
+        assert outcome(indexed, method, 'unread') == outcome(pages, method, unread)
+
+
+def test_named_index_invalidation():
+    objects = [0] * 10
+    pages = Paginator(objects)
+    pages.add_index('flagged', lambda value: value == 'flag')
+
+    objects[5] = 'flag'
+    pages.update_indexes(5)
+    assert pages.next_until_cond('flagged') == 'flag'
+
+    objects[5] = 0
+    objects[8] = 'flag'
+    pages.invalidate_indexes('flagged')
+    assert pages.next_until_cond('flagged') == 'flag'
+    assert pages.index == 8
+
+    objects[2] = 'flag'
+    pages.rebuild_indexes()
+    assert pages.prev_until_cond('flagged') == 'flag'
+    assert pages.index == 2
+
+    pages.remove_index('flagged')
+    with pytest.raises(KeyError):
+        pages.next_until_cond('flagged')
+
+
+def test_named_index_with_custom_stepper():
+    pages = Paginator(list(range(10)))
+    pages.add_index('even', lambda value: value % 2 == 0)
+
+    def stepper(obj):
+        obj.next(3)
+
+    assert pages.next_until_cond('even', stepper) == 6
+
+
+timestamps = [0, 10, 10, 20, 35, 50]
+
+
+@pytest.mark.parametrize('key', [None, 'ts', lambda value: value])
+@pytest.mark.parametrize('key_value', [-5, 0, 5, 10, 34, 35, 50, 60])
+def test_seek_matches_linear_scan(key, key_value):
+    pages = Paginator(timestamps, starting_index=3)
+    pages.add_key_index('ts')
+    expected = next((index for index, value in enumerate(timestamps) if value >= key_value), len(timestamps) - 1)
+    pages.seek(key_value, key)
+    assert pages.index == expected
+    expected = max([index for index, value in enumerate(timestamps) if value <= key_value] or [0])
+    pages.seek_prev(key_value, key)
+    assert pages.index == expected
+
+
+def test_seek_modes():
+    pages = Paginator(timestamps, starting_index=2, on_end_error=True)
+    with pytest.raises(IndexError):
+        pages.seek(60)
+    with pytest.raises(IndexError):
+        pages.seek_prev(-5)
+    assert pages.index == 2
+
+    pages = Paginator(timestamps, starting_index=2, on_end_error=None)
+    assert pages.seek(60) == 0
+    assert pages.seek_prev(-5) == 50
+    assert pages.index == 5
+
+
+def test_seek_pages():
+    pages = Paginator(list(range(0, 100, 10)), page_size=3)
+    assert pages.seek(35) == [30, 40, 50]
+    assert pages.seek(95) == [90]
+    assert pages.seek_prev(5) == [0, 10, 20]
+
+
+def test_key_index_is_cached_and_updated():
+    calls = []
+    objects = [{'ts': value} for value in timestamps]
+    pages = Paginator(objects)
+    pages.add_key_index('ts', lambda value: calls.append(value) or value['ts'])
+    assert len(calls) == len(objects)
+
+    cursor = pages.cursor()
+    for key_value in timestamps:
+        cursor.seek(key_value, 'ts')
+    assert cursor.index == 5 and len(calls) == len(objects)
+
+    objects.append({'ts': 70})
+    assert pages.seek(60, 'ts') == {'ts': 70}
+    objects[0] = {'ts': 5}
+    pages.update_indexes(0)
+    assert pages.seek_prev(7, 'ts') == {'ts': 5}
+    objects[0] = {'ts': 0}
+    pages.invalidate_indexes('ts')
+    assert pages.key_indexes['ts'].keys[0] == 5
+    assert pages.seek_prev(0, 'ts') == {'ts': 0}
+
+    pages.remove_key_index('ts')
+    with pytest.raises(KeyError):
+        pages.seek(0, 'ts')
+
+
+def test_seek_calls_key_logarithmically():
+    calls = []
+    pages = Paginator(list(range(1 << 16)))
+    pages.seek(40_000, lambda value: calls.append(value) or value)
+    assert pages.index == 40_000 and len(calls) <= 17
+
+
+def test_seek_needs_indexable_objects():
+    assert KeyIndex([3, 1], lambda value: -value).keys == [-3, -1]
+    with pytest.raises(TypeError):
+        LazyPaginator(iter(timestamps)).seek(10)
+    with pytest.raises(TypeError):
+        LazyPaginator(iter(timestamps)).add_key_index('ts')
+    with pytest.raises(TypeError):
+        StreamingPaginator(iter(timestamps), window_size=3).add_key_index('ts')
+
+
+documents = ['Hello world', 'the quick brown fox', 'HELLO again', 'brown bread', 'quick hello, brown world']
+queries = ['hello', 'brown', 'quick brown', 'Hello World', 'missing', 'hello missing', '']
+
+
+def contains(query):
+    tokens = set(query.lower().replace(',', '').split())
+    return lambda value: bool(tokens) and tokens <= set(value.lower().replace(',', '').split())
+
+
+@pytest.mark.parametrize('on_end_error', [False, True, None])
+@pytest.mark.parametrize('method', ['next', 'prev'])
+@pytest.mark.parametrize('query', queries)
+@pytest.mark.parametrize('start', range(len(documents)))
+def test_find_matches_linear_scan(on_end_error, method, query, start):
+    pages = Paginator(documents, starting_index=start, on_end_error=on_end_error)
+    expected = outcome(pages, f'{method}_until_cond', contains(query))
+    pages = Paginator(documents, starting_index=start, on_end_error=on_end_error)
+    pages.build_text_index()
+    assert outcome(pages, f'find_{method}', query) == expected
+
+
+def test_text_index_is_updated():
+    objects = [{'text': text} for text in documents]
+    pages = Paginator(objects)
+    with pytest.raises(ValueError):
+        pages.find_next('hello')
+    pages.build_text_index(lambda value: value['text'], lambda text: text.lower().split(), background=True)
+    cursor = pages.cursor()
+    assert cursor.find_next('hello') is objects[2]
+
+    objects.append({'text': 'hello there'})
+    assert cursor.find_next('hello') is objects[5]
+    objects[3] = {'text': 'hello bread'}
+    pages.update_text_index(3)
+    assert cursor.find_prev('hello') is objects[3]
+    assert 'brown' in pages.text_index.postings and pages.text_index.postings['brown'] == [1, 4]
+
+    objects[:] = objects[:2]
+    pages.set(0)
+    with pytest.raises(StopIteration):
+        pages.find_next('hello')
+    assert pages.index == 1
+    pages.update_text_index()
+    assert pages.text_index.length == 2
@@ -0,0 +1,205 @@
+import pytest
+
+from randtools import LazyPaginator, OutOfWindowError, Paginator, StreamingPaginator
+from .test_paginator import actions, outcome, starts_proper
+
+
+def make_pair(sequence):
+    test_data = dict(sequence['data'])
+    test_data.pop('convert_to_list')
+    objects = list(test_data.pop('objects'))
+    return Paginator(objects, **test_data), LazyPaginator(iter(objects), **test_data)
+
+
+def counting(count):
+    pulled = []
+
+    def generate():
+        for number in range(count):
+            pulled.append(number)
+            yield number
+
+    return generate(), pulled
+
+
+@starts_proper
+@pytest.mark.parametrize('action', actions.values(), ids=actions.keys())
+def test_matches_paginator(sequence, action):
+    pages, lazy_pages = make_pair(sequence)
+    assert outcome(lazy_pages, action) == outcome(pages, action)
+
+
+def test_pulls_only_what_is_needed():
+    source, pulled = counting(1000)
+    pages = LazyPaginator(source)
+    assert pages.value == 0
+    assert len(pulled) == 1
+
+    pages.next(5)
+    assert len(pulled) == 6
+    pages.prev(3)
+    assert pages.value == 2
+    assert len(pulled) == 6
+
+    pages.set(100)
+    assert len(pulled) == 101
+    assert not pages.is_exhausted
+
+
+def test_clamp_at_unknown_end():
+    source, pulled = counting(10)
+    pages = LazyPaginator(source)
+    pages.next(50)
+    assert pages.index == 9
+    assert pages.is_exhausted
+    assert pages.is_at_end
+
+
+def test_raise_at_unknown_end():
+    source, pulled = counting(10)
+    pages = LazyPaginator(source, on_end_error=True)
+    with pytest.raises(IndexError):
+        pages.set(10)
+    assert pages.index == 0
+    pages.set(9)
+    assert pages.value == 9
+
+
+def test_wrap_at_unknown_end():
+    source, pulled = counting(10)
+    pages = LazyPaginator(source, starting_index=3, on_end_error=None)
+    assert len(pulled) == 4
+    pages.next(10)
+    assert pages.index == 3
+    assert pages.is_exhausted
+
+    source, pulled = counting(10)
+    pages = LazyPaginator(source, on_end_error=None)
+    assert pages.prev() == 9
+    assert len(pages) == 10
+
+
+def test_streaming_keeps_a_bounded_window():
+    pages = StreamingPaginator(iter(range(1000)), window_size=10)
+    assert list(pages.step_next(500)) == list(range(1, 501))
+    assert len(pages.objects) == 10
+    assert list(pages.step_prev(9)) == list(range(499, 490, -1))
+
+    with pytest.raises(OutOfWindowError):
+        pages.prev()
+    assert pages.index == 491
+    assert pages.value == 491
+
+
+def test_streaming_byte_budget():
+    pages = StreamingPaginator(('x' * 100 for _ in range(1000)), window_bytes=1000)
+    pages.set(999)
+    assert 2 <= len(pages.objects) < 10
+    assert pages.is_at_end
+
+
+def test_streaming_repulls_from_factory():
+    pages = StreamingPaginator(range(100), window_size=4, source_factory=lambda: range(100))
+    pages.set(50)
+    assert pages.prev(40) == 10
+    assert list(pages.step_prev_until_cond(lambda value: value == 2)) == list(range(9, 1, -1))
+    assert pages.next(90) == 92
+    assert len(pages.objects) <= 4
+
+
+def test_streaming_wraps_around():
+    pages = StreamingPaginator(range(10), on_end_error=None, window_size=3, source_factory=lambda: range(10))
+    assert list(pages.step_next(12)) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 0]
+    assert pages.prev() == 9
+
+
+def test_streaming_needs_a_window():
+    with pytest.raises(ValueError):
+        StreamingPaginator(range(10))
+    with pytest.raises(ValueError):
+        StreamingPaginator(range(10), window_size=1)
+
+
+def test_take_and_iter():
+    source, pulled = counting(1000)
+    pages = LazyPaginator(source)
+    assert pages.take_next(3) == [1, 2, 3]
+    assert pages.take_prev(2) == [2, 1]
+    iterator = iter(pages)
+    assert [next(iterator) for _ in range(5)] == [1, 2, 3, 4, 5]
+    assert len(pulled) < 10
+
+    pages = StreamingPaginator(range(10), starting_index=4, on_end_error=None, window_size=3)
+    assert pages.take_next(3) == [5, 6, 7]
+    with pytest.raises(OutOfWindowError):
+        list(pages)
+
+
+@pytest.mark.parametrize('cls', [LazyPaginator, StreamingPaginator])
+def test_empty_index_needs_indexable_objects(cls):
+    pages = cls(iter([0, 0, 0, 1, 0]), window_size=3) if cls is StreamingPaginator else cls(iter([0, 0, 0, 1, 0]))
+    with pytest.raises(TypeError):
+        pages.build_empty_index()
+    assert pages.goto_next_non_empty() == 1
+    assert pages.index == 3
+    assert pages.goto_prev_empty() == 0
+    assert pages.index == 2
+
+
+def test_named_index_needs_indexable_objects():
+    pages = LazyPaginator(iter([0, 0, 0, 1, 0]))
+    with pytest.raises(TypeError):
+        pages.add_index('one', lambda value: value == 1)
+    with pytest.raises(KeyError):
+        pages.next_until_cond('one')
+    assert pages.next_until_cond(lambda value: value == 1) == 1
+    assert pages.index == 3
+
+
+def test_text_index_needs_indexable_objects():
+    pages = LazyPaginator(iter(['a', 'b', 'c d']))
+    with pytest.raises(TypeError):
+        pages.build_text_index()
+    with pytest.raises(ValueError):
+        pages.find_next('d')
+
+
+def test_streaming_list_does_not_drain():
+    pages = StreamingPaginator(iter(range(100)), starting_index=20, window_size=5)
+    with pytest.raises(TypeError):
+        len(pages)
+    assert list(pages) == list(range(20, 100))
+    assert len(pages) == 100
+
+
+def test_window_pulls_only_what_is_needed():
+    source, pulled = counting(10 ** 6)
+    pages = LazyPaginator(source, starting_index=1)
+    assert pages.window(2) == [0, 1, 2, 3]
+    assert len(pulled) == 4
+
+    pages = StreamingPaginator(iter(range(100)), starting_index=50, window_size=10)
+    assert pages.window(2) == [48, 49, 50, 51, 52]
+    pages.set(99)
+    assert pages.window(2) == [97, 98, 99]
+
+    pages = LazyPaginator(iter(range(10)), starting_index=9, on_end_error=None)
+    assert pages.window(2) == [7, 8, 9, 0, 1]
+
+
+@pytest.mark.parametrize('cls', [LazyPaginator, StreamingPaginator])
+def test_state_of_unknown_length(cls):
+    def create(count=100):
+        if cls is StreamingPaginator:
+            return cls(iter(range(count)), window_size=5)
+        return cls(iter(range(count)))
+
+    pages = create()
+    pages.set(20)
+    restored = create()
+    assert restored.load_state(pages.dump_state('v'), 'v')
+    assert restored.index == 20
+
+    assert pages._state_length() == -1
+    pages.length
+    assert pages._state_length() == 100
@@ -0,0 +1,72 @@
+import pytest
+
+from randtools import Paginator, PredicateCache
+from .test_paginator import is_multiple, outcome, starts_proper
+
+
+calls = [
+    ('next_until_cond', is_multiple), ('prev_until_cond', is_multiple), ('next_while_cond', is_multiple),
+    ('prev_while_cond', is_multiple), ('step_next_until_cond', is_multiple), ('step_prev_while_cond', is_multiple),
+    ('goto_next_empty',), ('goto_prev_non_empty',), ('step_to_next_non_empty',),
+]
+
+
+@starts_proper
+@pytest.mark.parametrize('call', calls, ids=[call[0] for call in calls])
+def test_matches_uncached(sequence, call):
+    expected = outcome(Paginator(**sequence['data']), *call)
+    pages = Paginator(**sequence['data'])
+    pages.cache_predicates()
+    assert outcome(pages, *call) == expected
+    pages.index = sequence['data'].get('starting_index', 0)
+    assert outcome(pages, *call) == expected
+
+
+def test_skips_checked_objects():
+    checked = []
+
+    def cond(value):
+        checked.append(value)
+        return value % 10 == 0
+
+    pages = Paginator(range(100), on_end_error=None)
+    cache = pages.cache_predicates()
+    assert pages.next_until_cond(cond) == 10
+    pages.set(0)
+    assert pages.next_until_cond(cond) == 10
+    assert pages.next_while_cond(cond) == 11
+    assert checked == list(range(1, 12))
+    assert (cache.hits, cache.misses) == (10, 11)
+    assert pages.cursor().predicate_cache is cache
+
+
+def test_invalidation():
+    objects = [0] * 10
+    pages = Paginator(objects)
+    cache = pages.cache_predicates()
+    with pytest.raises(StopIteration):
+        pages.goto_next_non_empty()
+
+    objects[5] = 1
+    pages.set(0)
+    with pytest.raises(StopIteration):
+        pages.goto_next_non_empty()
+    pages.update_indexes(5)
+    pages.set(0)
+    assert pages.goto_next_non_empty() == 1
+
+    pages.invalidate_indexes()
+    assert len(cache) == 0
+
+
+def test_evicts_least_recently_used():
+    cache = PredicateCache(max_size=3)
+    for index in range(5):
+        cache.check(bool, index, index)
+    assert len(cache) == 3
+    assert cache.check(bool, 4, None) == 1
+    assert cache.check(bool, 0, 0) is False
+    assert cache.stats == {'hits': 1, 'misses': 6, 'size': 3, 'max_size': 3}
+
+    cache.invalidate(cond=bool)
+    assert len(cache) == 0
@@ -1,6 +1,8 @@
+from collections.abc import Iterator
+
 import pytest
 
-from randtools import Paginator
+from randtools import Paginator, dump_states, load_states
 
 
 class data:
@@ -423,10 +425,50 @@ def check(test_data):
     return pytest.mark.parametrize("sequence", test_data)
 
 
+def outcome(pages, action, *args):
+    """
+    Returns the result of the action along with the index it left the pages at,
+    or the type of the error it raised instead of the result.
+    The action is either the name of a method which is called with the args, or a function taking the pages.
+    """
+    try:
+        result = getattr(pages, action)(*args) if isinstance(action, str) else action(pages)
+        if isinstance(result, Iterator):
+            result = list(result)
+    except Exception as err:
+        return type(err), pages.index
+    return result, pages.index
+
+
 all_test_data = check(sum(all_data.values(), []))
 starts_proper = check(all_data['starts_proper'])
 
 
+def is_multiple(value):
+    return not int(value) % 4 and int(value)
+
+
+actions = {
+    'next': lambda pages: pages.next(),
+    'prev': lambda pages: pages.prev(),
+    'extreme_next': lambda pages: pages.next(10),
+    'extreme_prev': lambda pages: pages.prev(10),
+    'set': lambda pages: pages.set(5),
+    'next_until_cond': lambda pages: pages.next_until_cond(is_multiple),
+    'prev_until_cond': lambda pages: pages.prev_until_cond(lambda value: not int(value) % 3 and int(value)),
+    'prev_while_cond': lambda pages: pages.prev_while_cond(lambda value: int(value) % 3),
+    'step_next': lambda pages: pages.step_next(10),
+    'step_prev': lambda pages: pages.step_prev(10),
+    'step_to_next_empty': lambda pages: pages.step_to_next_empty(),
+    'step_to_prev_empty': lambda pages: pages.step_to_prev_empty(),
+    'goto_next_empty': lambda pages: pages.goto_next_empty(),
+    'take_prev': lambda pages: pages.take_prev(4),
+    'window': lambda pages: pages.window(2),
+    'iter': lambda pages: iter(pages),
+    'is_at_end': lambda pages: pages.is_at_end,
+}
+
+
 def get_data_and_expected(sequence, *keys) -> tuple:
     return sequence['data'], *[sequence['expected'][attr] for attr in keys]
 
@@ -881,3 +923,221 @@ def test_length(sequence):
     pages = Paginator(**test_data)
 
     assert len(pages) == len(pages.objects)
+
+
+def test_page_size():
+    pages = Paginator(range(25), page_size=10)
+    assert len(pages) == 3
+    assert list(pages.value) == list(range(10))
+    assert list(pages.next()) == list(range(10, 20))
+    assert list(pages.next(5)) == list(range(20, 25))
+    assert pages.is_at_end
+
+    pages = Paginator(list(range(25)), page_size=10, on_end_error=None)
+    assert pages.prev() == list(range(20, 25))
+    assert list(pages.step_next(3)) == [list(range(0, 10)), list(range(10, 20)), list(range(20, 25))]
+
+    pages = Paginator(range(20), page_size=10, on_end_error=True)
+    try:
+        pages.set(2)
+    except Exception as err:
+        assert isinstance(err, IndexError)
+
+    try:
+        Paginator(range(20), page_size=0)
+    except Exception as err:
+        assert isinstance(err, ValueError)
+
+
+def test_window():
+    pages = Paginator(list(range(10)), starting_index=1)
+    assert pages.window(2) == [0, 1, 2, 3]
+    assert pages.index == 1
+
+    pages = Paginator(list(range(10)), starting_index=1, on_end_error=None)
+    assert pages.window(2) == [9, 0, 1, 2, 3]
+    assert pages.window(20) == [1, 2, 3, 4, 5, 6, 7, 8, 9, 0]
+
+    pages = Paginator(list(range(25)), starting_index=2, page_size=10)
+    assert pages.window(1) == [list(range(10, 20)), list(range(20, 25))]
+
+
+@pytest.mark.parametrize('objects', [list(range(10)), tuple(range(10)), range(10)])
+@pytest.mark.parametrize('on_end_error', [False, True, None])
+@pytest.mark.parametrize('page_size', [None, 3])
+def test_take_matches_step(objects, on_end_error, page_size):
+    for starting_index in range(len(Paginator(objects, page_size=page_size))):
+        for count in [0, 1, 2, 5, 9, 10, 25, -1, -2, -5, -9, -10, -25]:
+            stepped = Paginator(objects, starting_index, on_end_error, page_size=page_size)
+            taken = Paginator(objects, starting_index, on_end_error, page_size=page_size)
+            assert taken.take_next(count) == list(stepped.step_next(count))
+            assert taken.index == stepped.index
+
+            assert taken.take_prev(count) == list(stepped.step_prev(count))
+            assert taken.index == stepped.index
+
+
+def test_iter():
+    pages = Paginator(list(range(10)), starting_index=6)
+    assert list(pages) == [6, 7, 8, 9]
+    assert pages.index == 6
+
+    pages = Paginator(list(range(10)), starting_index=6, on_end_error=None)
+    assert list(pages) == [6, 7, 8, 9, 0, 1, 2, 3, 4, 5]
+
+    pages = Paginator(range(10), starting_index=1, page_size=4)
+    assert [list(page) for page in pages] == [[4, 5, 6, 7], [8, 9]]
+
+
+class Unsized:
+    def __init__(self, length):
+        self.length = length
+        self.probes = 0
+
+    def __getitem__(self, index):
+        self.probes += 1
+        if isinstance(index, slice):
+            return list(range(self.length))[index]
+        if not 0 <= index < self.length:
+            raise IndexError(index)
+        return index
+
+
+def test_cached_length():
+    counts = []
+    objects = list(range(10))
+
+    def count(items):
+        counts.append(len(items))
+        return len(items)
+
+    pages = Paginator(objects, count=count, cache_length=True)
+    pages.next(3)
+    pages.prev()
+    assert pages.is_at_end is False
+    assert len(counts) == 1
+
+    objects.extend(range(10, 20))
+    assert pages.next(100) == 9
+    assert pages.refresh_length() == 20
+    assert pages.next(100) == 19
+
+    pages = Paginator(objects, count=count)
+    pages.next()
+    assert len(counts) > 3
+
+
+def test_unknown_length():
+    objects = Unsized(1000)
+    pages = Paginator(objects, on_end_error=True)
+    assert pages.set(500) == 500
+    assert pages.length_hint == 501
+    try:
+        pages.set(1000)
+    except Exception as err:
+        assert isinstance(err, IndexError)
+
+    objects = Unsized(1000)
+    pages = Paginator(objects)
+    assert pages.next(5000) == 999
+    assert objects.probes < 40
+    assert len(pages) == 1000
+
+    pages = Paginator(Unsized(10), on_end_error=None)
+    assert pages.prev() == 9
+    assert pages.take_next(3) == [0, 1, 2]
+
+    pages = Paginator(Unsized(0))
+    assert len(pages) == 0
+
+    pages = Paginator([1, 2, 3], count=lambda objects: None)
+    assert pages.set(10) == 3
+
+
+def test_length_hint_does_not_count():
+    class Remote(Unsized):
+        def __len__(self):
+            raise AssertionError('The objects should not be counted')
+
+    pages = Paginator(Remote(100), count=lambda objects: None)
+    assert pages.length_hint == 1
+    pages.set(20)
+    assert pages.length_hint == 21
+
+
+def test_state_round_trip():
+    pages = Paginator(range(100), starting_index=42, on_end_error=None)
+    state = pages.dump_state('v1')
+    assert len(state) == 30
+
+    restored = Paginator(range(100))
+    assert restored.load_state(state, 'v1')
+    assert (restored.index, restored.on_end_error) == (42, None)
+
+    cursors = [pages.cursor() for _ in range(3)]
+    for number, cursor in enumerate(cursors):
+        cursor.next(number)
+    loaded = load_states(dump_states(cursors, 'v1'), restored, 'v1')
+    assert [cursor.index for cursor in loaded] == [42, 43, 44]
+    assert all(cursor.store is restored for cursor in loaded)
+
+
+def test_state_converts_pages():
+    state = Paginator(range(100), page_size=10, starting_index=3).dump_state()
+    pages = Paginator(range(100), page_size=4)
+    assert pages.load_state(state)
+    assert pages.index == 7
+    assert list(pages.value) == [28, 29, 30, 31]
+
+
+@pytest.mark.parametrize('on_end_error, expected', [(False, 49), (None, 30), (True, IndexError)])
+def test_state_stale_source(on_end_error, expected):
+    state = Paginator(range(100), starting_index=80, on_end_error=on_end_error).dump_state(1)
+    pages = Paginator(range(50))
+    if expected is IndexError:
+        with pytest.raises(IndexError):
+            pages.load_state(state, 1)
+        return
+    assert not pages.load_state(state, 1)
+    assert pages.index == expected
+
+    same_length = Paginator(range(100))
+    assert not same_length.load_state(state, 2)
+    assert same_length.index == 80
+
+
+def test_state_invalid():
+    with pytest.raises(ValueError):
+        Paginator(range(10)).load_state(b'\0' * 30)
+    with pytest.raises(ValueError):
+        Paginator(range(10)).load_state(b'\1' * 10)
+
+
+class SteppingPaginator(Paginator):
+    _scannable = False
+
+
+@pytest.mark.parametrize('on_end_error', [False, True, None])
+@pytest.mark.parametrize('page_size', [None, 3])
+@pytest.mark.parametrize('method', ['next_until_cond', 'prev_until_cond', 'next_while_cond', 'prev_while_cond',
+                                    'step_next_until_cond', 'step_prev_until_cond', 'step_next_while_cond'])
+@pytest.mark.parametrize('divisor', [1, 4, 100])
+def test_scan_matches_stepping(on_end_error, page_size, method, divisor):
+    def cond(value):
+        return (value[0] if page_size else value) % divisor == 3 % divisor
+
+    for starting_index in range(len(Paginator(range(10), page_size=page_size))):
+        expected = outcome(SteppingPaginator(range(10), starting_index, on_end_error, page_size=page_size),
+                           method, cond)
+        actual = outcome(Paginator(range(10), starting_index, on_end_error, page_size=page_size), method, cond)
+        assert actual == expected
+
+
+@pytest.mark.parametrize('on_end_error', [False, True, None])
+def test_custom_stepper(on_end_error):
+    def stepper(obj):
+        obj.next(2)
+
+    pages = Paginator(range(10), on_end_error=on_end_error)
+    assert pages.next_until_cond(lambda value: value % 3 == 0, stepper) == 6
+    assert list(pages.step_next_until_cond(lambda value: value > 7, stepper)) == [8]
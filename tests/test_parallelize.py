@@ -0,0 +1,89 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from randtools import LazyPaginator, Paginator, lookahead, parallel
+from randtools.parallelize import find_parallel
+from .test_paginator import outcome
+
+modes = pytest.mark.parametrize('on_end_error', [False, True, None])
+
+
+def matches_five(value):
+    return value % 40 == 5
+
+
+def slow_match(value):
+    time.sleep(0.005)
+    return value == 10
+
+
+@pytest.fixture(scope='module')
+def cond():
+    with parallel(matches_five, chunk_size=8, max_workers=2) as cond:
+        yield cond
+
+
+@modes
+@pytest.mark.parametrize('method', ['next_until_cond', 'prev_until_cond', 'next_while_cond', 'prev_while_cond',
+                                    'step_next_until_cond', 'step_prev_until_cond'])
+@pytest.mark.parametrize('starting_index', [0, 3, 50, 99])
+def test_matches_serial_search(cond, on_end_error, method, starting_index):
+    serial = Paginator(list(range(100)), starting_index, on_end_error)
+    fast = Paginator(list(range(100)), starting_index, on_end_error)
+    assert outcome(fast, method, cond) == outcome(serial, method, matches_five)
+
+
+@pytest.mark.parametrize('wrap, expected', [(False, None), (True, 5)])
+def test_searches_wrapped_part(cond, wrap, expected):
+    assert find_parallel(list(range(60)), cond, 50, True, wrap) == expected
+
+
+def test_cancels_after_match():
+    calls = []
+
+    def check(value):
+        calls.append(value)
+        return slow_match(value)
+
+    with ThreadPoolExecutor(2) as executor:
+        cond = parallel(check, chunk_size=4, max_in_flight=4, executor=executor)
+        assert Paginator(list(range(1000))).next_until_cond(cond) == 10
+    assert len(calls) < 40
+
+
+@modes
+@pytest.mark.parametrize('method', ['next_until_cond', 'prev_while_cond', 'step_next_until_cond',
+                                    'step_prev_while_cond'])
+@pytest.mark.parametrize('starting_index', [0, 50, 99])
+def test_lookahead_matches_serial_search(on_end_error, method, starting_index):
+    serial = Paginator(list(range(100)), starting_index, on_end_error)
+    fast = Paginator(list(range(100)), starting_index, on_end_error)
+    with lookahead(lambda value: value % 40 == 5, ahead=4) as cond:
+        assert outcome(fast, method, cond) == outcome(serial, method, matches_five)
+
+
+def test_lookahead_limits_in_flight():
+    lock = threading.Lock()
+    running = [0, 0]
+
+    def check(value):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        time.sleep(0.002)
+        with lock:
+            running[0] -= 1
+        return value == 60
+
+    with lookahead(check, ahead=5, max_workers=10) as cond:
+        start = time.perf_counter()
+        assert Paginator(list(range(100))).next_until_cond(cond) == 60
+        assert time.perf_counter() - start < 60 * 0.002
+    assert running[1] == 5
+
+
+def test_lazy_checks_serially(cond):
+    assert LazyPaginator(iter(range(100))).next_until_cond(cond) == 5
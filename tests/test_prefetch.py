@@ -0,0 +1,59 @@
+import time
+
+from randtools import PageSource, Paginator, PrefetchingSource
+
+
+class SlowSource:
+    def __init__(self, length, latency=0.02):
+        self.length = length
+        self.latency = latency
+        self.fetched = []
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        time.sleep(self.latency)
+        self.fetched.append(index)
+        return f'page {index}'
+
+
+def wait_for(source):
+    while source.in_flight:
+        time.sleep(0.001)
+
+
+def test_is_a_page_source():
+    assert isinstance(SlowSource(10), PageSource)
+    assert isinstance([], PageSource)
+
+
+def test_prefetches_ahead():
+    with PrefetchingSource(SlowSource(100), ahead=2) as source:
+        pages = Paginator(source)
+        assert pages.value == 'page 0'
+        for index in range(1, 10):
+            wait_for(source)
+            assert pages.next() == f'page {index}'
+        assert source.misses == 1
+        assert source.hits == 9
+
+
+def test_follows_direction():
+    slow = SlowSource(100)
+    with PrefetchingSource(slow, ahead=3, behind=1) as source:
+        pages = Paginator(source, starting_index=50)
+        for _ in range(5):
+            wait_for(source)
+            pages.prev()
+        wait_for(source)
+        assert source.direction == -1
+        assert {42, 43, 44} <= set(slow.fetched)
+        assert source.misses == 1
+
+
+def test_caps_in_flight():
+    with PrefetchingSource(SlowSource(100, latency=0.1), ahead=10, max_workers=2) as source:
+        assert source[0] == 'page 0'
+        assert source.in_flight <= 2
+        assert source[0:3] == ['page 0', 'page 1', 'page 2']
@@ -0,0 +1,136 @@
+import json
+import os
+
+import pytest
+
+from randtools import CSVFile, JSONLFile, Paginator, RecordFile, records
+
+
+@pytest.fixture(params=['numpy', 'find'])
+def scanner(request, monkeypatch):
+    if request.param == 'find':
+        monkeypatch.setattr(records, 'numpy', None)
+    elif records.numpy is None:
+        pytest.skip('numpy is not installed')
+
+
+@pytest.mark.parametrize('content, expected', [
+    (b'a\nbb\n\nccc\n', ['a', 'bb', '', 'ccc']),
+    (b'a\nbb\nccc', ['a', 'bb', 'ccc']),
+    (b'a\r\nbb\r\n', ['a', 'bb']),
+    (b'\n', ['']),
+    (b'', []),
+])
+def test_records(tmp_path, scanner, content, expected):
+    path = tmp_path / 'records.txt'
+    path.write_bytes(content)
+    with RecordFile(path) as lines:
+        assert len(lines) == len(expected)
+        assert lines[:] == expected
+        if expected:
+            assert lines[-1] == expected[-1]
+        with pytest.raises(IndexError):
+            lines[len(expected)]
+
+
+def test_multi_byte_delimiter(tmp_path, scanner):
+    path = tmp_path / 'records.txt'
+    path.write_bytes(b'one||two||three')
+    assert RecordFile(path, delimiter=b'||', encoding=None)[:] == [b'one', b'two', b'three']
+
+
+def test_paginates_jsonl(tmp_path, scanner):
+    path = tmp_path / 'records.jsonl'
+    path.write_text(''.join(json.dumps({'id': number, 'read': number % 3 == 0}) + '\n' for number in range(1000)))
+    with JSONLFile(path) as rows:
+        pages = Paginator(rows)
+        assert pages.set(500) == {'id': 500, 'read': False}
+        assert pages.next_until_cond(lambda row: row['read'])['id'] == 501
+        assert pages.next(1000)['id'] == 999
+        assert len(pages) == 1000
+
+
+def test_csv(tmp_path, scanner):
+    path = tmp_path / 'records.csv'
+    path.write_text('name,age\nalice,30\n"smith, bob",41\n')
+    with CSVFile(path) as rows:
+        assert rows.header == ['name', 'age']
+        assert len(rows) == 2
+        assert rows[1] == {'name': 'smith, bob', 'age': '41'}
+        assert rows[-2]['name'] == 'alice'
+
+    with CSVFile(path, header=False) as rows:
+        assert rows[0] == ['name', 'age']
+        assert len(rows) == 3
+
+
+def test_sidecar_index(tmp_path, scanner, monkeypatch):
+    path = tmp_path / 'records.txt'
+    path.write_bytes(b''.join(b'line %d\n' % number for number in range(100)))
+
+    with RecordFile(path, index_path=True) as lines:
+        assert lines[99] == 'line 99'
+    assert (tmp_path / 'records.txt.idx').exists()
+
+    def fail(self, start):
+        raise AssertionError('The file should not be scanned again')
+
+    with monkeypatch.context() as patch:
+        patch.setattr(RecordFile, '_scan', fail)
+        with RecordFile(path, index_path=True) as lines:
+            assert isinstance(lines.offsets, memoryview)
+            assert len(lines) == 100
+            assert lines[42] == 'line 42'
+
+
+@pytest.mark.parametrize('ending', [b'\n', b''])
+def test_sidecar_index_extends_after_appends(tmp_path, scanner, monkeypatch, ending):
+    path = tmp_path / 'records.txt'
+    index_path = tmp_path / 'offsets.idx'
+    path.write_bytes(b'a\nb\nc' + ending)
+    RecordFile(path, index_path=index_path).close()
+
+    with open(path, 'ab') as file:
+        file.write(b'd\ne\n')
+    scans = []
+    original_scan = RecordFile._scan
+    monkeypatch.setattr(RecordFile, '_scan', lambda self, start: scans.append(start) or original_scan(self, start))
+
+    with RecordFile(path, index_path=index_path) as lines:
+        expected = ['a', 'b', 'c', 'd', 'e'] if ending else ['a', 'b', 'cd', 'e']
+        assert lines[:] == expected
+    assert scans and scans[0] > 0
+
+    monkeypatch.undo()
+    with RecordFile(path, index_path=index_path) as lines:
+        assert lines[:] == expected
+
+
+def test_sidecar_index_rejects_changed_files(tmp_path, scanner):
+    path = tmp_path / 'records.txt'
+    index_path = tmp_path / 'offsets.idx'
+    path.write_bytes(b'first\nsecond\n')
+    RecordFile(path, index_path=index_path).close()
+
+    path.write_bytes(b'1\n2\n3\n')
+    with RecordFile(path, index_path=index_path) as lines:
+        assert lines[:] == ['1', '2', '3']
+
+    index_path.write_bytes(b'not an index')
+    with RecordFile(path, index_path=index_path) as lines:
+        assert lines[:] == ['1', '2', '3']
+
+
+def test_sidecar_index_rejects_files_edited_in_place(tmp_path, scanner):
+    path = tmp_path / 'records.txt'
+    content = bytearray(b''.join(b'%05d' % number + b'x' * 50 + b'\n' for number in range(2000)))
+    path.write_bytes(content)
+    RecordFile(path, index_path=True).close()
+
+    newline = content.index(b'01001') - 1
+    content[newline], content[newline + 3] = content[newline + 3], content[newline]
+    path.write_bytes(content)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    with RecordFile(path, index_path=True) as lines:
+        assert lines[:] == content.decode().splitlines()
@@ -0,0 +1,85 @@
+import time
+
+from randtools import Paginator, PaginatorRegistry
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_eviction():
+    evicted = []
+    registry = PaginatorRegistry(max_entries=3, on_evict=lambda *args: evicted.append(args))
+    pages = {key: Paginator(range(10)) for key in 'abcd'}
+    for key in 'abc':
+        registry[key] = pages[key]
+    assert registry['a'] is pages['a']
+
+    registry['d'] = pages['d']
+    assert list(registry) == ['c', 'a', 'd']
+    assert evicted == [('b', pages['b'], 'entries')]
+
+
+def test_ttl_expiry():
+    clock = Clock()
+    evicted = []
+    registry = PaginatorRegistry(ttl=10, clock=clock, on_evict=lambda key, pages, reason: evicted.append(key))
+    registry['a'] = Paginator(range(10))
+    clock.now = 5
+    registry['b'] = Paginator(range(10))
+    clock.now = 9
+    registry['a'].next()
+
+    clock.now = 16
+    assert 'b' not in registry
+    assert registry['a'].index == 1
+    assert evicted == ['b']
+
+    clock.now = 100
+    assert registry.get('a') is None
+    assert len(registry) == 0
+
+    registry['c'] = Paginator(range(10))
+    clock.now = 111
+    assert len(registry) == 0
+    assert list(registry) == []
+    assert evicted == ['b', 'a', 'c']
+
+
+def test_memory_cap():
+    evicted = []
+    registry = PaginatorRegistry(max_memory=1000, sizeof=lambda pages: 300,
+                                 on_evict=lambda key, pages, reason: evicted.append((key, reason)))
+    for key in range(5):
+        registry[key] = Paginator(range(10))
+    assert len(registry) == 3
+    assert registry.memory == 900
+    assert evicted == [(0, 'memory'), (1, 'memory')]
+
+    registry.pop(4)
+    del registry[3]
+    assert registry.memory == 300
+    assert len(evicted) == 2
+
+
+def test_get_or_create():
+    registry = PaginatorRegistry()
+    created = registry.get_or_create('a', lambda: Paginator(range(10)))
+    assert registry.get_or_create('a', lambda: Paginator(range(20))) is created
+
+
+def test_many_sessions():
+    registry = PaginatorRegistry(max_entries=100_000, ttl=60)
+    store = Paginator(list(range(100)))
+    for key in range(150_000):
+        registry[key] = store.cursor()
+    assert len(registry) == 100_000
+
+    start = time.perf_counter()
+    for key in range(50_000, 150_000):
+        registry[key].next()
+    assert time.perf_counter() - start < 2
@@ -0,0 +1,104 @@
+import json
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from randtools import LazyPaginator, Paginator, PaginatorStats, ThreadSafePaginator
+from .test_paginator import is_multiple, outcome, starts_proper
+
+
+def loaded_elsewhere(obj, expression):
+    """
+    Loads the pickled object as pages in a new interpreter, and returns the repr of the expression there.
+    """
+    script = f'import pickle, sys; pages = pickle.load(sys.stdin.buffer); print(repr({expression}))'
+    result = subprocess.run([sys.executable, '-c', script], input=pickle.dumps(obj), capture_output=True, check=True,
+                            cwd=Path(__file__).parent.parent)
+    return result.stdout.decode().strip()
+
+
+calls = [
+    ('next',), ('prev', 3), ('set', 5), ('next_until_cond', is_multiple), ('prev_while_cond', is_multiple),
+    ('step_next', 10), ('step_prev_until_cond', is_multiple), ('goto_next_empty',), ('take_next', 4),
+]
+
+
+@starts_proper
+@pytest.mark.parametrize('call', calls, ids=[call[0] for call in calls])
+def test_matches_uninstrumented(sequence, call):
+    expected = outcome(Paginator(**sequence['data']), *call)
+    pages = Paginator(**sequence['data'])
+    pages.collect_stats()
+    cursor = pages.cursor()
+    assert outcome(pages, *call) == expected
+    assert outcome(cursor, *call) == expected
+
+
+def test_counts():
+    pages = Paginator(list(range(100)), on_end_error=None)
+    stats = pages.collect_stats()
+    pages.next()
+    pages.next_until_cond(lambda value: value == 50)
+    list(pages.step_next(60))
+    pages.prev_while_cond(lambda value: value > 5)
+    pages.cursor().next(3)
+    with pytest.raises(StopIteration):
+        pages.next_until_cond(lambda value: False)
+
+    exported = json.loads(json.dumps(stats.as_dict()))
+    assert {key: exported[key] for key in ['moves', 'searches', 'search_steps', 'predicate_calls', 'wraps',
+                                           'exhausted']} == {'moves': 4, 'searches': 3, 'search_steps': 154,
+                                                             'predicate_calls': 154, 'wraps': 2, 'exhausted': 1}
+    assert exported['steps'] == 214
+    assert exported['times']['next']['calls'] == 2
+    assert exported['times']['step_next']['seconds'] > 0
+
+    stats.reset()
+    assert stats.as_dict()['moves'] == 0
+
+
+def test_counts_calls_through_the_cache():
+    pages = Paginator(list(range(100)))
+    pages.cache_predicates()
+    stats = pages.collect_stats()
+    for _ in range(3):
+        pages.set(0)
+        pages.next_until_cond(is_multiple)
+    assert stats.predicate_calls == 4
+    assert pages.predicate_cache.hits == 8
+
+
+@pytest.mark.parametrize('cls', [Paginator, LazyPaginator, ThreadSafePaginator])
+def test_disable(cls):
+    pages = cls(range(10))
+    assert pages.collect_stats() is pages.stats
+    assert isinstance(pages, cls) and type(pages) is not cls
+    pages.next_until_cond(lambda value: value == 3, lambda obj: obj.next(3))
+    assert pages.stats.steps == 1
+    if cls is not ThreadSafePaginator:
+        assert type(pickle.loads(pickle.dumps(pages))) is type(pages)
+
+    assert pages.collect_stats(False) is None
+    assert type(pages) is cls
+    assert pages.next() == 4
+
+
+def test_pickles_in_a_new_process():
+    pages = Paginator(range(10))
+    pages.collect_stats()
+    pages.next(3)
+    cursor = pages.cursor()
+    cursor.next(2)
+    expression = '[(type(paginator).__name__, paginator.index, paginator.stats.moves) for paginator in pages]'
+    expected = "[('InstrumentedPaginator', 3, 2), ('InstrumentedCursor', 5, 2)]"
+    assert loaded_elsewhere([pages, cursor], expression) == expected
+
+
+def test_disabled_adds_nothing():
+    pages = Paginator(list(range(10)))
+    assert type(pages) is Paginator and pages.stats is None
+    assert type(pages.cursor()).__name__ == 'Cursor'
+    assert isinstance(PaginatorStats().as_dict(), dict)
@@ -0,0 +1,60 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from randtools import Paginator, ThreadSafePaginator
+from .test_paginator import actions, outcome, starts_proper
+
+
+@starts_proper
+@pytest.mark.parametrize('action', actions.values(), ids=actions.keys())
+def test_matches_paginator(sequence, action):
+    expected = outcome(Paginator(**sequence['data']), action)
+    assert outcome(ThreadSafePaginator(**sequence['data']), action) == expected
+
+
+def consume(pages, work=None):
+    claimed = []
+    while True:
+        try:
+            index, value = pages.claim_next()
+        except StopIteration:
+            return claimed
+        if work is not None:
+            work(value)
+        claimed.append(index)
+
+
+def test_claim_next_is_atomic():
+    pages = ThreadSafePaginator(range(20_000))
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(consume, [pages] * 8))
+    claimed = sorted(index for result in results for index in result)
+    assert claimed == list(range(1, 20_000))
+
+
+def test_next_is_atomic():
+    pages = ThreadSafePaginator(range(100_000), on_end_error=None)
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: [pages.next() for _ in range(1000)], range(8)))
+    assert pages.index == 8000
+
+
+def test_claim_next_ends():
+    assert ThreadSafePaginator(range(3), on_end_error=None, starting_index=2).claim_next() == (0, 0)
+    with pytest.raises(IndexError):
+        ThreadSafePaginator(range(3), on_end_error=True, starting_index=2).claim_next()
+    with pytest.raises(StopIteration):
+        ThreadSafePaginator(range(3), starting_index=2).claim_next()
+
+
+def test_scales_with_io_bound_work():
+    def timed(workers):
+        pages = ThreadSafePaginator(range(201))
+        start = time.perf_counter()
+        with ThreadPoolExecutor(workers) as executor:
+            list(executor.map(consume, [pages] * workers, [lambda value: time.sleep(0.001)] * workers))
+        return time.perf_counter() - start
+
+    assert timed(8) < timed(1) / 3
@@ -0,0 +1,40 @@
+import pytest
+
+from randtools import Paginator, vectorized
+from .test_paginator import outcome
+
+numpy = pytest.importorskip('numpy')
+
+modes = pytest.mark.parametrize('on_end_error', [False, True, None])
+
+
+@modes
+@pytest.mark.parametrize('method', ['next_until_cond', 'prev_until_cond', 'next_while_cond', 'prev_while_cond'])
+@pytest.mark.parametrize('starting_index', [0, 3, 50, 99])
+@pytest.mark.parametrize('divisor', [7, 40, 1000])
+def test_matches_scalar_search(on_end_error, method, starting_index, divisor):
+    objects = numpy.arange(100)
+    scalar = Paginator(objects, starting_index, on_end_error)
+    fast = Paginator(objects, starting_index, on_end_error)
+
+    expected = outcome(scalar, method, lambda value: value % divisor == 5)
+    actual = outcome(fast, method, vectorized(lambda values: values % divisor == 5, chunk_size=8))
+    assert actual == expected
+
+
+def test_does_not_call_per_element():
+    calls = []
+
+    def cond(values):
+        calls.append(len(values))
+        return values == 9_999_000
+
+    pages = Paginator(numpy.arange(10_000_000))
+    assert pages.next_until_cond(vectorized(cond)) == 9_999_000
+    assert len(calls) < 200
+
+
+def test_falls_back_for_other_objects():
+    pages = Paginator(list(range(10)))
+    assert pages.next_until_cond(vectorized(lambda value: value > 4)) == 5
+    assert pages.prev_while_cond(vectorized(lambda value: value > 2)) == 2